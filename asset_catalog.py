@@ -0,0 +1,282 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+import catalog_db
+from catalog_db import BOUNDS_DIR, CATALOG_DB, OUTPUT_DIR, category_from_filename
+
+
+class ModelData:
+    __slots__ = (
+        "uuid",
+        "offset_x", "offset_y", "offset_z",
+        "center_offset_x", "center_offset_y", "center_offset_z",
+        "name", "relative_path", "category",
+    )
+
+    def __init__(self, uuid, size, center_offset, name=None, relative_path=None, category=None):
+        self.uuid: Optional[str] = uuid
+        # Size (dimensions)
+        self.offset_x: float = size[0]
+        self.offset_y: float = size[1]
+        self.offset_z: float = size[2]
+
+        # Center offset (pivot / origin correction)
+        self.center_offset_x: float = center_offset[0]
+        self.center_offset_y: float = center_offset[1]
+        self.center_offset_z: float = center_offset[2]
+
+        self.name: Optional[str] = name
+        self.relative_path: Optional[str] = relative_path
+        # Bounds file the entry comes from, e.g. "buildings" for buildings_objects.json
+        self.category: Optional[str] = category
+
+    def __repr__(self) -> str:
+        return f"ModelData({self.name!r}, uuid={self.uuid!r})"
+
+
+class AssetCatalog:
+    """
+    Every entry of data_unpacked/bounds, loaded once and indexed by name,
+    UUID, category and relative path.
+
+    load_compiled() opens the SQLite catalog built by catalog_db and is the
+    fast path: find_data and find_by_uuid are answered by indexed queries, and
+    the rows are only all read when one of the indexes below is first used.
+    load() parses the bounds JSON directly.
+    """
+
+    def __init__(self) -> None:
+        self._models: list[ModelData] = []
+        self._by_name: dict[str, ModelData] = {}
+        self._by_uuid: dict[str, ModelData] = {}
+        self._by_category: dict[str, list[ModelData]] = {}
+        # Several templates can share the same model file
+        self._by_relative_path: dict[str, list[ModelData]] = {}
+        # Templates of data_unpacked/output, only read from the compiled catalog when first needed
+        self._templates: Optional[dict[str, tuple[str, str]]] = None
+        self._db_path: Optional[str] = None
+
+        # Compiled catalog whose rows are not read yet, and the lookups answered from it so far
+        self._pending_db: Optional[str] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        self._queried: dict[tuple[str, str], Optional[ModelData]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, bounds_dir: str = BOUNDS_DIR) -> "AssetCatalog":
+        catalog = cls()
+
+        for bounds_file in sorted(os.listdir(bounds_dir)):
+            if not bounds_file.lower().endswith(".json"):
+                continue
+
+            bounds_path = os.path.join(bounds_dir, bounds_file)
+
+            try:
+                with open(bounds_path, "r", encoding="utf-8") as f:
+                    bounds_data = json.load(f)
+            except json.JSONDecodeError:
+                print(f"⚠️ Invalid bounds JSON: {bounds_file}")
+                continue
+
+            # Handle both single object and list of objects
+            objects = bounds_data if isinstance(bounds_data, list) else [bounds_data]
+            category = category_from_filename(bounds_file)
+            for obj in objects:
+                catalog.add(obj, category)
+
+        return catalog
+
+    @classmethod
+    def load_compiled(
+        cls,
+        db_path: str = CATALOG_DB,
+        bounds_dir: str = BOUNDS_DIR,
+        output_dir: str = OUTPUT_DIR,
+    ) -> "AssetCatalog":
+        catalog_db.ensure_catalog(db_path, bounds_dir, output_dir)
+        catalog = cls()
+        catalog._db_path = db_path
+        catalog._pending_db = db_path
+        return catalog
+
+    def _read_rows(self) -> None:
+        """Reads every row of the compiled catalog, once, before an index is used"""
+        if self._pending_db is None:
+            return
+
+        with self._lock:
+            if self._pending_db is None:
+                return
+            for name, uuid, relative_path, category, *size_center in catalog_db.read_models(self._pending_db):
+                self._index(ModelData(
+                    uuid,
+                    size_center[0:3],
+                    size_center[3:6],
+                    name=name,
+                    relative_path=relative_path,
+                    category=category,
+                ))
+            self._pending_db = None
+            self._queried.clear()
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _query(self, column: str, value: str) -> Optional[ModelData]:
+        """Entry of a compiled catalog whose rows are not read yet, picked like add_model does"""
+        key = (column, value)
+        with self._lock:
+            if self._pending_db is None:
+                # The rows were read by another thread in the meantime
+                return (self._by_name if column == "name" else self._by_uuid).get(value)
+            if key in self._queried:
+                return self._queried[key]
+
+            if self._connection is None:
+                # Lookups can come from several threads, they are serialized by the lock
+                self._connection = sqlite3.connect(self._pending_db, check_same_thread=False)
+            # By name the first entry with an UUID wins, by UUID the first entry
+            order = "uuid IS NULL, id" if column == "name" else "id"
+            row = self._connection.execute(
+                "SELECT name, uuid, relative_path, category, size_x, size_y, size_z, center_x, center_y, center_z "
+                f"FROM models WHERE {column} = ? ORDER BY {order} LIMIT 1",
+                (value,),
+            ).fetchone()
+
+            model_data = None
+            if row is not None:
+                name, uuid, relative_path, category, *size_center = row
+                model_data = ModelData(
+                    uuid,
+                    size_center[0:3],
+                    size_center[3:6],
+                    name=name,
+                    relative_path=relative_path,
+                    category=category,
+                )
+            self._queried[key] = model_data
+            return model_data
+
+    @property
+    def models(self) -> list[ModelData]:
+        self._read_rows()
+        return self._models
+
+    @property
+    def by_name(self) -> dict[str, ModelData]:
+        self._read_rows()
+        return self._by_name
+
+    @property
+    def by_uuid(self) -> dict[str, ModelData]:
+        self._read_rows()
+        return self._by_uuid
+
+    @property
+    def by_category(self) -> dict[str, list[ModelData]]:
+        self._read_rows()
+        return self._by_category
+
+    @property
+    def by_relative_path(self) -> dict[str, list[ModelData]]:
+        self._read_rows()
+        return self._by_relative_path
+
+    def add(self, obj: dict, category: Optional[str] = None) -> Optional[ModelData]:
+        if "name" not in obj or "size" not in obj or "center_offset" not in obj:
+            return None
+
+        model_data = ModelData(
+            obj.get("uuid"),
+            obj["size"],
+            obj["center_offset"],
+            name=obj["name"],
+            relative_path=obj.get("relative_path"),
+            category=category,
+        )
+        return self.add_model(model_data)
+
+    def add_model(self, model_data: ModelData) -> ModelData:
+        self._read_rows()
+        return self._index(model_data)
+
+    def _index(self, model_data: ModelData) -> ModelData:
+        self._models.append(model_data)
+
+        # The first entry with an UUID wins, same as the old linear scan
+        existing = self._by_name.get(model_data.name)
+        if existing is None or (existing.uuid is None and model_data.uuid is not None):
+            self._by_name[model_data.name] = model_data
+
+        if model_data.uuid is not None:
+            self._by_uuid.setdefault(model_data.uuid, model_data)
+        if model_data.category is not None:
+            self._by_category.setdefault(model_data.category, []).append(model_data)
+        if model_data.relative_path is not None:
+            self._by_relative_path.setdefault(model_data.relative_path, []).append(model_data)
+
+        return model_data
+
+    def find_data(self, name_search: str) -> Optional[ModelData]:
+        if self._pending_db is not None:
+            model_data = self._query("name", name_search)
+        else:
+            model_data = self._by_name.get(name_search)
+        if model_data is None:
+            return None
+
+        if model_data.uuid is None:
+            print("Failed to find UUID, but did find the object ", name_search)
+            return None
+
+        return model_data
+
+    def find_by_uuid(self, uuid: str) -> Optional[ModelData]:
+        if self._pending_db is not None:
+            return self._query("uuid", uuid)
+        return self._by_uuid.get(uuid)
+
+    def find_by_relative_path(self, relative_path: str) -> list[ModelData]:
+        return self.by_relative_path.get(relative_path, [])
+
+    @property
+    def templates(self) -> dict[str, tuple[str, str]]:
+        """Every template of data_unpacked/output: name -> (uuid, type)"""
+        if self._templates is None:
+            self._templates = {}
+            if self._db_path is not None:
+                for name, uuid, type_object in catalog_db.read_templates(self._db_path):
+                    self._templates.setdefault(name, (uuid, type_object))
+        return self._templates
+
+    def find_template(self, name: str) -> Optional[tuple[str, str]]:
+        """(uuid, type) of any template, including the ones without bounds"""
+        return self.templates.get(name)
+
+    def category(self, category: str) -> list[ModelData]:
+        return self.by_category.get(category, [])
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def __contains__(self, name: str) -> bool:
+        if self._pending_db is not None:
+            return self._query("name", name) is not None
+        return name in self._by_name
+
+
+_default_catalog: Optional[AssetCatalog] = None
+_default_catalog_lock = threading.Lock()
+
+def default_catalog() -> AssetCatalog:
+    """Catalog of the data shipped with the repo, loaded on first use"""
+    global _default_catalog
+
+    with _default_catalog_lock:
+        if _default_catalog is None:
+            _default_catalog = AssetCatalog.load_compiled()
+        return _default_catalog
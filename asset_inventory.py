@@ -0,0 +1,210 @@
+"""
+Inventory of the unpacked model files, indexed by case-insensitive stem.
+
+The model tree is walked once, one thread per top-level asset folder, and
+the index is saved to data_unpacked/asset_inventory.json so reconciling
+.dae exports, .GR2 models and bounds entries is a handful of dict lookups.
+The saved index keeps the modification time of every folder of the tree and
+is scanned again as soon as a file was added, removed or renamed in one.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+INVENTORY_PATH = os.path.join(SCRIPT_DIR, "data_unpacked/asset_inventory.json")
+FILE_LIST_PATH = os.path.join(SCRIPT_DIR, "file_list.txt")
+
+MODELS_ROOT = r"c:\Users\andre\Downloads\bg3-modders-multitool\UnpackedData\Models\Generated\Public\Shared\Assets"
+
+# Every .dae export comes from the .GR2 model with the same stem
+EXTENSION_MAP = {
+    ".dae": ".gr2",
+}
+
+
+def stem_key(filename: str) -> str:
+    return os.path.splitext(os.path.basename(filename))[0].lower()
+
+
+def _walk_folder(root: str, folder: str) -> tuple[list[str], dict[str, int]]:
+    """Relative paths of the files under folder, and the mtime of every folder walked"""
+    relative_paths = []
+    folders = {}
+    for current, _, files in os.walk(os.path.join(root, folder)):
+        relative_folder = os.path.relpath(current, root).replace("\\", "/")
+        folders[relative_folder] = os.stat(current).st_mtime_ns
+        for file in files:
+            relative_paths.append(f"{relative_folder}/{file}")
+    return relative_paths, folders
+
+
+def _top_folders(root: str) -> list[str]:
+    return [entry.name for entry in os.scandir(root) if entry.is_dir()]
+
+
+def _folder_mtimes(root: str, folder: str) -> dict[str, int]:
+    folders = {}
+    stack = [os.path.join(root, folder)]
+    while stack:
+        current = stack.pop()
+        relative_folder = os.path.relpath(current, root).replace("\\", "/")
+        folders[relative_folder] = os.stat(current).st_mtime_ns
+        with os.scandir(current) as entries:
+            stack.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+    return folders
+
+
+def folder_signature(root: str, workers: Optional[int] = None) -> dict[str, int]:
+    """
+    {relative folder: mtime_ns} of every folder of the tree, root included.
+    Adding, removing or renaming a file changes the mtime of its folder
+    """
+    folders = _top_folders(root)
+    signature = {".": os.stat(root).st_mtime_ns}
+    with ThreadPoolExecutor(max_workers=workers or max(1, len(folders))) as pool:
+        for walked in pool.map(lambda folder: _folder_mtimes(root, folder), folders):
+            signature.update(walked)
+    return signature
+
+
+class AssetInventory:
+    def __init__(self, root: str, files: Iterable[str] = ()) -> None:
+        self.root: str = root
+        # stem (lower case) -> {extension (lower case): relative path}
+        self.index: dict[str, dict[str, str]] = {}
+        # Folder mtimes of the tree when it was scanned, see folder_signature
+        self.folders: dict[str, int] = {}
+        for relative_path in files:
+            self.add(relative_path)
+
+    def add(self, relative_path: str) -> None:
+        extension = os.path.splitext(relative_path)[1].lower()
+        self.index.setdefault(stem_key(relative_path), {}).setdefault(extension, relative_path)
+
+    @classmethod
+    def scan(cls, root: str = MODELS_ROOT, workers: Optional[int] = None) -> "AssetInventory":
+        folders = _top_folders(root)
+        root_mtime = os.stat(root).st_mtime_ns
+        with ThreadPoolExecutor(max_workers=workers or max(1, len(folders))) as pool:
+            walked = list(pool.map(lambda folder: _walk_folder(root, folder), folders))
+
+        inventory = cls(root, (relative_path for folder_files, _ in walked for relative_path in folder_files))
+        inventory.folders = {".": root_mtime}
+        for _, folder_mtimes in walked:
+            inventory.folders.update(folder_mtimes)
+        return inventory
+
+    @classmethod
+    def load(cls, path: str = INVENTORY_PATH) -> "AssetInventory":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        inventory = cls(data["root"])
+        inventory.index = data["index"]
+        inventory.folders = data.get("folders", {})
+        return inventory
+
+    def is_fresh(self, root: Optional[str] = None) -> bool:
+        """True when no folder of the tree changed since the scan, or when the tree is not there to check"""
+        root = root or self.root
+        if not os.path.isdir(root):
+            # e.g. the index copied to a machine without the unpacked models
+            return True
+        return os.path.normcase(os.path.abspath(root)) == os.path.normcase(os.path.abspath(self.root)) \
+            and self.folders == folder_signature(root)
+
+    @classmethod
+    def load_or_scan(cls, path: str = INVENTORY_PATH, root: str = MODELS_ROOT, refresh: bool = False) -> "AssetInventory":
+        """Saved index when the model tree did not change since, a new scan otherwise"""
+        if not refresh and os.path.exists(path):
+            try:
+                inventory = cls.load(path)
+            except (json.JSONDecodeError, KeyError):
+                inventory = None
+            if inventory is not None and inventory.is_fresh(root):
+                return inventory
+
+        inventory = cls.scan(root)
+        inventory.save(path)
+        return inventory
+
+    def save(self, path: str = INVENTORY_PATH) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"root": self.root, "folders": self.folders, "index": self.index}, f, ensure_ascii=False)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def find(self, filename: str, extension: Optional[str] = None) -> Optional[str]:
+        """
+        Relative path of the file with the same stem, regardless of case
+
+        Args:
+            filename: Name or path, e.g. "BLD_Village_Wall_Support_B.dae"
+            extension: Extension to look for, by default the one mapped from the
+                extension of filename (.dae -> .gr2) or its own
+        """
+        entries = self.index.get(stem_key(filename))
+        if not entries:
+            return None
+
+        if extension is None:
+            own_extension = os.path.splitext(filename)[1].lower()
+            extension = EXTENSION_MAP.get(own_extension, own_extension)
+        return entries.get(extension.lower())
+
+    def missing(self, filenames: Iterable[str], extension: Optional[str] = None) -> list[str]:
+        return [filename for filename in filenames if self.find(filename, extension) is None]
+
+    def reconcile(self, dae_names: Iterable[str], bounds_paths: Iterable[str]) -> dict[str, list[str]]:
+        """
+        Args:
+            dae_names: Exported .dae file names (e.g. the lines of file_list.txt)
+            bounds_paths: relative_path of the bounds entries
+
+        Returns:
+            dae_without_gr2: exports whose model was not found
+            bounds_without_gr2: bounds entries whose model was not found
+            gr2_without_bounds: models that have no bounds entry yet
+        """
+        dae_names = list(dae_names)
+        bounds_stems = {stem_key(path) for path in bounds_paths}
+
+        return {
+            "dae_without_gr2": self.missing(dae_names),
+            "bounds_without_gr2": sorted(stem for stem in bounds_stems if ".gr2" not in self.index.get(stem, {})),
+            "gr2_without_bounds": sorted(
+                entries[".gr2"] for stem, entries in self.index.items()
+                if ".gr2" in entries and stem not in bounds_stems
+            ),
+        }
+
+
+def read_file_list(path: str = FILE_LIST_PATH) -> list[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main() -> None:
+    from asset_catalog import default_catalog
+
+    inventory = AssetInventory.load_or_scan()
+    catalog = default_catalog()
+    report = inventory.reconcile(
+        read_file_list(),
+        (model.relative_path for model in catalog.models if model.relative_path),
+    )
+
+    for filename in report["dae_without_gr2"]:
+        print("not Found ", filename)
+    print(
+        f"\n{len(inventory)} models indexed: {len(report['dae_without_gr2'])} exports without model, "
+        f"{len(report['bounds_without_gr2'])} bounds without model, "
+        f"{len(report['gr2_without_bounds'])} models without bounds"
+    )
+
+
+if __name__ == "__main__":
+    main()
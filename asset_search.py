@@ -0,0 +1,131 @@
+"""
+Name search over the asset catalog: prefix, token and typo tolerant queries.
+
+Names are kept sorted for prefix queries (bisect), and two inverted indexes
+map every "_" separated token and every character trigram to the names that
+contain it.
+"""
+
+import bisect
+import difflib
+from collections import Counter
+from typing import Container, Iterable, Optional
+
+
+def tokenize(name: str) -> list[str]:
+    return [token for token in name.lower().split("_") if token]
+
+def trigrams(text: str) -> set[str]:
+    padded = f"  {text.lower()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def infer_parent(name: str, names: Container[str], max_removed_tokens: int = 10) -> Optional[str]:
+    """
+    Longest name of names that is a "_" prefix of name, e.g.
+    WALL_City_Lower_A_Broken -> WALL_City_Lower_A
+    """
+    parts = name.split("_")
+    for cut in range(len(parts) - 1, max(0, len(parts) - 1 - max_removed_tokens), -1):
+        candidate = "_".join(parts[:cut])
+        if candidate in names:
+            return candidate
+    return None
+
+
+class NameIndex:
+    def __init__(self, names: Iterable[str]) -> None:
+        unique_names = set(names)
+        self.names: list[str] = sorted(unique_names)
+        # Case-insensitive prefix search goes through a second sorted list
+        self._lower_names: list[tuple[str, str]] = sorted((name.lower(), name) for name in unique_names)
+        self._exact: set[str] = unique_names
+
+        self._tokens: dict[str, set[str]] = {}
+        self._trigrams: dict[str, list[str]] = {}
+        for name in self.names:
+            for token in tokenize(name):
+                self._tokens.setdefault(token, set()).add(name)
+            for gram in trigrams(name):
+                self._trigrams.setdefault(gram, []).append(name)
+
+    @classmethod
+    def from_catalog(cls, catalog, include_templates: bool = False) -> "NameIndex":
+        names = list(catalog.by_name)
+        if include_templates:
+            names.extend(catalog.templates)
+        return cls(names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._exact
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> list[str]:
+        """Names starting with prefix (case-insensitive), a trailing * is ignored"""
+        key = prefix.rstrip("*").lower()
+        start = bisect.bisect_left(self._lower_names, (key, ""))
+
+        results = []
+        for lower_name, name in self._lower_names[start:]:
+            if not lower_name.startswith(key):
+                break
+            results.append(name)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def tokens(self, *tokens: str, limit: Optional[int] = None) -> list[str]:
+        """Names containing every token, in any order (e.g. "wall", "city")"""
+        wanted = [token.lower() for token in tokens]
+        if not wanted:
+            return []
+
+        sets = sorted((self._tokens.get(token, set()) for token in wanted), key=len)
+        results = set.intersection(*sets)
+        return sorted(results)[:limit]
+
+    def fuzzy(self, query: str, limit: int = 10, cutoff: float = 0.6) -> list[tuple[str, float]]:
+        """
+        Closest names to query, tolerating typos
+
+        Candidates share the most trigrams with the query and are then ranked
+        by difflib similarity.
+
+        Returns:
+            List of (name, score) with score between cutoff and 1
+        """
+        query_grams = trigrams(query)
+        shared: Counter = Counter()
+        for gram in query_grams:
+            shared.update(self._trigrams.get(gram, ()))
+
+        # Only the best trigram matches are worth the more expensive comparison
+        candidates = [name for name, _ in shared.most_common(max(limit * 20, 200))]
+
+        lowered_query = query.lower()
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(lowered_query)
+
+        scored = []
+        for name in candidates:
+            matcher.set_seq1(name.lower())
+            if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+                continue
+            score = matcher.ratio()
+            if score >= cutoff:
+                scored.append((name, score))
+
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+
+    def search(self, query: str, limit: int = 10) -> list[str]:
+        """Prefix query when the query ends with *, exact/fuzzy match otherwise"""
+        if query.endswith("*"):
+            return self.prefix(query, limit)
+        if query in self._exact:
+            return [query]
+        return [name for name, _ in self.fuzzy(query, limit)]
+
+    def infer_parent(self, name: str, max_removed_tokens: int = 10) -> Optional[str]:
+        return infer_parent(name, self._exact, max_removed_tokens)
@@ -0,0 +1,219 @@
+"""
+Spatial index over the bounding box sizes of the asset catalog.
+
+Sizes are stored as columnar NumPy arrays and bucketed in a uniform grid in
+log2 space, so a cell covers the same relative size range whether the asset
+is a cup or a castle. Queries only look at the occupied cells that can
+contain a match. Aspect ratios are differences of log sizes, and name
+prefixes are ranges of the sorted names, so both filter the candidates as
+NumPy masks.
+"""
+
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from asset_catalog import AssetCatalog, ModelData
+
+# Sizes are clamped before going to log space, some helpers have a zero axis
+MIN_SIZE = 1e-3
+
+Range = Union[None, float, tuple[Optional[float], Optional[float]]]
+
+
+def _to_log(values: npt.ArrayLike) -> np.ndarray:
+    return np.log2(np.maximum(np.asarray(values, dtype=np.float64), MIN_SIZE))
+
+def _log_range(value: Range, tolerance: float) -> tuple[float, float]:
+    """(low, high) in log2 space of a query range, infinite when an end is open"""
+    if value is None:
+        return -np.inf, np.inf
+    if isinstance(value, tuple):
+        minimum, maximum = value
+    else:
+        minimum, maximum = value * (1 - tolerance), value * (1 + tolerance)
+    low = float(_to_log(minimum)) if minimum is not None else -np.inf
+    high = float(_to_log(maximum)) if maximum is not None else np.inf
+    return low, high
+
+
+class SizeIndex:
+    """
+    Axis names follow the bounds: width is X, height is Y and depth is Z
+    """
+
+    def __init__(self, models: Sequence[ModelData], cell_size: float = 0.5) -> None:
+        """
+        Args:
+            models: Entries to index
+            cell_size: Grid cell size in log2 units (0.5 = a factor of ~1.41 per cell)
+        """
+        self.models: list[ModelData] = list(models)
+        self.cell_size: float = cell_size
+
+        self.sizes: npt.NDArray[np.float64] = np.array(
+            [(m.offset_x, m.offset_y, m.offset_z) for m in self.models], dtype=np.float64
+        ).reshape(-1, 3)
+        self.center_offsets: npt.NDArray[np.float64] = np.array(
+            [(m.center_offset_x, m.center_offset_y, m.center_offset_z) for m in self.models], dtype=np.float64
+        ).reshape(-1, 3)
+        self.log_sizes: npt.NDArray[np.float64] = _to_log(self.sizes)
+
+        cells = np.floor(self.log_sizes / cell_size).astype(np.int64)
+        # Group the entries by cell: unique occupied cells + the entries of each one
+        self.cells, inverse = np.unique(cells, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        order = np.argsort(inverse, kind="stable")
+        boundaries = np.searchsorted(inverse[order], np.arange(len(self.cells) + 1))
+        self._cell_members: list[npt.NDArray[np.int64]] = [
+            order[boundaries[i]:boundaries[i + 1]] for i in range(len(self.cells))
+        ]
+        self._cell_min: npt.NDArray[np.float64] = self.cells * cell_size
+        self._cell_max: npt.NDArray[np.float64] = self._cell_min + cell_size
+
+        # Names sorted once, the entries of a prefix are one searchsorted range
+        self._name_order: npt.NDArray[np.int64] = np.argsort(np.array([m.name or "" for m in self.models], dtype=str), kind="stable")
+        self._sorted_names: npt.NDArray[np.str_] = np.array([self.models[i].name or "" for i in self._name_order], dtype=str)
+        self._prefix_masks: dict[str, npt.NDArray[np.bool_]] = {}
+
+    @classmethod
+    def from_catalog(
+        cls,
+        catalog: AssetCatalog,
+        prefix: Optional[str] = None,
+        category: Optional[str] = None,
+        with_uuid: bool = True,
+        cell_size: float = 0.5,
+    ) -> "SizeIndex":
+        models = catalog.category(category) if category is not None else catalog.by_name.values()
+        selected = [
+            m for m in models
+            if (prefix is None or m.name.startswith(prefix)) and (not with_uuid or m.uuid is not None)
+        ]
+        return cls(selected, cell_size)
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def prefix_mask(self, prefix: str) -> npt.NDArray[np.bool_]:
+        """(N,) True for the entries whose name starts with prefix, kept for the next queries"""
+        mask = self._prefix_masks.get(prefix)
+        if mask is None:
+            start = np.searchsorted(self._sorted_names, prefix, side="left")
+            end = np.searchsorted(self._sorted_names, prefix + chr(0x10FFFF), side="left")
+            mask = np.zeros(len(self.models), dtype=bool)
+            mask[self._name_order[start:end]] = True
+            self._prefix_masks[prefix] = mask
+        return mask
+
+    def _candidates(self, low: np.ndarray, high: np.ndarray) -> npt.NDArray[np.int64]:
+        """Entries of every occupied cell overlapping the [low, high] box (log space)"""
+        overlapping = np.all((self._cell_max >= low) & (self._cell_min <= high), axis=1)
+        members = [self._cell_members[i] for i in np.flatnonzero(overlapping)]
+        if not members:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(members)
+
+    def query(
+        self,
+        width: Range = None,
+        height: Range = None,
+        depth: Range = None,
+        tolerance: float = 0.1,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        aspect: Range = None,
+        aspect_axes: tuple[int, int] = (0, 1),
+    ) -> list[tuple[ModelData, float]]:
+        """
+        Entries whose size fits every given range, best matches first
+
+        Each axis is either None (anything), a number (matched within
+        ±tolerance, relative) or a (min, max) tuple where both ends are optional.
+        e.g. query(width=4, height=(3, 5), prefix="WALL_")
+
+        Args:
+            aspect: Range of the ratio between the two aspect_axes, same forms as an axis,
+                e.g. aspect=(2, None) for entries at least twice as wide as high
+            aspect_axes: Axes of the ratio, (0, 1) is width / height, (0, 2) width / depth
+
+        Returns:
+            List of (model, score), the score is the log2 distance to the middle of the ranges
+        """
+        low = np.full(3, -np.inf)
+        high = np.full(3, np.inf)
+        for axis, value in enumerate((width, height, depth)):
+            low[axis], high[axis] = _log_range(value, tolerance)
+
+        candidates = self._candidates(low, high)
+        log_sizes = self.log_sizes[candidates]
+        inside = np.all((log_sizes >= low) & (log_sizes <= high), axis=1)
+
+        # A ratio is a difference in log space
+        aspect_low, aspect_high = _log_range(aspect, tolerance)
+        log_aspect = log_sizes[:, aspect_axes[0]] - log_sizes[:, aspect_axes[1]]
+        inside &= (log_aspect >= aspect_low) & (log_aspect <= aspect_high)
+
+        if prefix is not None:
+            inside &= self.prefix_mask(prefix)[candidates]
+        candidates = candidates[inside]
+        if len(candidates) == 0:
+            return []
+
+        # Rank by distance to the middle of the bounded ranges
+        bounded = np.isfinite(low) & np.isfinite(high)
+        target = (np.where(bounded, low, 0.0) + np.where(bounded, high, 0.0)) * 0.5
+        squared = (((self.log_sizes[candidates] - target) * bounded) ** 2).sum(axis=1)
+        if np.isfinite(aspect_low) and np.isfinite(aspect_high):
+            squared += (log_aspect[inside] - (aspect_low + aspect_high) * 0.5) ** 2
+        scores = np.sqrt(squared)
+
+        ranking = np.argsort(scores, kind="stable")[:limit]
+        return [(self.models[candidates[i]], float(scores[i])) for i in ranking]
+
+    def nearest(
+        self,
+        size: Sequence[float],
+        k: int = 5,
+        prefix: Optional[str] = None,
+        exclude: Optional[str] = None,
+    ) -> list[tuple[ModelData, float]]:
+        """
+        k entries with the closest size (relative difference on every axis)
+
+        Returns:
+            List of (model, distance) with the distance measured in log2 units
+        """
+        target = _to_log(size)
+
+        # Lower bound of the distance from the target to every occupied cell
+        gap = np.maximum(np.maximum(self._cell_min - target, target - self._cell_max), 0.0)
+        cell_distance = np.sqrt((gap ** 2).sum(axis=1))
+        cell_order = np.argsort(cell_distance, kind="stable")
+
+        allowed = self.prefix_mask(prefix) if prefix is not None else None
+        best: list[tuple[float, int]] = []
+        for cell in cell_order:
+            if len(best) >= k and cell_distance[cell] > best[-1][0]:
+                break
+
+            members = self._cell_members[cell]
+            if allowed is not None:
+                members = members[allowed[members]]
+            distances = np.sqrt(((self.log_sizes[members] - target) ** 2).sum(axis=1))
+            for index, distance in zip(members.tolist(), distances.tolist()):
+                if exclude is not None and self.models[index].name == exclude:
+                    continue
+                best.append((distance, index))
+
+            best.sort()
+            del best[k:]
+
+        return [(self.models[index], distance) for distance, index in best]
+
+    def substitute(self, model_data: ModelData, k: int = 5, same_prefix: bool = True) -> list[tuple[ModelData, float]]:
+        """Closest-sized replacements for an asset, from the same family (first "_" token) by default"""
+        prefix = model_data.name.split("_")[0] + "_" if same_prefix and model_data.name else None
+        size = (model_data.offset_x, model_data.offset_y, model_data.offset_z)
+        return self.nearest(size, k=k, prefix=prefix, exclude=model_data.name)
@@ -0,0 +1,60 @@
+"""Asset lookups by name on a synthetic bounds catalog"""
+
+import random
+
+from harness import benchmark
+
+MODELS = 20000
+LOOKUPS = 10000
+
+
+def _synthetic_catalog(fixtures):
+    from asset_catalog import AssetCatalog
+
+    folder, names = fixtures.bounds_folder(MODELS)
+    return AssetCatalog.load(folder), names
+
+
+@benchmark(number=1, repeat=3)
+def catalog_load(fixtures):
+    from asset_catalog import AssetCatalog
+
+    folder, _ = fixtures.bounds_folder(MODELS)
+    return lambda: AssetCatalog.load(folder)
+
+
+@benchmark(number=1)
+def find_data(fixtures):
+    import asset_catalog
+    import name_to_uuid
+
+    catalog, names = _synthetic_catalog(fixtures)
+    rng = random.Random(fixtures.seed)
+    queries = [rng.choice(names) if rng.random() < 0.8 else f"MISSING_{i}" for i in range(LOOKUPS)]
+
+    def run():
+        # name_to_uuid.find_data goes through the default catalog, put back whatever was there after the run
+        previous = asset_catalog._default_catalog
+        asset_catalog._default_catalog = catalog
+        try:
+            for query in queries:
+                name_to_uuid.find_data(query)
+        finally:
+            asset_catalog._default_catalog = previous
+    return run
+
+
+@benchmark(number=10)
+def compiled_startup(fixtures):
+    """Opening an up to date compiled catalog and a first lookup, what a script pays at startup"""
+    import catalog_db
+    from asset_catalog import AssetCatalog
+
+    folder, names = fixtures.bounds_folder(MODELS)
+    db_path = fixtures.path(f"catalog_{MODELS}.sqlite")
+    templates = fixtures.path("no_templates")
+    catalog_db.ensure_catalog(db_path, folder, templates)
+
+    def run():
+        AssetCatalog.load_compiled(db_path, folder, templates).find_data(names[0])
+    return run
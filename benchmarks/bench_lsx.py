@@ -0,0 +1,68 @@
+"""GameObjects .lsx emission and unique name allocation"""
+
+import random
+
+from harness import benchmark
+
+OBJECTS = 200
+NAMES = 5000
+
+
+@benchmark(number=1)
+def create_object_xml(fixtures):
+    import create_lsx
+    from pyrr import Quaternion, Vector3
+
+    position = Vector3([10.0, 0.0, 20.0])
+    rotation = Quaternion.from_y_rotation(0.5)
+
+    def run():
+        names = create_lsx.NameAllocator()
+        for _ in range(OBJECTS):
+            create_lsx.create_object_xml(
+                create_lsx.XML_TEMPLATE,
+                name="WALL_City_Lower_A",
+                level_name="procedural2",
+                uuid="17c5529a-a991-415d-9478-52c29dfbaf06",
+                position=position,
+                rotation=rotation,
+                scale=1.0,
+                names=names,
+            )
+    return run
+
+
+@benchmark(number=1)
+def game_object_node(fixtures):
+    import create_lsx
+    from pyrr import Quaternion, Vector3
+
+    position = Vector3([10.0, 0.0, 20.0])
+    rotation = Quaternion.from_y_rotation(0.5)
+
+    def run():
+        for i in range(OBJECTS):
+            create_lsx.game_object_node(
+                create_lsx.generate_uuid(),
+                f"WALL_City_Lower_A_{i:03d}",
+                "17c5529a-a991-415d-9478-52c29dfbaf06",
+                position,
+                rotation,
+            )
+    return run
+
+
+@benchmark(number=1)
+def allocate_object_name(fixtures):
+    import create_lsx
+
+    # Few base names, so most allocations have to find a free suffix; the
+    # allocator of a GenerationContext resumes every base from its next suffix
+    rng = random.Random(fixtures.seed)
+    bases = [f"WALL_City_Lower_{rng.choice('ABCDEFGH')}" for _ in range(NAMES)]
+
+    def run():
+        names = create_lsx.NameAllocator()
+        for base in bases:
+            names.allocate(base)
+    return run
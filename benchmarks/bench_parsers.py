@@ -0,0 +1,21 @@
+"""GameObjects dump extraction and Dungeon Scrawl parsing"""
+
+from harness import benchmark
+
+GAME_OBJECTS = 20000
+
+
+@benchmark(number=1, repeat=3)
+def extract_game_objects(fixtures):
+    from parsers import parser_data_unpacked
+
+    path = fixtures.game_objects_file(GAME_OBJECTS)
+    return lambda: parser_data_unpacked.extract_file(path)
+
+
+@benchmark(number=1, repeat=3)
+def get_points_dungeon(fixtures):
+    from parsers import extract_points_dungeon
+
+    path = fixtures.dungeon_file(rooms=400, images=2000)
+    return lambda: extract_points_dungeon.get_points_dungeon(path)
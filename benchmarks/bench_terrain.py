@@ -0,0 +1,54 @@
+"""Terrain patch reading, writing, shape fills and stitching"""
+
+from harness import benchmark
+
+
+@benchmark(number=5)
+def patch_read(fixtures):
+    from terrain_patch_reader import TerrainPatchReader
+
+    path = fixtures.patch_file()
+    return lambda: TerrainPatchReader(path).read()
+
+
+@benchmark(number=5)
+def patch_write(fixtures):
+    from terrain_patch_writer import TerrainPatchWriter
+    import fixtures as synthetic
+
+    writer = TerrainPatchWriter()
+    writer.grid = synthetic.terrain_grid(seed=fixtures.seed)
+    path = fixtures.path("write.patch")
+    return lambda: writer.write(path)
+
+
+@benchmark(number=5)
+def fill_rectangle(fixtures):
+    from terrain_patch_writer import TerrainPatchWriter
+
+    writer = TerrainPatchWriter()
+    return lambda: writer.fill_rectangle(8, 8, 40, 30, 2.0, blend_distance=6)
+
+
+@benchmark(number=5)
+def fill_circle(fixtures):
+    from terrain_patch_writer import TerrainPatchWriter
+
+    writer = TerrainPatchWriter()
+    return lambda: writer.fill_circle(32, 32, 20, 2.0, blend_distance=6)
+
+
+@benchmark(number=5)
+def fill_oval(fixtures):
+    from terrain_patch_writer import TerrainPatchWriter
+
+    writer = TerrainPatchWriter()
+    return lambda: writer.fill_oval(32, 32, 24, 14, 2.0, blend_distance=6)
+
+
+@benchmark(number=1, repeat=3)
+def stitch_8x8(fixtures):
+    from terrain_stitcher import TerrainStitcher
+
+    stitcher = TerrainStitcher(fixtures.terrain_folder(8, 8))
+    return stitcher.stitch
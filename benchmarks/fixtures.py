@@ -0,0 +1,220 @@
+"""
+Synthetic inputs for the benchmarks and the scaling harness.
+
+Everything is generated from a seed into a scratch folder: terrain .patch
+tiles, GameObjects .lsx dumps, Dungeon Scrawl .ds documents and bounds
+catalogs, with the same layout as the real files so no game install is
+needed.
+"""
+
+import json
+import os
+import random
+import sys
+import uuid
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TERRAIN_DIR = os.path.join(ROOT_DIR, "terrain")
+for path in (ROOT_DIR, TERRAIN_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# Tokens the synthetic asset names are made of, same shape as the real ones
+NAME_PREFIXES = ["WALL", "BLD", "PLA", "FX", "DEC", "CONT"]
+NAME_FAMILIES = ["City", "Village", "Castlewall", "Underdark", "Forest", "Crypt", "Harbour"]
+NAME_PARTS = ["Lower", "Upper", "Support", "Foundation", "Piece", "Corner", "Door", "Arch", "Tower", "Floor"]
+BOUNDS_CATEGORIES = ["buildings", "props", "walls", "decorations"]
+
+
+def uuid_from(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def asset_name(rng: random.Random, index: int) -> str:
+    parts = rng.sample(NAME_PARTS, rng.randint(1, 3))
+    return "_".join([rng.choice(NAME_PREFIXES), rng.choice(NAME_FAMILIES), *parts, f"{index:05d}"])
+
+
+def write_patch(path: str, grid) -> str:
+    """A .patch tile with the header TerrainPatchWriter writes"""
+    from terrain_patch_writer import TerrainPatchWriter
+
+    grid = np.asarray(grid, dtype=np.float32)
+    writer = TerrainPatchWriter(grid.shape[1], grid.shape[0])
+    writer.grid = grid
+    writer.write(path)
+    return path
+
+
+def terrain_grid(size: int = 65, seed: int = 0) -> np.ndarray:
+    """Smooth hills, so fills and stitching see realistic values"""
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0.0, 2.0 * np.pi, size)
+    phase = rng.uniform(0.0, 2.0 * np.pi, 2)
+    return (np.sin(x + phase[0])[np.newaxis, :] * np.cos(x + phase[1])[:, np.newaxis] * 5.0).astype(np.float32)
+
+
+def write_terrain_folder(folder: str, tiles_x: int, tiles_z: int, size: int = 65, seed: int = 0) -> str:
+    """Terrains folder of tiles_x * tiles_z patches named like the game ones (<x>_<z>.patch)"""
+    os.makedirs(folder, exist_ok=True)
+    for x in range(tiles_x):
+        for z in range(tiles_z):
+            write_patch(os.path.join(folder, f"Patch_{x}_{z}.patch"), terrain_grid(size, seed + x * tiles_z + z))
+    return folder
+
+
+def write_game_objects(path: str, count: int, seed: int = 0) -> str:
+    """A .lsx dump of `count` GameObjects, as parser_data_unpacked reads them"""
+    import create_lsx
+    from pyrr import Quaternion, Vector3
+
+    rng = random.Random(seed)
+    nodes = [
+        create_lsx.game_object_node(
+            uuid_from(rng),
+            asset_name(rng, i),
+            uuid_from(rng),
+            Vector3([rng.uniform(0, 500), 0.0, rng.uniform(0, 500)]),
+            Quaternion.from_y_rotation(rng.uniform(0, 6.28)),
+        )
+        for i in range(count)
+    ]
+    return create_lsx.write_objects_file(path, nodes)
+
+
+def _room(rng: random.Random, x: float, y: float, width: float, height: float, step: float) -> list[list[float]]:
+    """Closed rectangle outline with a vertex every `step`, jittered like the Dungeon Scrawl exports"""
+    corners = [(x, y), (x + width, y), (x + width, y + height), (x, y + height), (x, y)]
+    ring = []
+    for (ax, ay), (bx, by) in zip(corners[:-1], corners[1:]):
+        count = max(1, int(max(abs(bx - ax), abs(by - ay)) / step))
+        for i in range(count):
+            t = i / count
+            ring.append([ax + (bx - ax) * t + rng.uniform(-0.3, 0.3), ay + (by - ay) * t + rng.uniform(-0.3, 0.3)])
+    ring.append(list(ring[0]))
+    return ring
+
+
+def dungeon_document(rooms: int, images: int = 0, vertex_step: float = 20.0, seed: int = 0) -> dict:
+    """
+    Dungeon Scrawl document with `rooms` rectangular rooms on a grid and
+    `images` placed assets, in Dungeon Scrawl units (see extract_points_dungeon.SCALE)
+    """
+    rng = random.Random(seed)
+    columns = max(1, int(rooms ** 0.5))
+    polygons = []
+    for index in range(rooms):
+        x = (index % columns) * 1200.0
+        y = (index // columns) * 1200.0
+        polygons.append([_room(rng, x, y, rng.uniform(400, 1000), rng.uniform(400, 1000), vertex_step)])
+
+    assets = [
+        {"id": uuid_from(rng), "name": asset_name(rng, i), "dimensions": {"width": 100, "height": 100}}
+        for i in range(max(1, images // 50))
+    ]
+    placed = []
+    for i in range(images):
+        angle = rng.uniform(0, 6.28)
+        scale = rng.uniform(0.5, 2.0)
+        placed.append({
+            "name": f"image_{i}",
+            "assetId": rng.choice(assets)["id"],
+            "transform": [
+                np.cos(angle) * scale, np.sin(angle) * scale,
+                -np.sin(angle) * scale, np.cos(angle) * scale,
+                rng.uniform(0, columns * 1200.0), rng.uniform(0, columns * 1200.0),
+            ],
+        })
+
+    return {
+        "version": 1,
+        "state": {
+            "document": {
+                "nodes": {
+                    "geometry": {"polygons": polygons, "polylines": []},
+                    "assets": assets,
+                    "images": placed,
+                },
+            },
+        },
+    }
+
+
+def write_dungeon(path: str, rooms: int, images: int = 0, vertex_step: float = 20.0, seed: int = 0) -> str:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dungeon_document(rooms, images, vertex_step, seed), f)
+    return path
+
+
+def write_bounds_folder(folder: str, count: int, seed: int = 0) -> list[str]:
+    """Bounds catalog of `count` models spread over a few <category>_objects.json files, returns the names"""
+    os.makedirs(folder, exist_ok=True)
+    rng = random.Random(seed)
+    files: dict[str, list[dict]] = {category: [] for category in BOUNDS_CATEGORIES}
+    names = []
+    for i in range(count):
+        name = asset_name(rng, i)
+        names.append(name)
+        files[BOUNDS_CATEGORIES[i % len(BOUNDS_CATEGORIES)]].append({
+            "name": name,
+            "relative_path": f"Synthetic/{name}.dae",
+            "size": [rng.uniform(0.5, 12.0), rng.uniform(0.5, 8.0), rng.uniform(0.2, 4.0)],
+            "center_offset": [0.0, rng.uniform(0.0, 2.0), 0.0],
+            "uuid": uuid_from(rng),
+        })
+
+    for category, entries in files.items():
+        with open(os.path.join(folder, f"{category}_objects.json"), "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+    return names
+
+
+class Fixtures:
+    """Lazily written fixtures of one run, every file is generated once per scratch folder"""
+
+    def __init__(self, folder: str, seed: int = 0) -> None:
+        self.folder: str = folder
+        self.seed: int = seed
+        self._cache: dict[tuple, object] = {}
+        os.makedirs(folder, exist_ok=True)
+
+    def _get(self, key: tuple, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def path(self, *parts: str) -> str:
+        return os.path.join(self.folder, *parts)
+
+    def patch_file(self, size: int = 65) -> str:
+        return self._get(("patch", size), lambda: write_patch(self.path(f"tile_{size}.patch"), terrain_grid(size, self.seed)))
+
+    def terrain_folder(self, tiles_x: int, tiles_z: int) -> str:
+        return self._get(
+            ("terrain", tiles_x, tiles_z),
+            lambda: write_terrain_folder(self.path(f"terrain_{tiles_x}x{tiles_z}"), tiles_x, tiles_z, seed=self.seed),
+        )
+
+    def game_objects_file(self, count: int) -> str:
+        return self._get(("lsx", count), lambda: write_game_objects(self.path(f"objects_{count}.lsx"), count, self.seed))
+
+    def dungeon_file(self, rooms: int, images: int = 0) -> str:
+        return self._get(
+            ("ds", rooms, images),
+            lambda: write_dungeon(self.path(f"dungeon_{rooms}_{images}.ds"), rooms, images, seed=self.seed),
+        )
+
+    def bounds_folder(self, count: int) -> tuple[str, list[str]]:
+        """(folder, names) of a synthetic bounds catalog"""
+        folder = self.path(f"bounds_{count}")
+        return folder, self._get(("bounds", count), lambda: write_bounds_folder(folder, count, self.seed))
+
+    def output_folder(self, name: str, clear: bool = True) -> str:
+        folder = self.path(name)
+        os.makedirs(folder, exist_ok=True)
+        if clear:
+            for filename in os.listdir(folder):
+                os.remove(os.path.join(folder, filename))
+        return folder
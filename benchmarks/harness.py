@@ -0,0 +1,134 @@
+"""
+Small timing harness for the benchmark modules.
+
+A benchmark is a function decorated with @benchmark that receives the
+Fixtures of the run, does its setup and returns the zero-argument callable
+to time. Results are saved per commit in benchmarks/results/<commit>.json and
+compared with the closest ancestor commit that has results, so a slowdown
+shows up next to the change that caused it.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from typing import Callable, NamedTuple, Optional
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, "results")
+
+# A benchmark is reported as a regression when it gets slower than this ratio
+REGRESSION_RATIO = 1.25
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable  # (fixtures) -> callable to time
+    number: int      # calls per timed round
+    repeat: int      # timed rounds, the best and the median are kept
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(number: int = 1, repeat: int = 5, name: Optional[str] = None):
+    """Registers a benchmark, named <module>.<function> by default"""
+    def register(setup: Callable) -> Callable:
+        module = setup.__module__.rsplit(".", 1)[-1].removeprefix("bench_")
+        BENCHMARKS.append(Benchmark(name or f"{module}.{setup.__name__}", setup, number, repeat))
+        return setup
+    return register
+
+
+def time_benchmark(bench: Benchmark, fixtures, quiet: bool = True) -> dict:
+    """Seconds per call of one benchmark: best and median round"""
+    # Console output of the setup and of the code measured is dropped
+    output = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+    with output:
+        run = bench.setup(fixtures)
+        run()
+        rounds = []
+        for _ in range(bench.repeat):
+            start = time.perf_counter()
+            for _ in range(bench.number):
+                run()
+            rounds.append((time.perf_counter() - start) / bench.number)
+
+    return {
+        "best": min(rounds),
+        "median": statistics.median(rounds),
+        "number": bench.number,
+        "repeat": bench.repeat,
+    }
+
+
+def git(*args: str) -> Optional[str]:
+    try:
+        result = subprocess.run(["git", *args], cwd=BENCHMARKS_DIR, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def current_commit() -> str:
+    commit = git("rev-parse", "--short", "HEAD") or "unknown"
+    if git("status", "--porcelain", "--untracked-files=no"):
+        commit += "-dirty"
+    return commit
+
+
+def results_path(commit: str) -> str:
+    return os.path.join(RESULTS_DIR, f"{commit}.json")
+
+
+def save_results(commit: str, results: dict[str, dict]) -> str:
+    """Saves the results of a commit, merged with the ones of an earlier partial run (-k)"""
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = results_path(commit)
+    results = {**(load_results(commit) or {}), **results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "commit": commit,
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }, f, indent=2)
+    return path
+
+
+def load_results(commit: str) -> Optional[dict[str, dict]]:
+    path = results_path(commit)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def baseline_commit(commit: str) -> Optional[str]:
+    """Closest ancestor of HEAD (or HEAD itself for a dirty tree) with saved results"""
+    history = git("rev-list", "--abbrev-commit", "--max-count=200", "HEAD")
+    for candidate in (history or "").split():
+        if candidate != commit and os.path.exists(results_path(candidate)):
+            return candidate
+    return None
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], ratio: float = REGRESSION_RATIO) -> list[str]:
+    """Prints the change of every benchmark, returns the names that regressed"""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        change = result["best"] / previous["best"]
+        flag = ""
+        if change > ratio:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<40} {previous['best'] * 1e3:10.3f} ms -> {result['best'] * 1e3:10.3f} ms  x{change:5.2f}{flag}")
+    return regressions
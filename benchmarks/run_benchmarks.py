@@ -0,0 +1,69 @@
+"""
+Runs the benchmarks on synthetic data and saves the results of the commit
+
+    python benchmarks/run_benchmarks.py                  every benchmark
+    python benchmarks/run_benchmarks.py -k terrain       names containing "terrain"
+    python benchmarks/run_benchmarks.py --compare abc123 against the results of a given commit
+
+Without --compare the results are compared with the closest ancestor commit
+that has results in benchmarks/results.
+"""
+
+import argparse
+import glob
+import importlib
+import os
+import sys
+import tempfile
+
+import fixtures
+import harness
+
+
+def load_benchmark_modules() -> None:
+    for path in sorted(glob.glob(os.path.join(harness.BENCHMARKS_DIR, "bench_*.py"))):
+        importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--compare", help="Commit to compare with")
+    parser.add_argument("--no-save", action="store_true", help="Do not save the results")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with 1 when a benchmark regressed")
+    parser.add_argument("--ratio", type=float, default=harness.REGRESSION_RATIO, help="Slowdown counted as a regression")
+    parser.add_argument("--scratch", help="Folder for the synthetic fixtures, a temporary one by default")
+    args = parser.parse_args()
+
+    load_benchmark_modules()
+    selected = [bench for bench in harness.BENCHMARKS if args.filter in bench.name]
+
+    with tempfile.TemporaryDirectory(prefix="bench_") as temporary:
+        run_fixtures = fixtures.Fixtures(args.scratch or temporary)
+        results = {}
+        for bench in selected:
+            result = harness.time_benchmark(bench, run_fixtures)
+            results[bench.name] = result
+            print(f"{bench.name:<40} best {result['best'] * 1e3:10.3f} ms  median {result['median'] * 1e3:10.3f} ms")
+
+    commit = harness.current_commit()
+    if not args.no_save:
+        print(f"Saved {harness.save_results(commit, results)}")
+
+    baseline = args.compare or harness.baseline_commit(commit)
+    previous = harness.load_results(baseline) if baseline else None
+    if previous is None:
+        print("No earlier results to compare with")
+        return 0
+
+    print(f"\nCompared with {baseline}")
+    regressions = harness.compare(results, previous, args.ratio)
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""
+End-to-end scaling harness on synthetic levels
+
+    python benchmarks/scaling.py                      default ladder
+    python benchmarks/scaling.py --objects 100 1000 10000 100000 --tiles 1 100 1000 10000
+
+Every level size runs the convert pipeline (catalog, .ds parsing, wall
+generation, sector writing and conversion) in a fresh process, with a stand-in
+for Divine that compresses every .lsx into a .lsf. Terrain sizes stitch a
+synthetic Terrains folder. Wall time, peak RSS and files written are recorded
+per stage, and the growth of every stage is fitted as time ~ size^k: the run
+fails when k goes past --max-exponent, e.g. when a stage turns quadratic.
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+import fixtures
+import harness
+
+DEFAULT_OBJECTS = [100, 1000, 10000, 100000]
+DEFAULT_TILES = [1, 16, 256, 1024, 10000]
+
+# Largest accepted growth exponent of a stage
+MAX_EXPONENT = 1.3
+# Stages faster than this at a size are left out of the fit, timer noise dominates
+MIN_FIT_SECONDS = 0.02
+
+WALL_NAME = "BLD_Village_Wall_Support_B"
+WALL_SIZE = [4.0, 4.5, 0.5]
+CATALOG_MODELS = 5000
+# Objects of a synthetic room: about 39 wall pieces and 4 corner helpers
+OBJECTS_PER_ROOM = 43
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process, None where the resource module is missing (Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def count_files(*folders: str) -> int:
+    return sum(len(os.listdir(folder)) for folder in folders if os.path.isdir(folder))
+
+
+def stand_in_converter(command: list[str]) -> subprocess.CompletedProcess[str]:
+    """Takes the place of run_command(build_command(...)): every .lsx of -s compressed to a .lsf in -d"""
+    source = command[command.index("-s") + 1]
+    destination = command[command.index("-d") + 1]
+    os.makedirs(destination, exist_ok=True)
+
+    converted = 0
+    for filename in os.listdir(source):
+        if not filename.endswith(".lsx"):
+            continue
+        with open(os.path.join(source, filename), "rb") as f:
+            data = zlib.compress(f.read(), 1)
+        with open(os.path.join(destination, os.path.splitext(filename)[0] + ".lsf"), "wb") as f:
+            f.write(data)
+        converted += 1
+    return subprocess.CompletedProcess(command, 0, stdout=f"Converted {converted} files", stderr="")
+
+
+class StageRecorder:
+    """Wall time, peak RSS so far and files added in the watched folders, per stage"""
+
+    def __init__(self, *folders: str) -> None:
+        self.folders: tuple[str, ...] = folders
+        self.stages: dict[str, dict] = {}
+
+    def run(self, name: str, function, *args, **kwargs):
+        files = count_files(*self.folders)
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        self.stages[name] = {
+            "seconds": time.perf_counter() - start,
+            "peak_rss_mb": peak_rss_mb(),
+            "files": count_files(*self.folders) - files,
+        }
+        return result
+
+
+def run_level(objects: int, scratch: str, seed: int = 0) -> dict:
+    """One end-to-end convert run on a synthetic dungeon of about `objects` objects"""
+    import contextlib
+    import io
+
+    import convert
+    from asset_catalog import AssetCatalog
+    from collision_grid import CollisionGrid
+    from generation_context import GenerationContext
+    from sector_output import SectorWriter
+
+    run_fixtures = fixtures.Fixtures(scratch, seed)
+    rooms = max(1, round(objects / OBJECTS_PER_ROOM))
+    dungeon = run_fixtures.dungeon_file(rooms, images=rooms)
+    bounds, _ = run_fixtures.bounds_folder(CATALOG_MODELS)
+    output = run_fixtures.output_folder(f"lsx_{objects}")
+    destination = run_fixtures.output_folder(f"lsf_{objects}")
+
+    recorder = StageRecorder(output, destination)
+    with contextlib.redirect_stdout(io.StringIO()):
+        catalog = recorder.run("catalog", AssetCatalog.load, bounds)
+        catalog.add({
+            "name": WALL_NAME,
+            "size": WALL_SIZE,
+            "center_offset": [0.0, 0.0, 0.0],
+            "uuid": fixtures.uuid_from(random.Random(seed)),
+        })
+
+        context = GenerationContext(
+            output,
+            seed=seed,
+            catalog=catalog,
+            collision=CollisionGrid(),
+            sink=SectorWriter(output, convert.SECTOR_SIZE),
+        )
+        recorder.run("parse", context.load_dungeon, dungeon)
+        recorder.run("generate", convert.generate_level, context, dungeon, WALL_NAME, workers=1)
+        recorder.run("write", context.close)
+        command = convert.build_command(convert.DIVINE_EXE, convert.GAME_ID, convert.ACTION_CONVERT_RESOURCE, output, destination)
+        recorder.run("convert", stand_in_converter, command)
+
+    return {"size": len(context.names), "stages": recorder.stages}
+
+
+def run_terrain(tiles: int, scratch: str, seed: int = 0) -> dict:
+    """Stitches a synthetic Terrains folder of about `tiles` tiles"""
+    import contextlib
+    import io
+
+    from terrain_stitcher import TerrainStitcher
+
+    side_x = max(1, int(round(tiles ** 0.5)))
+    side_z = max(1, -(-tiles // side_x))
+    run_fixtures = fixtures.Fixtures(scratch, seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        folder = run_fixtures.terrain_folder(side_x, side_z)
+
+    recorder = StageRecorder(folder)
+    recorder.run("stitch", TerrainStitcher(folder).stitch)
+    return {"size": side_x * side_z, "stages": recorder.stages}
+
+
+def run_isolated(function, size: int, scratch: str) -> dict:
+    """Runs one size in a new process, so its peak RSS is its own"""
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(function, size, scratch).result()
+
+
+def growth_exponents(runs: list[dict], min_seconds: float = MIN_FIT_SECONDS) -> dict[str, Optional[float]]:
+    """k of time ~ size^k per stage, None when fewer than 2 sizes are slow enough to fit"""
+    exponents = {}
+    for stage in runs[0]["stages"]:
+        points = [
+            (run["size"], run["stages"][stage]["seconds"])
+            for run in runs
+            if run["size"] > 0 and run["stages"][stage]["seconds"] >= min_seconds
+        ]
+        if len({size for size, _ in points}) < 2:
+            exponents[stage] = None
+            continue
+        sizes, seconds = np.log(np.array(points)).T
+        exponents[stage] = float(np.polyfit(sizes, seconds, 1)[0])
+    return exponents
+
+
+def print_runs(title: str, runs: list[dict], exponents: dict[str, Optional[float]]) -> None:
+    print(f"\n=== {title} ===")
+    for run in runs:
+        stages = "  ".join(
+            f"{stage} {values['seconds']:8.3f}s {values['files']:6d}f"
+            for stage, values in run["stages"].items()
+        )
+        peak = max((values["peak_rss_mb"] or 0.0) for values in run["stages"].values())
+        print(f"{run['size']:>8}  {stages}  peak {peak:8.1f} MB")
+    print("exponents: " + ", ".join(
+        f"{stage} {'-' if k is None else f'{k:.2f}'}" for stage, k in exponents.items()
+    ))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, nargs="*", default=DEFAULT_OBJECTS, help="Level sizes in objects")
+    parser.add_argument("--tiles", type=int, nargs="*", default=DEFAULT_TILES, help="Terrain sizes in tiles")
+    parser.add_argument("--max-exponent", type=float, default=MAX_EXPONENT, help="Largest accepted growth exponent")
+    parser.add_argument("--scratch", help="Folder for the synthetic inputs and outputs, a temporary one by default")
+    parser.add_argument("--no-save", action="store_true", help="Do not save the report")
+    args = parser.parse_args()
+
+    report = {"commit": harness.current_commit(), "max_exponent": args.max_exponent}
+    failures = []
+    with tempfile.TemporaryDirectory(prefix="scaling_") as temporary:
+        scratch = args.scratch or temporary
+        for title, function, sizes in (("level", run_level, args.objects), ("terrain", run_terrain, args.tiles)):
+            if not sizes:
+                continue
+            runs = [run_isolated(function, size, scratch) for size in sorted(sizes)]
+            exponents = growth_exponents(runs)
+            print_runs(title, runs, exponents)
+            report[title] = {"runs": runs, "exponents": exponents}
+            failures += [f"{title}.{stage} ~ n^{k:.2f}" for stage, k in exponents.items() if k is not None and k > args.max_exponent]
+
+    if not args.no_save:
+        os.makedirs(harness.RESULTS_DIR, exist_ok=True)
+        path = os.path.join(harness.RESULTS_DIR, f"scaling_{report['commit']}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved {path}")
+
+    if failures:
+        print(f"Scaling regressions: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Compiles data_unpacked/bounds and data_unpacked/output into a single SQLite
+file so scripts can open the asset catalog without parsing any JSON.
+
+The compiled file remembers the size and modification time of every source
+JSON and is rebuilt automatically as soon as one of them changes.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+from contextlib import closing
+from typing import Iterator, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BOUNDS_DIR = os.path.join(SCRIPT_DIR, "data_unpacked/bounds")
+OUTPUT_DIR = os.path.join(SCRIPT_DIR, "data_unpacked/output")
+CATALOG_DB = os.path.join(SCRIPT_DIR, "data_unpacked/catalog.sqlite")
+
+# Bump when the tables change so old files get rebuilt
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE sources (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL);
+CREATE TABLE models (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    uuid TEXT,
+    relative_path TEXT,
+    category TEXT,
+    size_x REAL NOT NULL, size_y REAL NOT NULL, size_z REAL NOT NULL,
+    center_x REAL NOT NULL, center_y REAL NOT NULL, center_z REAL NOT NULL
+);
+CREATE TABLE templates (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    type TEXT NOT NULL
+);
+CREATE INDEX models_name ON models (name);
+CREATE INDEX models_uuid ON models (uuid);
+CREATE INDEX templates_name ON templates (name);
+"""
+
+
+def category_from_filename(filename: str) -> str:
+    stem = os.path.splitext(filename)[0]
+    return stem.removesuffix("_objects")
+
+def list_json_files(folder: str) -> list[str]:
+    if not os.path.isdir(folder):
+        return []
+    return sorted(
+        os.path.join(folder, filename)
+        for filename in os.listdir(folder)
+        if filename.lower().endswith(".json")
+    )
+
+def source_signature(bounds_dir: str, output_dir: str) -> dict[str, tuple[int, int]]:
+    """{path: (mtime_ns, size)} of every JSON the catalog is built from"""
+    signature = {}
+    for path in list_json_files(bounds_dir) + list_json_files(output_dir):
+        stat = os.stat(path)
+        signature[os.path.abspath(path)] = (stat.st_mtime_ns, stat.st_size)
+    return signature
+
+def stored_signature(db_path: str) -> Optional[dict[str, tuple[int, int]]]:
+    if not os.path.exists(db_path):
+        return None
+
+    try:
+        with closing(sqlite3.connect(db_path)) as connection:
+            row = connection.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+            if row is None or int(row[0]) != SCHEMA_VERSION:
+                return None
+            rows = connection.execute("SELECT path, mtime_ns, size FROM sources").fetchall()
+    except sqlite3.DatabaseError:
+        return None
+
+    return {path: (mtime_ns, size) for path, mtime_ns, size in rows}
+
+def is_fresh(db_path: str = CATALOG_DB, bounds_dir: str = BOUNDS_DIR, output_dir: str = OUTPUT_DIR) -> bool:
+    return stored_signature(db_path) == source_signature(bounds_dir, output_dir)
+
+
+def load_json_objects(path: str) -> list:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except json.JSONDecodeError:
+        print(f"⚠️ Invalid JSON: {os.path.basename(path)}")
+        return []
+    return data if isinstance(data, list) else [data]
+
+def _model_rows(bounds_dir: str) -> Iterator[tuple]:
+    for path in list_json_files(bounds_dir):
+        category = category_from_filename(os.path.basename(path))
+        for obj in load_json_objects(path):
+            if "name" not in obj or "size" not in obj or "center_offset" not in obj:
+                continue
+            size = obj["size"]
+            center = obj["center_offset"]
+            yield (
+                obj["name"], obj.get("uuid"), obj.get("relative_path"), category,
+                size[0], size[1], size[2],
+                center[0], center[1], center[2],
+            )
+
+def _template_rows(output_dir: str) -> Iterator[tuple]:
+    for path in list_json_files(output_dir):
+        type_object = os.path.splitext(os.path.basename(path))[0]
+        for obj in load_json_objects(path):
+            if "name" not in obj or "uuid" not in obj:
+                continue
+            yield (obj["name"], obj["uuid"], type_object)
+
+
+def compile_catalog(
+    db_path: str = CATALOG_DB,
+    bounds_dir: str = BOUNDS_DIR,
+    output_dir: str = OUTPUT_DIR,
+) -> str:
+    """Builds the catalog from scratch, the old file is only replaced once the new one is complete"""
+    signature = source_signature(bounds_dir, output_dir)
+
+    # A file of its own next to the catalog, so two processes compiling at once
+    # never write into the same file and os.replace stays on one filesystem
+    folder = os.path.dirname(os.path.abspath(db_path))
+    os.makedirs(folder, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(db_path) + ".", suffix=".tmp", dir=folder)
+    os.close(fd)
+
+    connection = sqlite3.connect(temp_path)
+    try:
+        connection.executescript(SCHEMA)
+        connection.execute("INSERT INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+        connection.executemany(
+            "INSERT INTO sources VALUES (?, ?, ?)",
+            ((path, mtime_ns, size) for path, (mtime_ns, size) in signature.items()),
+        )
+        connection.executemany(
+            "INSERT INTO models (name, uuid, relative_path, category, size_x, size_y, size_z, center_x, center_y, center_z) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            _model_rows(bounds_dir),
+        )
+        connection.executemany(
+            "INSERT INTO templates (name, uuid, type) VALUES (?, ?, ?)",
+            _template_rows(output_dir),
+        )
+        connection.commit()
+    except BaseException:
+        connection.close()
+        os.remove(temp_path)
+        raise
+    connection.close()
+
+    os.replace(temp_path, db_path)
+    return db_path
+
+def ensure_catalog(
+    db_path: str = CATALOG_DB,
+    bounds_dir: str = BOUNDS_DIR,
+    output_dir: str = OUTPUT_DIR,
+) -> str:
+    """Path of an up to date compiled catalog, rebuilding it when a source JSON changed"""
+    if not is_fresh(db_path, bounds_dir, output_dir):
+        print(f"Compiling asset catalog into {db_path}")
+        compile_catalog(db_path, bounds_dir, output_dir)
+    return db_path
+
+
+def read_models(db_path: str) -> list[tuple]:
+    with closing(sqlite3.connect(db_path)) as connection:
+        return connection.execute(
+            "SELECT name, uuid, relative_path, category, size_x, size_y, size_z, center_x, center_y, center_z "
+            "FROM models ORDER BY id"
+        ).fetchall()
+
+def read_templates(db_path: str) -> list[tuple]:
+    with closing(sqlite3.connect(db_path)) as connection:
+        return connection.execute("SELECT name, uuid, type FROM templates ORDER BY id").fetchall()
+
+
+if __name__ == "__main__":
+    compile_catalog()
+    print(f"Wrote {CATALOG_DB}")
@@ -0,0 +1,166 @@
+"""
+Merges the template UUIDs of data_unpacked/output into data_unpacked/bounds.
+
+- Bounds entries without an UUID get the one of the template with the same name
+- Templates without bounds get a new entry copied from their parent, the
+  longest bounds name that is a "_" prefix of theirs (e.g. a _Moss variant)
+
+Every file is read once and only the bounds files whose entries changed are
+written back. A manifest keeps the mtime and size of every input file, so the
+next run only re-merges what changed since (e.g. after a game patch that
+touched a few template files) and returns immediately when nothing did.
+"""
+
+import json
+import os
+from typing import Optional
+
+import catalog_db
+from asset_search import infer_parent
+from catalog_db import BOUNDS_DIR, OUTPUT_DIR
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(SCRIPT_DIR, "data_unpacked/merge_manifest.json")
+
+# How many "_" tokens may be removed from a template name to find its parent
+MAX_PARENT_DEPTH = 10
+
+
+def dump_json(data) -> str:
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+def load_manifest(path: str) -> Optional[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def current_signature(bounds_dir: str, output_dir: str) -> dict[str, list[int]]:
+    return {
+        path: [mtime_ns, size]
+        for path, (mtime_ns, size) in catalog_db.source_signature(bounds_dir, output_dir).items()
+    }
+
+def changed_inputs(signature: dict[str, list[int]], manifest: Optional[dict]) -> set[str]:
+    """Input files that are new or differ from the manifest of the last merge"""
+    previous = (manifest or {}).get("inputs")
+    if not isinstance(previous, dict):
+        return set(signature)
+    return {path for path, values in signature.items() if previous.get(path) != values}
+
+
+def merge(
+    bounds_dir: str = BOUNDS_DIR,
+    output_dir: str = OUTPUT_DIR,
+    manifest_path: str = MANIFEST_PATH,
+    force: bool = False,
+) -> dict[str, int]:
+    """
+    Returns:
+        Counters of the run: uuids_matched, entries_added, files_written
+    """
+    stats = {"uuids_matched": 0, "entries_added": 0, "files_written": 0}
+
+    signature = current_signature(bounds_dir, output_dir)
+    changed = set(signature) if force else changed_inputs(signature, load_manifest(manifest_path))
+    if not changed:
+        print("Bounds and templates unchanged since the last merge, nothing to do")
+        return stats
+
+    # name -> (uuid, file) of every template, the first file (sorted) wins
+    templates: dict[str, tuple[str, str]] = {}
+    for path in catalog_db.list_json_files(output_dir):
+        for obj in catalog_db.load_json_objects(path):
+            if "name" in obj and "uuid" in obj:
+                templates.setdefault(obj["name"], (obj["uuid"], path))
+
+    # Bounds files keep their own structure, the index points inside them
+    bounds_files: dict[str, list] = {}
+    single_object: set[str] = set()
+    owner: dict[str, tuple[str, dict]] = {}
+    for path in catalog_db.list_json_files(bounds_dir):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except json.JSONDecodeError:
+            print(f"⚠️ Invalid bounds JSON: {os.path.basename(path)}")
+            continue
+
+        if not isinstance(data, list):
+            single_object.add(path)
+            data = [data]
+        bounds_files[path] = data
+        for obj in data:
+            if "name" in obj:
+                owner.setdefault(obj["name"], (path, obj))
+
+    # Earlier merges already handled the templates of unchanged files against unchanged bounds
+    def pending(template_path: str, bounds_path: str) -> bool:
+        return template_path in changed or bounds_path in changed
+
+    # Bounds files whose entries were modified, the only ones written back
+    modified: set[str] = set()
+
+    # Entries already in the bounds only need their UUID
+    for name, (path, obj) in owner.items():
+        if obj.get("uuid") is None and name in templates:
+            uuid, template_path = templates[name]
+            if not pending(template_path, path):
+                continue
+            obj["uuid"] = uuid
+            modified.add(path)
+            stats["uuids_matched"] += 1
+
+    # Templates without bounds inherit them from their parent
+    known_names = set(owner)
+    for name, (uuid, template_path) in templates.items():
+        if name in known_names:
+            continue
+
+        parent = infer_parent(name, known_names, MAX_PARENT_DEPTH)
+        if parent is None:
+            continue
+
+        path, parent_obj = owner[parent]
+        if not pending(template_path, path):
+            continue
+        if "size" not in parent_obj or "center_offset" not in parent_obj:
+            continue
+
+        bounds_files[path].append({
+            "name": name,
+            "relative_path": parent_obj.get("relative_path"),
+            "size": parent_obj["size"],
+            "center_offset": parent_obj["center_offset"],
+            "uuid": uuid,
+            "parent": parent,
+        })
+        modified.add(path)
+        stats["entries_added"] += 1
+
+    for path in sorted(modified):
+        objects = bounds_files[path]
+        if path in single_object and len(objects) == 1:
+            text = dump_json(objects[0])
+        else:
+            text = dump_json(objects)
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        stats["files_written"] += 1
+        print(f"✅ Saved {os.path.basename(path)}")
+
+    # Signature after writing, so our own writes do not trigger the next run
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"inputs": current_signature(bounds_dir, output_dir)}, f, indent=2)
+
+    return stats
+
+
+if __name__ == "__main__":
+    stats = merge()
+    print(
+        f"\n{stats['uuids_matched']} UUIDs matched, {stats['entries_added']} entries added, "
+        f"{stats['files_written']} files written"
+    )
@@ -0,0 +1,211 @@
+"""
+Single entry point of the toolkit
+
+    python cli.py generate dungeon.ds                 .ds -> .lsx files in output_lsf_temp
+    python cli.py convert                             .lsx -> .lsf in the level Scenery folder (Divine)
+    python cli.py terrain stitch <Terrains folder> -o grid.npy
+    python cli.py terrain split grid.npy <folder> --prefix <terrain uuid>
+    python cli.py terrain preview <file.patch | Terrains folder>
+    python cli.py catalog build
+    python cli.py catalog search "WALL_City_Lower_*"
+
+Only argparse is imported up front. Every command imports what it needs when
+it runs, so --help and the commands that do not plot never load matplotlib,
+pycollada or pyrr.
+"""
+
+import argparse
+import os
+import sys
+from typing import Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TERRAIN_DIR = os.path.join(SCRIPT_DIR, "terrain")
+
+# Same defaults as convert.py, repeated so --help does not import it
+DEFAULT_WALL = "BLD_Village_Wall_Support_B"
+DEFAULT_OUTPUT = os.path.join(SCRIPT_DIR, "output_lsf_temp")
+DEFAULT_REPORT = os.path.join(SCRIPT_DIR, "run_report.json")
+
+
+def _terrain_modules() -> None:
+    # The terrain scripts import each other by bare module name
+    if TERRAIN_DIR not in sys.path:
+        sys.path.insert(0, TERRAIN_DIR)
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    import convert
+
+    context = convert.generate(
+        args.input,
+        args.output,
+        args.wall,
+        seed=args.seed,
+        workers=args.workers or convert.WALL_BUILD_WORKERS,
+        sector_size=None if args.no_sectors else args.sector_size,
+    )
+    if context is None:
+        print(f"Unknown wall model {args.wall}")
+        return 1
+
+    # The report is written even when Divine fails, it is where the run is investigated from
+    try:
+        if args.convert:
+            result = convert.convert_folder(args.output, args.destination or convert.MAP_SCENERY_FOLDER, args.divine or convert.DIVINE_EXE, context.stats)
+            if result.returncode:
+                return result.returncode
+    finally:
+        convert.write_run_report(context.stats, args.report)
+    return 0
+
+
+def cmd_convert(args: argparse.Namespace) -> int:
+    import convert
+
+    result = convert.convert_folder(args.source, args.destination or convert.MAP_SCENERY_FOLDER, args.divine or convert.DIVINE_EXE)
+    return result.returncode
+
+
+def cmd_terrain_stitch(args: argparse.Namespace) -> int:
+    _terrain_modules()
+    import numpy as np
+    from terrain_stitcher import TerrainStitcher
+
+    stitcher = TerrainStitcher(args.folder)
+    grid = stitcher.stitch()
+    print(f"Stitched {grid.shape[1]}x{grid.shape[0]} vertices")
+    if args.output:
+        np.save(args.output, grid)
+        print(f"Saved {args.output}")
+    if args.preview:
+        stitcher.visualize_3d(args.exaggeration, args.downsample)
+    return 0
+
+
+def cmd_terrain_split(args: argparse.Namespace) -> int:
+    _terrain_modules()
+    import numpy as np
+    from terrain_stitcher import split_grid
+
+    paths = split_grid(np.load(args.grid), args.folder, args.prefix, args.tile_size, args.tile_size)
+    print(f"Wrote {len(paths)} tiles in {args.folder}")
+    return 0
+
+
+def cmd_terrain_preview(args: argparse.Namespace) -> int:
+    _terrain_modules()
+    if os.path.isdir(args.path):
+        from terrain_stitcher import TerrainStitcher
+
+        stitcher = TerrainStitcher(args.path)
+        stitcher.stitch()
+        stitcher.visualize_3d(args.exaggeration, args.downsample)
+        return 0
+
+    from terrain_patch_reader import TerrainPatchReader
+
+    terrain = TerrainPatchReader(args.path).read()
+    terrain.print_statistics()
+    terrain.visualize_3d_surface()
+    return 0
+
+
+def cmd_catalog_build(args: argparse.Namespace) -> int:
+    import catalog_db
+
+    if args.force:
+        catalog_db.compile_catalog()
+    else:
+        catalog_db.ensure_catalog()
+    print(f"Catalog up to date: {catalog_db.CATALOG_DB}")
+    return 0
+
+
+def cmd_catalog_search(args: argparse.Namespace) -> int:
+    from asset_catalog import default_catalog
+    from asset_search import NameIndex
+
+    catalog = default_catalog()
+    index = NameIndex.from_catalog(catalog, include_templates=args.templates)
+    for name in index.search(args.query, args.limit):
+        model_data = catalog.by_name.get(name)
+        uuid = model_data.uuid if model_data is not None else None
+        print(f"{name}  {uuid}" if uuid else name)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Baldur's Gate 3 procedural generation toolkit",
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="Generate the level objects of a Dungeon Scrawl .ds file")
+    generate.add_argument("input", help="Dungeon Scrawl .ds file")
+    generate.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="Folder of the generated .lsx files")
+    generate.add_argument("--wall", default=DEFAULT_WALL, help="Model placed along the walls")
+    generate.add_argument("--seed", type=int, help="Seed of the run, random when not set")
+    generate.add_argument("--workers", type=int, help="Processes building the walls, every CPU by default")
+    generate.add_argument("--sector-size", type=float, default=64.0, help="Size (meters) of the sector files")
+    generate.add_argument("--no-sectors", action="store_true", help="One .lsx per object instead of per sector")
+    generate.add_argument("--report", default=DEFAULT_REPORT, help="JSON run report")
+    generate.add_argument("--convert", action="store_true", help="Convert to .lsf with Divine afterwards")
+    generate.add_argument("--destination", help="Folder of the .lsf files, the level Scenery folder by default")
+    generate.add_argument("--divine", help="Path of Divine.exe")
+    generate.set_defaults(run=cmd_generate)
+
+    convert = commands.add_parser("convert", help="Convert generated .lsx files to .lsf with Divine")
+    convert.add_argument("-s", "--source", default=DEFAULT_OUTPUT, help="Folder of the .lsx files")
+    convert.add_argument("-d", "--destination", help="Folder of the .lsf files, the level Scenery folder by default")
+    convert.add_argument("--divine", help="Path of Divine.exe")
+    convert.set_defaults(run=cmd_convert)
+
+    terrain = commands.add_parser("terrain", help="Terrain .patch tools").add_subparsers(dest="terrain_command", required=True)
+
+    stitch = terrain.add_parser("stitch", help="Stitch the <x>_<y>.patch tiles of a Terrains folder")
+    stitch.add_argument("folder", help="Terrains folder")
+    stitch.add_argument("-o", "--output", help="Save the stitched heights as a .npy file")
+    stitch.add_argument("--preview", action="store_true", help="Plot the stitched terrain")
+    stitch.add_argument("--exaggeration", type=float, default=0.5, help="Height exaggeration of the plot")
+    stitch.add_argument("--downsample", type=int, default=1, help="Plot every n-th vertex")
+    stitch.set_defaults(run=cmd_terrain_stitch)
+
+    split = terrain.add_parser("split", help="Split stitched heights (.npy) back into .patch tiles")
+    split.add_argument("grid", help=".npy file saved by terrain stitch")
+    split.add_argument("folder", help="Folder of the tiles")
+    split.add_argument("--prefix", required=True, help="Start of the tile names, e.g. the terrain UUID")
+    split.add_argument("--tile-size", type=int, default=65, help="Vertices per tile side")
+    split.set_defaults(run=cmd_terrain_split)
+
+    preview = terrain.add_parser("preview", help="Plot a .patch file or a whole Terrains folder")
+    preview.add_argument("path", help=".patch file or Terrains folder")
+    preview.add_argument("--exaggeration", type=float, default=0.5, help="Height exaggeration of a folder plot")
+    preview.add_argument("--downsample", type=int, default=1, help="Plot every n-th vertex of a folder")
+    preview.set_defaults(run=cmd_terrain_preview)
+
+    catalog = commands.add_parser("catalog", help="Asset catalog tools").add_subparsers(dest="catalog_command", required=True)
+
+    build = catalog.add_parser("build", help="Compile the bounds and templates into the SQLite catalog")
+    build.add_argument("--force", action="store_true", help="Rebuild even when the catalog is up to date")
+    build.set_defaults(run=cmd_catalog_build)
+
+    search = catalog.add_parser("search", help="Search asset names: prefix (ending with *), exact or fuzzy")
+    search.add_argument("query", help='e.g. "WALL_City_Lower_*" or a misspelled name')
+    search.add_argument("-n", "--limit", type=int, default=10, help="Largest number of results")
+    search.add_argument("--templates", action="store_true", help="Also search the template names")
+    search.set_defaults(run=cmd_catalog_search)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
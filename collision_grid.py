@@ -0,0 +1,157 @@
+"""
+Broadphase for placed objects: a uniform grid (spatial hash) of the X/Z
+footprints, so checking a new placement only looks at its neighbours.
+
+Footprints are boxes rotated around Y, built from the bounds size and
+center offset of the model and the placement transform.
+"""
+
+import math
+from typing import Collection, Iterator, NamedTuple, Optional
+
+from pyrr import Quaternion, Vector3
+
+
+class Footprint(NamedTuple):
+    """Box rotated around Y, seen from above"""
+    x: float
+    z: float
+    half_x: float
+    half_z: float
+    angle: float  # radians, rotation of the local X axis in the X/Z plane
+
+    def axes(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        cos, sin = math.cos(self.angle), math.sin(self.angle)
+        return (cos, sin), (-sin, cos)
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Axis aligned (min_x, min_z, max_x, max_z) around the rotated box"""
+        cos, sin = abs(math.cos(self.angle)), abs(math.sin(self.angle))
+        extent_x = self.half_x * cos + self.half_z * sin
+        extent_z = self.half_x * sin + self.half_z * cos
+        return self.x - extent_x, self.z - extent_z, self.x + extent_x, self.z + extent_z
+
+    def moved(self, dx: float, dz: float) -> "Footprint":
+        return self._replace(x=self.x + dx, z=self.z + dz)
+
+
+def footprint_from_model(model_data, position: Vector3, rotation: Quaternion, scale: float = 1.0) -> Footprint:
+    """Footprint of a model (bounds size and center offset) placed with the given transform"""
+    center = rotation * Vector3([
+        model_data.center_offset_x * scale,
+        model_data.center_offset_y * scale,
+        model_data.center_offset_z * scale,
+    ])
+    axis_x = rotation * Vector3([1.0, 0.0, 0.0])
+
+    return Footprint(
+        x=float(position[0] + center[0]),
+        z=float(position[2] + center[2]),
+        half_x=model_data.offset_x * scale * 0.5,
+        half_z=model_data.offset_z * scale * 0.5,
+        angle=math.atan2(axis_x[2], axis_x[0]),
+    )
+
+
+def footprints_overlap(a: Footprint, b: Footprint, shrink: float = 0.0) -> bool:
+    """
+    Separating axis test between two rotated boxes
+
+    Args:
+        shrink: Removed from every half size first, so pieces that only touch
+            (walls laid end to end) do not count as overlapping
+    """
+    a_half = (max(a.half_x - shrink, 0.0), max(a.half_z - shrink, 0.0))
+    b_half = (max(b.half_x - shrink, 0.0), max(b.half_z - shrink, 0.0))
+    a_axes = a.axes()
+    b_axes = b.axes()
+    dx, dz = b.x - a.x, b.z - a.z
+
+    for axis_x, axis_z in a_axes + b_axes:
+        distance = abs(dx * axis_x + dz * axis_z)
+        radius_a = sum(half * abs(ax * axis_x + az * axis_z) for half, (ax, az) in zip(a_half, a_axes))
+        radius_b = sum(half * abs(bx * axis_x + bz * axis_z) for half, (bx, bz) in zip(b_half, b_axes))
+        if distance >= radius_a + radius_b:
+            return False
+    return True
+
+
+class CollisionGrid:
+    def __init__(self, cell_size: float = 4.0, shrink: float = 0.05) -> None:
+        """
+        Args:
+            cell_size: Grid cell size in meters, around the size of a typical object
+            shrink: Tolerance (meters) removed from the half sizes before testing
+        """
+        self.cell_size: float = cell_size
+        self.shrink: float = shrink
+        self.footprints: list[Footprint] = []
+        self.cells: dict[tuple[int, int], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.footprints)
+
+    def _cells(self, footprint: Footprint) -> Iterator[tuple[int, int]]:
+        min_x, min_z, max_x, max_z = footprint.bounds()
+        size = self.cell_size
+        for i in range(math.floor(min_x / size), math.floor(max_x / size) + 1):
+            for j in range(math.floor(min_z / size), math.floor(max_z / size) + 1):
+                yield i, j
+
+    def insert(self, footprint: Footprint) -> int:
+        index = len(self.footprints)
+        self.footprints.append(footprint)
+        for cell in self._cells(footprint):
+            self.cells.setdefault(cell, []).append(index)
+        return index
+
+    def query(self, footprint: Footprint) -> list[int]:
+        """Indexes of the inserted footprints overlapping this one"""
+        seen: set[int] = set()
+        hits = []
+        for cell in self._cells(footprint):
+            for index in self.cells.get(cell, ()):
+                if index in seen:
+                    continue
+                seen.add(index)
+                if footprints_overlap(footprint, self.footprints[index], self.shrink):
+                    hits.append(index)
+        return hits
+
+    def collides(self, footprint: Footprint, ignore: Collection[int] = ()) -> bool:
+        """
+        Args:
+            ignore: Indexes of inserted footprints this one may overlap
+        """
+        for cell in self._cells(footprint):
+            for index in self.cells.get(cell, ()):
+                if index not in ignore and footprints_overlap(footprint, self.footprints[index], self.shrink):
+                    return True
+        return False
+
+    def try_insert(self, footprint: Footprint, ignore: Collection[int] = ()) -> bool:
+        """Inserts the footprint only when it does not overlap anything (but the ignored footprints)"""
+        if self.collides(footprint, ignore):
+            return False
+        self.insert(footprint)
+        return True
+
+    def resolve(self, footprint: Footprint, max_nudge: float = 1.0, steps: int = 4, ignore: Collection[int] = ()) -> Optional[Footprint]:
+        """
+        Free position for the footprint: itself, or the closest of a few
+        positions on rings around it (8 directions, up to max_nudge away)
+
+        Returns:
+            The inserted footprint, None when every position collides
+        """
+        if self.try_insert(footprint, ignore):
+            return footprint
+
+        for step in range(1, steps + 1):
+            distance = max_nudge * step / steps
+            for k in range(8):
+                angle = k * math.pi / 4
+                candidate = footprint.moved(distance * math.cos(angle), distance * math.sin(angle))
+                if self.try_insert(candidate, ignore):
+                    return candidate
+        return None
@@ -0,0 +1,10 @@
+# Lets the tests import the modules of the repo root (and of terrain/ and
+# spline_uncompleted/, which import each other by bare module name) the way the
+# scripts do when run from here
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for folder in (ROOT, os.path.join(ROOT, "terrain"), os.path.join(ROOT, "spline_uncompleted")):
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
@@ -1,12 +1,18 @@
 import os
+import random
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 import create_lsx
-import name_to_uuid
 import corridor_generator
-import parsers.extract_points_dungeon as extract_points_dungeon
-import plot_points
+import polyline_sampler
+import polyline_simplify
+from collision_grid import CollisionGrid
+from generation_context import GenerationContext
+from instrumentation import Stats
+from sector_output import SectorWriter
+import numpy as np
 from pyrr import Vector3, Quaternion
-import math
 ###
 # E:\Games\Baldurs Gate 3\Data\Editor\Mods\procedural_ffda7ce9-3f05-0f4a-ee04-84f560c3c068\Levels\procedural2\Terrains
 # Folder where it's stored terrain data
@@ -17,6 +23,7 @@ OUTPUT_LSF_TEMP = r"output_lsf_temp"
 
 GAME_ID = "bg3"
 ACTION_CONVERT_RESOURCE = "convert-resources"
+ACTION_CONVERT_SINGLE_RESOURCE = "convert-resource"
 
 
 BG3_MODS_PATH = r"E:\Games\Baldurs Gate 3\Data\Mods"
@@ -27,21 +34,57 @@ OUTPUT_FOLDER_LSF = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),
     OUTPUT_LSF_TEMP
 )
-corridor_generator.OUTPUT_FOLDER_LSF = OUTPUT_FOLDER_LSF
 
 MAP_SCENERY_FOLDER = os.path.join(BG3_MODS_PATH, MOD_ID, LEVEL_PATH)
 
+# Objects are written in one file per sector of this size (meters), None writes one file per object
+SECTOR_SIZE = 64.0
 
+# Number of processes used to build the walls, 1 keeps everything in this process
+WALL_BUILD_WORKERS = os.cpu_count() or 1
+# Turns sharper than this (degrees) start a new run of wall pieces on the vertex
+WALL_CORNER_ANGLE = 30.0
+# Vertices closer than this (meters) to the simplified outline are removed, 0 keeps every vertex
+SIMPLIFY_TOLERANCE = 0.05
 
-def build_command(divine_exe: str, game_id: str, action: str) -> list[str]:
+# Stage timings and counters of the last run (see instrumentation)
+RUN_REPORT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "run_report.json")
+
+
+
+def build_command(
+    divine_exe: str,
+    game_id: str,
+    action: str,
+    source: str = OUTPUT_FOLDER_LSF,
+    destination: str = MAP_SCENERY_FOLDER,
+) -> list[str]:
     return [
         divine_exe,
         "-g", game_id,
         "-a", action,
         "-i", "lsx",
         "-o", "lsf",
-        "-s", OUTPUT_FOLDER_LSF,
-        "-d", MAP_SCENERY_FOLDER,
+        "-s", source,
+        "-d", destination,
+    ]
+
+
+def build_sector_command(
+    divine_exe: str,
+    game_id: str,
+    sector_file: str,
+    source: str = OUTPUT_FOLDER_LSF,
+    destination: str = MAP_SCENERY_FOLDER,
+) -> list[str]:
+    """Converts a single sector file (see sector_output) instead of the whole folder"""
+    name = os.path.splitext(sector_file)[0]
+    return [
+        divine_exe,
+        "-g", game_id,
+        "-a", ACTION_CONVERT_SINGLE_RESOURCE,
+        "-s", os.path.join(source, name + ".lsx"),
+        "-d", os.path.join(destination, name + ".lsf"),
     ]
 
 
@@ -60,58 +103,162 @@ def print_result(result: subprocess.CompletedProcess[str]) -> None:
     if result.stderr:
         print(result.stderr)
 
+def generate(
+    name_file_input: str,
+    output_folder: str = OUTPUT_FOLDER_LSF,
+    name_object_wall: str = "BLD_Village_Wall_Support_B",
+    seed: Optional[int] = None,
+    workers: int = WALL_BUILD_WORKERS,
+    sector_size: Optional[float] = SECTOR_SIZE,
+) -> Optional[GenerationContext]:
+    """Generates the level of a .ds file as .lsx files in output_folder, None when the wall model is unknown"""
+    os.makedirs(output_folder, exist_ok=True)
+    create_lsx.clear_auto_xml(output_folder)
+
+    sink = SectorWriter(output_folder, sector_size) if sector_size else None
+    context = GenerationContext(output_folder, seed=seed, collision=CollisionGrid(), sink=sink)
+    try:
+        if not generate_level(context, name_file_input, name_object_wall, workers=workers):
+            return None
+    finally:
+        # Also when nothing was generated, so the sector index never lists the files cleared above
+        context.close()
+    return context
+
+def convert_folder(
+    source: str = OUTPUT_FOLDER_LSF,
+    destination: str = MAP_SCENERY_FOLDER,
+    divine_exe: str = DIVINE_EXE,
+    stats: Optional[Stats] = None,
+) -> subprocess.CompletedProcess[str]:
+    """Converts every .lsx of source to .lsf in destination with Divine, generated files there are replaced"""
+    create_lsx.clear_auto_xml(destination)
+
+    command = build_command(divine_exe, GAME_ID, ACTION_CONVERT_RESOURCE, source, destination)
+    stats = stats if stats is not None else Stats()
+    with stats.stage("divine_convert"):
+        result = run_command(command)
+    print_result(result)
+    return result
+
+def write_run_report(stats: Stats, path: str = RUN_REPORT) -> dict:
+    stats.progress("Generated objects", stats.counters.get("objects_emitted", 0), force=True)
+    stats.print_summary()
+    return stats.write_report(path)
+
 def main() -> None:
-    DECREASE_SPACING_OBJECTS = 1
-    NAME_OBJECT_WALL = "BLD_Village_Wall_Support_B"
     NAME_FILE_INPUT = r"C:\Users\andre\Downloads\dungeon_simple.ds"
-    
-    create_lsx.clear_auto_xml(OUTPUT_FOLDER_LSF)
-    create_lsx.clear_auto_xml(MAP_SCENERY_FOLDER)
-    data_found = name_to_uuid.find_data(NAME_OBJECT_WALL)
-    if data_found is None:
+
+    context = generate(NAME_FILE_INPUT)
+    if context is None:
         return
+
+    convert_folder(stats=context.stats)
+    write_run_report(context.stats)
+
+def generate_level(
+    context: GenerationContext,
+    name_file_input: str,
+    name_object_wall: str = "BLD_Village_Wall_Support_B",
+    workers: int = WALL_BUILD_WORKERS,
+    simplify_tolerance: float = SIMPLIFY_TOLERANCE,
+) -> bool:
+    DECREASE_SPACING_OBJECTS = 1
+
+    stats = context.stats
+    with stats.stage("catalog_lookup"):
+        data_found = context.find_data(name_object_wall)
+    if data_found is None:
+        return False
     
     uuid = data_found.uuid
     offset_x = data_found.offset_x * DECREASE_SPACING_OBJECTS
+    center = (data_found.center_offset_x, data_found.center_offset_z)
 
-    data_walls,data_inner_walls = extract_points_dungeon.get_points_dungeon(NAME_FILE_INPUT)
-    for a in extract_points_dungeon.dict_ids.values():
-        corridor_generator.generate_point_helper(a[1])
+    with stats.stage("parse_dungeon"):
+        data_walls,data_inner_walls,assets = context.load_dungeon(name_file_input)
+    with stats.stage("asset_helpers"):
+        for position in assets.positions:
+            corridor_generator.generate_point_helper(context, Vector3(position))
     
+    if simplify_tolerance > 0:
+        with stats.stage("simplify_walls"):
+            simplified_walls = polyline_simplify.simplify_polygons(data_walls, simplify_tolerance, WALL_CORNER_ANGLE)
+            report = polyline_simplify.simplification_report(data_walls, simplified_walls, offset_x, WALL_CORNER_ANGLE)
+        print(
+            f"Simplified walls: {report['vertices_before']} -> {report['vertices_after']} vertices, "
+            f"{report['objects_before']} -> {report['objects_after']} objects"
+        )
+        data_walls = simplified_walls
+
     # plot_points.construct(data_walls,data_inner_walls)
-    build_walls(uuid, offset_x, data_walls)
+    with stats.stage("build_walls"):
+        build_walls(context, uuid, offset_x, data_walls, workers=workers, center=center)
 
-    command = build_command(DIVINE_EXE, GAME_ID, ACTION_CONVERT_RESOURCE)
-    result = run_command(command)
-    print_result(result)
+    if context.collision is not None:
+        print(f"{context.rejected} overlapping placements were skipped")
+    return True
+
+def wall_links(batch, data_polygon, chain) -> list[corridor_generator.ChainLink]:
+    """Chain link of every wall piece, one chain per polyline of the polygon"""
+    counts = np.bincount(batch.polyline, minlength=len(data_polygon))
+    first = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    closed = [len(line) > 2 and np.allclose(line[0], line[-1]) for line in data_polygon]
+    return [
+        corridor_generator.ChainLink((chain, line), index - int(first[line]), int(counts[line]), closed[line])
+        for index, line in enumerate(batch.polyline.tolist())
+    ]
+
+def wall_placements(uuid, offset_x, data_polygon, seed, chain=0, center=(0.0, 0.0)) -> list[corridor_generator.Placement]:
+    """
+    Args:
+        center: (x, z) center offset of the wall model, the bounds are centred on the pieces
+    """
+    # Every polygon gets its own random stream so the result does not depend on
+    # which process (or in which order) the polygon was built
+    rng = random.Random(seed)
+
+    # Pieces are spread along the whole outline, the runs between sharp corners
+    # start and end on the corners instead of overshooting them
+    batch = polyline_sampler.resample_polylines(data_polygon, offset_x, corner_angle=WALL_CORNER_ANGLE)
+
+    placements = [
+        corridor_generator.point_helper_placement(Vector3(position) + Vector3([0,1,0]))
+        for position in batch.starts[batch.corner]
+    ]
+
+    # The model origin goes where its bounds end up centred on the piece (local X along the wall)
+    heading = np.radians(batch.angles)
+    cos, sin = np.cos(heading), np.sin(heading)
+    positions = batch.positions.copy()
+    positions[:, 0] -= center[0] * cos - center[1] * sin
+    positions[:, 2] -= center[0] * sin + center[1] * cos
+
+    # Pieces laid end to end meet on the corners, the collision grid lets them overlap their neighbours
+    links = wall_links(batch, data_polygon, chain)
+    placements.extend(corridor_generator.batch_placements(uuid, positions, batch.angles, rng, links))
+    return placements
+
+def _wall_placements_job(job) -> list[corridor_generator.Placement]:
+    return wall_placements(*job)
+
+def build_walls(context, uuid, offset_x, data_walls, workers=1, center=(0.0, 0.0)):
+    jobs = [
+        (uuid, offset_x, data_polygon, context.child_seed(index), index, center)
+        for index, data_polygon in enumerate(data_walls)
+    ]
+
+    if workers <= 1 or len(jobs) < 2:
+        for job in jobs:
+            context.emit_all(_wall_placements_job(job))
+        return
 
-def build_walls(uuid, offset_x, data_walls):
-    for data_polygon in data_walls:
-        for line in data_polygon:
-            position_iterator = Vector3([0,0,0])
-            
-            for i in range(len(line) - 1):
-                x0, z0 = line[i]
-                x1, z1 = line[i + 1]
-
-                dx = x1 - x0
-                dz = z1 - z0
-
-                length = math.hypot(dx, dz)
-                angle_deg = math.degrees(math.atan2(dz, dx))
-                
-                position_iterator = Vector3([x0, 0, z0])
-                 
-                steps = int(length / offset_x) + 1
-                
-                corridor_generator.generate_point_helper(position_iterator + Vector3([0,1,0]))
-                corridor_generator.generate_line(
-                    uuid=uuid,
-                    position=position_iterator,
-                    step=offset_x,
-                    angle_deg=angle_deg,
-                    length=steps
-                )
+    # Workers only compute the placements, names and MapKeys are handed out here
+    # in polygon order so the output is the same as the serial path
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        for batch in pool.map(_wall_placements_job, jobs, chunksize=chunksize):
+            context.emit_all(batch)
 
 
 if __name__ == "__main__":
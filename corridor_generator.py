@@ -1,19 +1,45 @@
-
-import create_lsx
 from pyrr import Vector3, Quaternion
 import math
 import random
-
-OUTPUT_FOLDER_LSF = ""
+from typing import Hashable, NamedTuple, Optional, Sequence
 
 # Identity quaternion for rotation
 IDENTITY_ROTATION = Quaternion()  # defaults to (1,0,0,0) = w,x,y,z
 CORRIDOR_LENGTH = 50
 
+HELPER_UUID = "88f78c11-1f16-4aa2-a1e7-de3b9283a9fe" # NAT_Underdark_Mushroom_Hat_Small_A
+
+
+class ChainLink(NamedTuple):
+    """Place of a piece in a chain of pieces laid end to end, e.g. the wall pieces of one polyline"""
+    chain: Hashable  # unique per chain in the run
+    index: int       # order of the piece in the chain
+    count: int       # pieces in the chain
+    closed: bool     # the last piece touches the first one
+
+    def neighbours(self) -> set[int]:
+        """Indexes of the pieces touching this one"""
+        indexes = {self.index - 1, self.index + 1}
+        if self.closed:
+            return {index % self.count for index in indexes} - {self.index}
+        return {index for index in indexes if 0 <= index < self.count}
+
+
+class Placement(NamedTuple):
+    """A single object to be written, before it gets its unique name and MapKey"""
+    name: str
+    uuid: str
+    position: Vector3
+    rotation: Quaternion
+    scale: float
+    # Set on pieces of a chain, they may overlap the pieces next to them
+    link: Optional[ChainLink] = None
+
+
 def quat_y(deg: float) -> Quaternion:
     return Quaternion.from_y_rotation(-math.radians(deg))
 
-def generate_corridor(uuid,position, offset_x, offset_z,angle_deg,length):
+def generate_corridor(context, uuid,position, offset_x, offset_z,angle_deg,length):
     
     rad = math.radians(angle_deg)
 
@@ -35,28 +61,14 @@ def generate_corridor(uuid,position, offset_x, offset_z,angle_deg,length):
 
     for i in range(length):
         # Left wall
-        create_lsx.create_xml(
-            OUTPUT_FOLDER_LSF,
-            name=f"WALL_L_{i}",
-            uuid=uuid,
-            position=position + side,
-            rotation=rotation,
-            scale=1.0,
-        )
+        context.emit(Placement(f"WALL_L_{i}", uuid, position + side, rotation, 1.0))
 
         # Right wall
-        create_lsx.create_xml(
-            OUTPUT_FOLDER_LSF,
-            name=f"WALL_R_{i}",
-            uuid=uuid,
-            position=position - side,
-            rotation=rotation,
-            scale=1.0,
-        )
+        context.emit(Placement(f"WALL_R_{i}", uuid, position - side, rotation, 1.0))
 
         position += forward
 
-def generate_line(uuid, position, step, angle_deg, length):
+def line_placements(uuid, position, step, angle_deg, length, rng=random) -> list[Placement]:
     y_jitter=0.1
     rot_jitter=5.0
     base_rad = math.radians(angle_deg)
@@ -68,11 +80,12 @@ def generate_line(uuid, position, step, angle_deg, length):
         math.sin(base_rad) * step
     ])
 
+    placements = []
     for _ in range(length):
         # Random offsets
-        y_offset = random.gauss(-y_jitter, y_jitter)
-        rot_offset_x = math.radians(random.gauss(0,rot_jitter/3.0))
-        rot_offset_z = math.radians(random.gauss(0,rot_jitter/3.0))
+        y_offset = rng.gauss(-y_jitter, y_jitter)
+        rot_offset_x = math.radians(rng.gauss(0,rot_jitter/3.0))
+        rot_offset_z = math.radians(rng.gauss(0,rot_jitter/3.0))
 
         # Final position (Y only)
         pos = Vector3([
@@ -85,32 +98,52 @@ def generate_line(uuid, position, step, angle_deg, length):
         
         rotation = Quaternion.from_eulers([rot_offset_x, -math.radians(angle_deg), rot_offset_z])
 
-        create_lsx.create_xml(
-            OUTPUT_FOLDER_LSF,
-            name="SEGMENT",
-            uuid=uuid,
-            position=pos,
-            rotation=rotation,
-            scale=1.0,
-        )
+        placements.append(Placement("SEGMENT", uuid, pos, rotation, 1.0))
 
-        position += forward
+        position = position + forward
+
+    return placements
+
+def batch_placements(uuid, positions, angles, rng=random, links: Optional[Sequence[ChainLink]] = None) -> list[Placement]:
+    """
+    Same jitter as line_placements, for samples that already have their own
+    position and heading (e.g. a polyline_sampler.TransformBatch)
+
+    Args:
+        links: Chain link of every sample, when the samples are pieces laid end to end
+    """
+    y_jitter=0.1
+    rot_jitter=5.0
+
+    if links is None:
+        links = [None] * len(positions)
+
+    placements = []
+    for (x, y, z), angle_deg, link in zip(positions.tolist(), angles.tolist(), links):
+        y_offset = rng.gauss(-y_jitter, y_jitter)
+        rot_offset_x = math.radians(rng.gauss(0,rot_jitter/3.0))
+        rot_offset_z = math.radians(rng.gauss(0,rot_jitter/3.0))
+
+        rotation = Quaternion.from_eulers([rot_offset_x, -math.radians(angle_deg), rot_offset_z])
+        placements.append(Placement("SEGMENT", uuid, Vector3([x, y + y_offset, z]), rotation, 1.0, link))
+
+    return placements
+
+def generate_line(context, uuid, position, step, angle_deg, length):
+    context.emit_all(line_placements(uuid, position, step, angle_deg, length, context.rng))
+
+def point_helper_placement(position) -> Placement:
+    return Placement("Helper", HELPER_UUID, position, Quaternion(), 0.5)
+
+def generate_point_helper(context, position):
+    context.emit(point_helper_placement(position))
+
+def generate_point_helper2(context, position):
+    context.emit(Placement(
+        "Helper",
+        "fa611c6a-9735-4da4-be11-d202e9b1b24b", #NAT_Underdark_Mushroom_Porcini_Small_C
+        position,
+        Quaternion(),
+        0.5,
+    ))
 
-def generate_point_helper(position):
-    create_lsx.create_xml(
-        OUTPUT_FOLDER_LSF,
-        name="Helper",
-        uuid="88f78c11-1f16-4aa2-a1e7-de3b9283a9fe", # NAT_Underdark_Mushroom_Hat_Small_A
-        position=position,
-        rotation=Quaternion(),
-        scale=0.5,
-    )
-def generate_point_helper2(position):
-    create_lsx.create_xml(
-        OUTPUT_FOLDER_LSF,
-        name="Helper",
-        uuid="fa611c6a-9735-4da4-be11-d202e9b1b24b", #NAT_Underdark_Mushroom_Porcini_Small_C
-        position=position,
-        rotation=Quaternion(),
-        scale=0.5,
-    )
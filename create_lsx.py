@@ -1,7 +1,9 @@
 import re
-from typing import Tuple, Optional
+from typing import Iterable, Tuple, Optional
 import os
+import threading
 import uuid
+from xml.sax.saxutils import quoteattr
 from pyrr import Vector3, Quaternion
 
 
@@ -43,7 +45,51 @@ XML_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
 </save>
 """
 
-_object_names: set[str] = set()
+# Same file as XML_TEMPLATE split around its GameObjects node, so a file can hold many objects.
+# The node is formatted directly, values are already quoted by game_object_node
+XML_HEADER = """<?xml version="1.0" encoding="utf-8"?>
+<save>
+	<version major="4" minor="8" revision="0" build="10" lslib_meta="v1,bswap_guids,lsf_keys_adjacency" />
+	<region id="Templates">
+		<node id="Templates">
+			<children>
+"""
+
+GAME_OBJECT_NODE_TEMPLATE = """				<node id="GameObjects">
+					<attribute id="MapKey" type="FixedString" value={map_key} />
+					<attribute id="Name" type="LSString" value={name} />
+					<attribute id="LevelName" type="FixedString" value={level_name} />
+					<attribute id="Type" type="FixedString" value="scenery" />
+					<attribute id="TemplateName" type="FixedString" value={uuid} />
+					<attribute id="Flag" type="uint8" value="1" />
+					<children>
+						<node id="Transform">
+							<attribute id="Scale" type="float" value={scale} />
+							<attribute id="Position" type="fvec3" value={position} />
+							<attribute id="RotationQuat" type="fvec4" value={rotation} />
+						</node>
+						<node id="LayerList">
+							<children>
+								<node id="Layers">
+									<children>
+										<node id="Object" key="MapKey">
+											<attribute id="MapKey" type="FixedString" value={level_name} />
+										</node>
+									</children>
+								</node>
+							</children>
+						</node>
+					</children>
+				</node>
+"""
+
+XML_FOOTER = """			</children>
+		</node>
+	</region>
+</save>
+"""
+
+DEFAULT_LEVEL_NAME = "procedural2"
 
 def get_pattern_attribute_xml(attr_id):
     return rf'(<attribute\s+id="{attr_id}"[^>]*\svalue=")([^"]*)(")'
@@ -80,22 +126,50 @@ def replace_all_attr(xml: str, attr_id: str, new_value: Optional[str]) -> str:
 def generate_uuid() -> str:
     return str(uuid.uuid4())
 
-def allocate_object_name(base_name: str) -> str:
-    if base_name not in _object_names:
-        _object_names.add(base_name)
+def allocate_object_name(base_name: str, object_names: set[str], next_suffix: Optional[dict[str, int]] = None) -> str:
+    """
+    Unique name for base_name, adding a _000, _001... suffix when it is taken
+
+    Args:
+        object_names: Names already used, the new one is added
+        next_suffix: Base name -> first suffix that may still be free. Names are never
+            released, so when given the search resumes there instead of from _000
+    """
+    if base_name not in object_names:
+        object_names.add(base_name)
         return base_name
     
     # Remove the _000 if it exists
     base_name = re.sub(r'_\d{3}$','',base_name)
     
-    i = 0
+    i = next_suffix.get(base_name, 0) if next_suffix is not None else 0
     while True:
         candidate = f"{base_name}_{i:03d}"
-        if candidate not in _object_names:
-            _object_names.add(candidate)
+        if candidate not in object_names:
+            object_names.add(candidate)
+            if next_suffix is not None:
+                next_suffix[base_name] = i + 1
             return candidate
         i += 1
 
+class NameAllocator:
+    """Unique object names for one level, safe to share between threads"""
+
+    def __init__(self) -> None:
+        self._object_names: set[str] = set()
+        self._next_suffix: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def allocate(self, base_name: str) -> str:
+        with self._lock:
+            return allocate_object_name(base_name, self._object_names, self._next_suffix)
+
+    def __len__(self) -> int:
+        return len(self._object_names)
+
+# Names of the objects created without an allocator of their own (e.g. outside a GenerationContext)
+_default_names = NameAllocator()
+
 def create_object_xml(
     xml_template: str,
     map_key: Optional[str] = None,
@@ -105,15 +179,20 @@ def create_object_xml(
     position: Optional[Tuple[float, float, float]] = None,
     rotation: Optional[Tuple[float, float, float, float]] = None,
     scale: Optional[float] = None,
+    names: Optional[NameAllocator] = None,
 ) -> str:
     xml = xml_template
     
     if map_key is None:
         map_key = generate_uuid()
     
-    # Create an unique name
-    name = allocate_object_name(name)
+    # Create an unique name, among the names of the module when no allocator is given
+    if names is None:
+        names = _default_names
+    name = names.allocate(name)
 
+    # The layer MapKey holds the level name, the first MapKey (the object one) is set after it
+    xml = replace_all_attr(xml, "MapKey", level_name)
     xml = replace_attr(xml, "MapKey", map_key)
     xml = replace_attr(xml, "Name", name)
     xml = replace_attr(xml, "LevelName", level_name)
@@ -122,12 +201,36 @@ def create_object_xml(
     xml = replace_attr(xml, "Scale", str(scale))
     xml = replace_attr(xml, "Position", vector_to_string(position))
     xml = replace_attr(xml, "RotationQuat", quaternion_to_string(rotation))
-
-    xml = replace_all_attr(xml, "MapKey", level_name)
-    
-    print("Generated object",name)
     return xml
 
+def game_object_node(
+    map_key: str,
+    name: str,
+    uuid: str,
+    position: Vector3,
+    rotation: Quaternion,
+    scale: float = 1.0,
+    level_name: Optional[str] = None,
+) -> str:
+    """GameObjects node of one object, to be written between XML_HEADER and XML_FOOTER"""
+    return GAME_OBJECT_NODE_TEMPLATE.format(
+        map_key=quoteattr(map_key),
+        name=quoteattr(name),
+        level_name=quoteattr(level_name or DEFAULT_LEVEL_NAME),
+        uuid=quoteattr(uuid),
+        scale=quoteattr(str(scale)),
+        position=quoteattr(vector_to_string(position)),
+        rotation=quoteattr(quaternion_to_string(rotation)),
+    )
+
+def write_objects_file(path: str, nodes: Iterable[str]) -> str:
+    """Writes several GameObjects nodes (see game_object_node) in one .lsx file"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(XML_HEADER)
+        f.writelines(nodes)
+        f.write(XML_FOOTER)
+    return path
+
 def write_xml_file(xml: str,folder: str) -> str:
     pattern = get_pattern_attribute_xml("MapKey")
     map_key_name = re.search(pattern,xml).groups()[1]
@@ -156,7 +259,8 @@ def create_xml(folder: str,
     uuid: Optional[str] = None,
     position: Optional[Vector3] = None,
     rotation: Optional[Quaternion] = None,
-    scale: Optional[float] = None
+    scale: Optional[float] = None,
+    names: Optional[NameAllocator] = None,
     ) -> str:
     xml = create_object_xml(
         XML_TEMPLATE,
@@ -166,7 +270,8 @@ def create_xml(folder: str,
         uuid = uuid,
         position = position,
         rotation = rotation,
-        scale = scale
+        scale = scale,
+        names = names
     )
     destination_path = write_xml_file(xml,folder)
     
@@ -0,0 +1,175 @@
+import os
+import random
+import threading
+from typing import Optional
+
+from pyrr import Vector3
+
+import create_lsx
+from instrumentation import Stats
+from asset_catalog import AssetCatalog, ModelData, default_catalog
+from collision_grid import CollisionGrid, footprint_from_model
+import parsers.extract_points_dungeon as extract_points_dungeon
+
+
+class GenerationContext:
+    """
+    State of a single level generation run.
+
+    Owns the object name allocator, where the objects are written, the random
+    generator, the asset catalog and the parsed input files. Nothing is shared
+    between two contexts, so several levels can be generated at the same time
+    from different threads of the same process.
+    """
+
+    def __init__(
+        self,
+        output_folder: str,
+        seed: Optional[int] = None,
+        catalog: Optional[AssetCatalog] = None,
+        level_name: Optional[str] = None,
+        collision: Optional[CollisionGrid] = None,
+        collision_mode: str = "reject",
+        sink=None,
+        stats: Optional[Stats] = None,
+    ) -> None:
+        """
+        Args:
+            output_folder: Folder where the generated .lsx files are written
+            seed: Seed of the run, a random one is picked when None
+            catalog: Asset catalog, the one of the repo when None
+            level_name: Overrides the level name of the template when set
+            collision: When set, placements overlapping an earlier one are dropped or moved.
+                Pieces of a chain (Placement.link) may overlap the pieces next to them
+            collision_mode: "reject" drops colliding placements, "nudge" moves them
+                to the closest free spot nearby first
+            sink: When set (e.g. a sector_output.SectorWriter), objects are handed to
+                sink.add(placement, map_key, name, level_name) instead of one .lsx
+                file each, and written by close()
+            stats: Stage timers and counters of the run, a new Stats when None
+        """
+        self.output_folder: str = output_folder
+        self.level_name: Optional[str] = level_name
+        self.seed: int = seed if seed is not None else random.randrange(2**32)
+        self.rng: random.Random = random.Random(self.seed)
+        self.names: create_lsx.NameAllocator = create_lsx.NameAllocator()
+        self._catalog: Optional[AssetCatalog] = catalog
+
+        self.collision: Optional[CollisionGrid] = collision
+        self.collision_mode: str = collision_mode
+        # Markers that never block anything
+        self.collision_exempt: set[str] = {"Helper"}
+        # Chain -> {piece index: footprint index}, pieces of a chain may overlap the pieces next to them
+        self._chains: dict = {}
+        self.rejected: int = 0
+        self.sink = sink
+        self.stats: Stats = stats if stats is not None else Stats()
+
+        self._dungeons: dict = {}
+        self._lock = threading.Lock()
+
+    def child_seed(self, index: int) -> int:
+        """Seed of an independent part of the run (e.g. one polygon)"""
+        return (self.seed + index) % 2**32
+
+    @property
+    def catalog(self) -> AssetCatalog:
+        if self._catalog is None:
+            self._catalog = default_catalog()
+        return self._catalog
+
+    def find_data(self, name: str) -> Optional[ModelData]:
+        return self.catalog.find_data(name)
+
+    def load_dungeon(self, filename: str):
+        """Parsed (polygons, polylines, assets) of a .ds file, read once per run"""
+        key = os.path.abspath(filename)
+        with self._lock:
+            if key in self._dungeons:
+                return self._dungeons[key]
+
+        dungeon = extract_points_dungeon.get_points_dungeon(filename)
+
+        with self._lock:
+            self._dungeons[key] = dungeon
+        return dungeon
+
+    def _resolve_collision(self, placement):
+        model_data = self.catalog.find_by_uuid(placement.uuid)
+        if model_data is None:
+            # Without bounds there is nothing to test against
+            return placement
+
+        footprint = footprint_from_model(model_data, placement.position, placement.rotation, placement.scale)
+        link = placement.link
+        with self._lock:
+            pieces = self._chains.setdefault(link.chain, {}) if link is not None else {}
+            ignore = {pieces[index] for index in link.neighbours() if index in pieces} if link is not None else set()
+            if self.collision_mode == "nudge":
+                resolved = self.collision.resolve(footprint, ignore=ignore)
+            else:
+                resolved = footprint if self.collision.try_insert(footprint, ignore) else None
+
+            if resolved is None:
+                self.rejected += 1
+                self.stats.count("placements_rejected")
+                return None
+            if link is not None:
+                pieces[link.index] = len(self.collision) - 1
+
+        if resolved is not footprint:
+            offset = Vector3([resolved.x - footprint.x, 0.0, resolved.z - footprint.z])
+            placement = placement._replace(position=placement.position + offset)
+        return placement
+
+    def emit(self, placement) -> Optional[str]:
+        """
+        Writes the placement, returns None when it was rejected by the collision grid
+
+        Returns:
+            The written file, or the MapKey of the object when a sink is set
+        """
+        if self.collision is not None and placement.name not in self.collision_exempt:
+            placement = self._resolve_collision(placement)
+            if placement is None:
+                return None
+
+        emitted = self.stats.count("objects_emitted")
+        self.stats.progress("Generated objects", emitted)
+
+        if self.sink is not None:
+            map_key = create_lsx.generate_uuid()
+            name = self.names.allocate(placement.name)
+            with self._lock:
+                self.sink.add(placement, map_key, name, self.level_name)
+            return map_key
+
+        path = create_lsx.create_xml(
+            self.output_folder,
+            name=placement.name,
+            level_name=self.level_name,
+            uuid=placement.uuid,
+            position=placement.position,
+            rotation=placement.rotation,
+            scale=placement.scale,
+            names=self.names,
+        )
+        self.stats.count("files_created")
+        self.stats.count("bytes_written", os.path.getsize(path))
+        return path
+
+    def emit_all(self, placements) -> None:
+        for placement in placements:
+            self.emit(placement)
+
+    def close(self):
+        """Writes what the sink holds, nothing to do when objects are written one by one"""
+        if self.sink is None:
+            return None
+
+        with self.stats.stage("write_lsx"):
+            index = self.sink.write()
+        for entry in index["sectors"]:
+            self.stats.count("files_created")
+            self.stats.count("bytes_written", os.path.getsize(os.path.join(self.sink.folder, entry["file"])))
+        return index
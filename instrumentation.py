@@ -0,0 +1,207 @@
+"""
+Stage timings, counters and progress output of a generation run.
+
+A Stats object is owned by the GenerationContext of the run. Stages are timed
+with `with stats.stage("name"):`, counters are bumped with stats.count(), and
+progress lines are printed at most once per interval however often progress()
+is called. report() gives everything as a dict, write_report() saves it as JSON.
+
+Profiling is switched on from the environment, without code edits:
+    BG3_PROFILE=1 (or a comma separated list of stage names) dumps a cProfile
+        .prof file per stage in BG3_PROFILE_DIR (profiles/ by default)
+    BG3_TRACEMALLOC=1 records the peak traced memory of every stage and the
+        top allocation sites of the run
+"""
+
+import cProfile
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+PROFILE_ENV = "BG3_PROFILE"
+PROFILE_DIR_ENV = "BG3_PROFILE_DIR"
+TRACEMALLOC_ENV = "BG3_TRACEMALLOC"
+DEFAULT_PROFILE_DIR = "profiles"
+
+# Seconds between two progress lines
+PROGRESS_INTERVAL = 1.0
+# Allocation sites kept in the report when tracemalloc is on
+TRACEMALLOC_TOP = 10
+
+
+def _enabled(value: Optional[str]) -> bool:
+    return bool(value) and value.strip().lower() not in ("0", "false", "no", "off")
+
+
+def profiled_stages(value: Optional[str]) -> Optional[set[str]]:
+    """Stages named by BG3_PROFILE, an empty set meaning every stage, None when off"""
+    if not _enabled(value):
+        return None
+    names = {name.strip() for name in value.split(",")}
+    if names & {"1", "true", "yes", "on", "all"}:
+        return set()
+    return names
+
+
+class _Frame:
+    __slots__ = ("name", "start", "peak", "profiler")
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.start: float = time.perf_counter()
+        self.peak: int = 0
+        self.profiler: Optional[cProfile.Profile] = None
+
+
+class Stats:
+    """Timers, counters and progress of one run, safe to share between threads"""
+
+    def __init__(
+        self,
+        progress_interval: float = PROGRESS_INTERVAL,
+        profile: Optional[str] = None,
+        profile_dir: Optional[str] = None,
+        trace_memory: Optional[bool] = None,
+    ) -> None:
+        """
+        Args:
+            progress_interval: Seconds between two progress lines, 0 prints every call
+            profile: Stages to profile, read from BG3_PROFILE when None
+            profile_dir: Where the .prof files go, read from BG3_PROFILE_DIR when None
+            trace_memory: Records memory peaks with tracemalloc, read from BG3_TRACEMALLOC when None
+        """
+        self.started: float = time.perf_counter()
+        self.stages: dict[str, dict] = {}
+        self.counters: dict[str, int] = {}
+        self.progress_interval: float = progress_interval
+        self._last_progress: dict[str, float] = {}
+
+        self.profile: Optional[set[str]] = profiled_stages(os.environ.get(PROFILE_ENV) if profile is None else profile)
+        self.profile_dir: str = profile_dir or os.environ.get(PROFILE_DIR_ENV, DEFAULT_PROFILE_DIR)
+        self.profiles: list[str] = []
+        # Only one cProfile can run at a time, nested stages are covered by the outer one
+        self._profiling: bool = False
+
+        if trace_memory is None:
+            trace_memory = _enabled(os.environ.get(TRACEMALLOC_ENV))
+        self.trace_memory: bool = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> list[_Frame]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Times the block, nested stages are reported as parent/child"""
+        stack = self._stack()
+        path = "/".join([frame.name for frame in stack] + [name])
+        frame = _Frame(path)
+
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+
+        with self._lock:
+            start_profile = self.profile is not None and not self._profiling and (not self.profile or name in self.profile)
+            if start_profile:
+                self._profiling = True
+        if start_profile:
+            frame.profiler = cProfile.Profile()
+            frame.profiler.enable()
+
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            seconds = time.perf_counter() - frame.start
+
+            if frame.profiler is not None:
+                frame.profiler.disable()
+                try:
+                    self._dump_profile(frame)
+                finally:
+                    # A failed dump must not keep every later stage from being profiled
+                    with self._lock:
+                        self._profiling = False
+
+            peak = None
+            if self.trace_memory:
+                peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+                if stack:
+                    stack[-1].peak = max(stack[-1].peak, peak)
+
+            with self._lock:
+                record = self.stages.setdefault(path, {"calls": 0, "seconds": 0.0})
+                record["calls"] += 1
+                record["seconds"] += seconds
+                if peak is not None:
+                    record["peak_traced_mb"] = max(record.get("peak_traced_mb", 0.0), peak / (1024 * 1024))
+
+    def _dump_profile(self, frame: _Frame) -> None:
+        os.makedirs(self.profile_dir, exist_ok=True)
+        filename = frame.name.replace("/", "__") + f"_{len(self.profiles)}.prof"
+        path = os.path.join(self.profile_dir, filename)
+        frame.profiler.dump_stats(path)
+        with self._lock:
+            self.profiles.append(path)
+
+    def count(self, name: str, amount: int = 1) -> int:
+        with self._lock:
+            value = self.counters.get(name, 0) + amount
+            self.counters[name] = value
+            return value
+
+    def progress(self, label: str, done: int, total: Optional[int] = None, force: bool = False) -> bool:
+        """Prints "label: done[/total] (rate/s)" unless a line for label was printed less than an interval ago"""
+        now = time.perf_counter()
+        with self._lock:
+            last = self._last_progress.get(label)
+            if not force and last is not None and now - last < self.progress_interval:
+                return False
+            self._last_progress[label] = now
+
+        rate = done / max(now - self.started, 1e-9)
+        amount = f"{done}/{total}" if total is not None else f"{done}"
+        print(f"{label}: {amount} ({rate:.0f}/s)")
+        return True
+
+    def report(self) -> dict:
+        report = {
+            "seconds": time.perf_counter() - self.started,
+            "stages": {name: dict(values) for name, values in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+        if self.profiles:
+            report["profiles"] = list(self.profiles)
+        if self.trace_memory and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            report["top_allocations"] = [
+                {"site": str(statistic.traceback), "mb": statistic.size / (1024 * 1024), "count": statistic.count}
+                for statistic in snapshot.statistics("lineno")[:TRACEMALLOC_TOP]
+            ]
+        return report
+
+    def write_report(self, path: str) -> dict:
+        report = self.report()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return report
+
+    def print_summary(self) -> None:
+        for name, values in self.stages.items():
+            print(f"{name:<32} {values['seconds']:9.3f} s  x{values['calls']}")
+        for name, value in self.counters.items():
+            print(f"{name:<32} {value}")
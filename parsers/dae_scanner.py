@@ -0,0 +1,151 @@
+"""
+Fast bounds of .dae models without building a pycollada document.
+
+Only the <float_array> of the sources referenced as POSITION by each mesh
+<vertices> is converted, in one NumPy call per mesh. Materials, scenes,
+normals, UVs and index lists are skipped.
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+
+def _local(tag: str) -> str:
+    # COLLADA files are namespaced, only the local name matters here
+    return tag.rsplit("}", 1)[-1]
+
+
+def scan_positions(path: str) -> list[npt.NDArray[np.float64]]:
+    """Vertex positions (N, 3) of every mesh of a .dae file"""
+    meshes = []
+
+    # Raw text of the float arrays of the current mesh, converted only if they are positions
+    sources: dict[str, tuple[str, int, int]] = {}
+    position_sources: list[str] = []
+
+    for _, element in ET.iterparse(path, events=("end",)):
+        tag = _local(element.tag)
+
+        if tag == "source":
+            float_array = None
+            accessor = None
+            for child in element.iter():
+                child_tag = _local(child.tag)
+                if child_tag == "float_array":
+                    float_array = child
+                elif child_tag == "accessor":
+                    accessor = child
+
+            if float_array is not None and element.get("id"):
+                stride = int(accessor.get("stride", 1)) if accessor is not None else 3
+                count = int(accessor.get("count", 0)) if accessor is not None else 0
+                sources[element.get("id")] = (float_array.text or "", stride, count)
+            element.clear()
+
+        elif tag == "vertices":
+            for child in element:
+                if _local(child.tag) == "input" and child.get("semantic") == "POSITION":
+                    position_sources.append(child.get("source", "").lstrip("#"))
+
+        elif tag == "mesh":
+            for source_id in position_sources:
+                if source_id not in sources:
+                    continue
+                text, stride, count = sources[source_id]
+                values = np.fromstring(text, dtype=np.float64, sep=" ")
+                if stride < 3 or values.size < stride:
+                    continue
+                rows = values.size // stride if count == 0 else min(count, values.size // stride)
+                meshes.append(values[:rows * stride].reshape(rows, stride)[:, :3])
+
+            sources.clear()
+            position_sources.clear()
+            element.clear()
+
+    return meshes
+
+
+def aabb(points: npt.NDArray[np.float64]) -> tuple[list[float], list[float]]:
+    """(size, center) of the axis aligned box, same convention as extract_bounds"""
+    mins = points.min(axis=0)
+    maxs = points.max(axis=0)
+    return (maxs - mins).tolist(), ((mins + maxs) * 0.5).tolist()
+
+
+def footprint_hull(points: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Convex hull (counter-clockwise) of the X/Z footprint, Y being up"""
+    xz = np.unique(points[:, [0, 2]], axis=0)
+    if len(xz) < 3:
+        return xz
+
+    def cross(o, a, b) -> float:
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    # Andrew's monotone chain, np.unique already sorted the points by x then z
+    lower: list = []
+    for p in xz:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+
+    upper: list = []
+    for p in xz[::-1]:
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+
+    return np.array(lower[:-1] + upper[:-1])
+
+
+def oriented_box(points: npt.NDArray[np.float64]) -> dict[str, object]:
+    """
+    Smallest area box around the footprint, rotated around Y, with the
+    height taken from the Y range
+
+    Returns:
+        {"angle": radians around Y, "size": [x, y, z], "center": [x, y, z]}
+        where size x/z are measured along the rotated axes
+    """
+    hull = footprint_hull(points)
+    y_min, y_max = float(points[:, 1].min()), float(points[:, 1].max())
+
+    if len(hull) < 3:
+        size, center = aabb(points)
+        return {"angle": 0.0, "size": size, "center": center}
+
+    # The best rectangle has one side on a hull edge, all edges are tried at once
+    edges = np.roll(hull, -1, axis=0) - hull
+    angles = np.unique(np.mod(np.arctan2(edges[:, 1], edges[:, 0]), np.pi / 2))
+
+    cos, sin = np.cos(angles), np.sin(angles)
+    # Hull points in the frame of every candidate angle: (angles, points)
+    u = hull[:, 0][np.newaxis, :] * cos[:, np.newaxis] + hull[:, 1][np.newaxis, :] * sin[:, np.newaxis]
+    v = -hull[:, 0][np.newaxis, :] * sin[:, np.newaxis] + hull[:, 1][np.newaxis, :] * cos[:, np.newaxis]
+    u_min, u_max = u.min(axis=1), u.max(axis=1)
+    v_min, v_max = v.min(axis=1), v.max(axis=1)
+
+    best = int(np.argmin((u_max - u_min) * (v_max - v_min)))
+    angle = float(angles[best])
+    u_center = (u_min[best] + u_max[best]) * 0.5
+    v_center = (v_min[best] + v_max[best]) * 0.5
+
+    return {
+        "angle": angle,
+        "size": [float(u_max[best] - u_min[best]), y_max - y_min, float(v_max[best] - v_min[best])],
+        "center": [
+            float(u_center * np.cos(angle) - v_center * np.sin(angle)),
+            (y_min + y_max) * 0.5,
+            float(u_center * np.sin(angle) + v_center * np.cos(angle)),
+        ],
+    }
+
+
+def analyze_dae_fast(path: str) -> Optional[npt.NDArray[np.float64]]:
+    """Every vertex position of the model stacked in one array, None when there is no mesh"""
+    meshes = scan_positions(path)
+    if not meshes:
+        return None
+    return np.concatenate(meshes)
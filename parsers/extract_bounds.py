@@ -1,7 +1,14 @@
 import os
-import collada
 import numpy as np
 import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+
+try:
+    from . import dae_scanner
+except ImportError:
+    # Run as a script, parsers/ is the first entry of sys.path
+    import dae_scanner
 
 ROOT = r"C:\Users\andre\Downloads\bg3-modders-multitool\UnpackedData\Models\Generated\Public\SharedDev\Assets\Output"
 
@@ -12,7 +19,24 @@ OUTPUT_JSON = os.path.join(
     "bounds"
 )
 
-def analyze_dae(path):
+# One JSON line per analysed model, appended as soon as the result is known
+CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "data_unpacked",
+    "bounds_cache.jsonl"
+)
+
+WORKERS = os.cpu_count() or 1
+
+# Also run pycollada on every model and report where the fast scanner disagrees
+VALIDATE_FAST_PATH = False
+# Adds the Y-rotated minimal box and the convex hull of the X/Z footprint to every entry
+EXTRACT_FOOTPRINT = False
+
+def analyze_dae_collada(path):
+    import collada
+
     mins = np.array([np.inf, np.inf, np.inf])
     maxs = np.array([-np.inf, -np.inf, -np.inf])
 
@@ -36,48 +60,197 @@ def analyze_dae(path):
 
     return size, center
 
+def analyze_dae_details(path) -> Optional[dict]:
+    """
+    Bounds of a model, read by the streaming scanner and by pycollada only
+    when the scanner cannot handle the file
+    """
+    try:
+        points = dae_scanner.analyze_dae_fast(path)
+    except Exception:
+        points = None
 
-results = {}
+    if points is None:
+        analysis = analyze_dae_collada(path)
+        if analysis is None:
+            return None
+        return {"size": analysis[0], "center_offset": analysis[1]}
 
-# Find Output* directories
-for d in os.listdir(ROOT):
-    output_dir = os.path.join(ROOT, d)
+    size, center = dae_scanner.aabb(points)
+    details = {"size": size, "center_offset": center}
 
-    for root, _, files in os.walk(output_dir):
-        for file in files:
-            if not file.lower().endswith(".dae"):
-                continue
-            
-            dae_path = os.path.join(root, file)
+    if VALIDATE_FAST_PATH:
+        expected = analyze_dae_collada(path)
+        if expected is None or not np.allclose(expected, (size, center), atol=1e-4):
+            print(f"⚠️ Fast scanner mismatch on {path}: {(size, center)} != {expected}")
+            if expected is None:
+                return None
+            details = {"size": expected[0], "center_offset": expected[1]}
+
+    if EXTRACT_FOOTPRINT:
+        details["oriented_box"] = dae_scanner.oriented_box(points)
+        details["footprint"] = dae_scanner.footprint_hull(points).tolist()
+
+    return details
+
+def analyze_dae(path):
+    details = analyze_dae_details(path)
+    if details is None:
+        return None
+    return details["size"], details["center_offset"]
+
+def analyze_job(dae_path: str) -> tuple[str, Optional[dict], Optional[str]]:
+    """Runs in a worker, errors are returned instead of raised so they end up in the cache"""
+    try:
+        return dae_path, analyze_dae_details(dae_path), None
+    except Exception as e:
+        return dae_path, None, f"{type(e).__name__}: {e}"
+
+
+def find_dae_files(root: str) -> dict[str, tuple[str, int, int]]:
+    """{relative_path: (absolute path, mtime_ns, size)} of every .dae under the Output* directories"""
+    dae_files = {}
+    for d in os.listdir(root):
+        output_dir = os.path.join(root, d)
+
+        for folder, _, files in os.walk(output_dir):
+            for file in files:
+                if not file.lower().endswith(".dae"):
+                    continue
+
+                dae_path = os.path.join(folder, file)
+                stat = os.stat(dae_path)
 
+                # Path after Output*
+                relative_path = os.path.relpath(dae_path, root).replace("\\", "/").removeprefix("Output")
+                dae_files[relative_path] = (dae_path, stat.st_mtime_ns, stat.st_size)
+
+    return dae_files
+
+def load_cache(path: str) -> dict[str, dict]:
+    """Last cached record of every relative path, a truncated last line (interrupted run) is ignored"""
+    cache = {}
+    if not os.path.exists(path):
+        return cache
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
             try:
-                analysis = analyze_dae(dae_path)
-            except Exception:
+                record = json.loads(line)
+            except json.JSONDecodeError:
                 continue
+            cache[record["relative_path"]] = record
+    return cache
 
-            if analysis is None:
-                continue
+def write_cache(path: str, cache: dict[str, dict]) -> None:
+    """Rewrites the cache with a single line per model"""
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        for record in cache.values():
+            f.write(json.dumps(record) + "\n")
+    os.replace(temp_path, path)
+
+def end_with_newline(path: str) -> None:
+    """Terminates a last line cut by an interrupted run, so the next record starts on its own line"""
+    if not os.path.exists(path):
+        return
+
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
 
-            size, center = analysis
-
-            # Path after Output*
-            relative_path = os.path.relpath(dae_path, ROOT).replace("\\", "/").removeprefix("Output")
-            file_name = relative_path.split("/")[0]
-            print("Appending to ",file)
-            if file_name not in results:
-                results[file_name] = []
-            
-            results[file_name].append({
-                "name": file,
+def is_cached(record: Optional[dict], mtime_ns: int, size: int) -> bool:
+    return record is not None and record["mtime_ns"] == mtime_ns and record["file_size"] == size
+
+
+def update_cache(dae_files: dict[str, tuple[str, int, int]], cache: dict[str, dict], cache_path: str) -> None:
+    todo = {
+        dae_path: (relative_path, mtime_ns, size)
+        for relative_path, (dae_path, mtime_ns, size) in dae_files.items()
+        if not is_cached(cache.get(relative_path), mtime_ns, size)
+    }
+    print(f"{len(dae_files)} models found, {len(dae_files) - len(todo)} cached, {len(todo)} to analyse")
+    if not todo:
+        return
+
+    failed = 0
+    end_with_newline(cache_path)
+    with open(cache_path, "a", encoding="utf-8") as cache_file, \
+            ProcessPoolExecutor(max_workers=WORKERS) as pool:
+        futures = [pool.submit(analyze_job, dae_path) for dae_path in todo]
+        for future in as_completed(futures):
+            dae_path, details, error = future.result()
+            relative_path, mtime_ns, size = todo[dae_path]
+
+            record = {
                 "relative_path": relative_path,
-                "size": size,
-                "center_offset": center
-            })
+                "mtime_ns": mtime_ns,
+                "file_size": size,
+                "size": None,
+                "center_offset": None,
+                "error": error,
+            }
+            if details:
+                record.update(details)
+            cache[relative_path] = record
+
+            # Flushed right away so an interrupted run resumes from here
+            cache_file.write(json.dumps(record) + "\n")
+            cache_file.flush()
+
+            if error:
+                failed += 1
+                print(f"Failed {relative_path}: {error}")
+            else:
+                print("Analysed ", os.path.basename(dae_path))
+
+    if failed:
+        print(f"{failed} models could not be analysed, they are retried once the file changes")
+
+
+def main() -> None:
+    dae_files = find_dae_files(ROOT)
+    cache = load_cache(CACHE_PATH)
+
+    update_cache(dae_files, cache, CACHE_PATH)
+
+    # Models that disappeared from disk are dropped from the cache
+    cache = {relative_path: cache[relative_path] for relative_path in dae_files if relative_path in cache}
+    write_cache(CACHE_PATH, cache)
+
+    results = {}
+    for relative_path in sorted(cache):
+        record = cache[relative_path]
+        if record["size"] is None:
+            continue
+
+        file_name = relative_path.split("/")[0]
+        if file_name not in results:
+            results[file_name] = []
+
+        entry = {
+            "name": os.path.basename(relative_path),
+            "relative_path": relative_path,
+            "size": record["size"],
+            "center_offset": record["center_offset"]
+        }
+        for key in ("oriented_box", "footprint"):
+            if key in record:
+                entry[key] = record[key]
+        results[file_name].append(entry)
+
+    for key,val in results.items():
+        output_path = os.path.join(OUTPUT_JSON, "my_" + key)
+        # Write JSON
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(val, f, indent=2)
 
+        print(f"Wrote {len(val)} entries to {output_path}")
 
-for key,val in results.items():
-    # Write JSON
-    with open(os.path.join(OUTPUT_JSON,"my_"+ key), "w", encoding="utf-8") as f:
-        json.dump(val, f, indent=2)
 
-    print(f"Wrote {len(results)} entries to {os.path.join(OUTPUT_JSON,"MY",key)}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
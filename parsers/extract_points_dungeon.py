@@ -1,79 +1,114 @@
-import re
 import json
-from pyrr import Vector3, Quaternion
-import math
+from typing import NamedTuple
+import numpy as np
+import numpy.typing as npt
 ##############################################
 # https://www.dungeonscrawl.com/
 # Using this website to generate the dungeon
 ##############################################
-dict_ids = {}
 SCALE = (26.5 / 953.98) * 2# ≈ 0.02778
 
-def force_better_scale(polygons):
-    scaled_polygons = []
+# Dungeon Scrawl x/y -> level x/z, Z is inversed so we get a better result in viewing inside the editor
+AXIS_SCALE = np.array([SCALE, -SCALE])
 
-    for polygon in polygons:
-        scaled_polygon = []
 
-        for x, z in polygon:
-            scaled_polygon.append((
-                x * SCALE,
-                - z * SCALE # Force Z to be inversed so we get a better result in viewing inside the editor
-            ))
+class AssetInstances(NamedTuple):
+    """Every placed image of the map, one row per instance"""
+    asset_ids: list[str]
+    names: list[str]                    # name of the asset (the model to place)
+    nicknames: list[str]                # name given to the instance in the editor
+    positions: npt.NDArray[np.float64]  # (N, 3) x, y, z already scaled
+    angles: npt.NDArray[np.float64]     # (N,) radians around Y
+    scales: npt.NDArray[np.float64]     # (N,)
 
-        scaled_polygons.append(scaled_polygon)
+    def __len__(self) -> int:
+        return len(self.asset_ids)
+
+
+def force_better_scale(polygon):
+    """Scales a list of (x, y) lines in one NumPy pass, returns one (N, 2) array per line"""
+    lines = [np.asarray(line, dtype=np.float64).reshape(-1, 2) for line in polygon]
+    if not lines:
+        return []
+
+    scaled = np.concatenate(lines) * AXIS_SCALE
+    return np.split(scaled, np.cumsum([len(line) for line in lines])[:-1])
+
+
+def walk_document(document):
+    """
+    Walks the decoded document once
+
+    Returns:
+        geometries: dicts holding "polygons" and "polylines", in document order
+        asset_names: {asset id: asset name} of the dicts with an id, a name and dimensions
+        images: dicts with a name, an assetId and a transform
+    """
+    geometries = []
+    asset_names = {}
+    images = []
+
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+
+        if "polygons" in node and "polylines" in node:
+            geometries.append(node)
+            # Only points below, no need to walk them
+            continue
+        if "id" in node and "name" in node and "dimensions" in node:
+            asset_names[node["id"]] = node["name"]
+        if "assetId" in node and "transform" in node:
+            images.append(node)
+
+        stack.extend(reversed(list(node.values())))
+
+    return geometries, asset_names, images
+
+
+def extract_images_objects(asset_names, images) -> AssetInstances:
+    """Placed images whose asset is known, the 2D affine transform converted to a Y rotation"""
+    known = [image for image in images if asset_names.get(image["assetId"])]
+    transforms = np.array([image["transform"] for image in known], dtype=np.float64).reshape(-1, 6)
+
+    a, b = transforms[:, 0], transforms[:, 1]
+    tx, ty = transforms[:, 4], transforms[:, 5]
+
+    positions = np.column_stack((tx * SCALE, np.zeros(len(known)), -ty * SCALE))
+    return AssetInstances(
+        asset_ids=[image["assetId"] for image in known],
+        names=[asset_names[image["assetId"]] for image in known],
+        nicknames=[image.get("name", "") for image in known],
+        positions=positions,
+        angles=np.arctan2(b, a),
+        scales=np.hypot(a, b),
+    )
 
-    return scaled_polygons
 
 def get_points_dungeon(filename):
-    with open(filename,"r") as f:
-        str_found = f.read()
-        
-    extract_images_objects(str_found)
-
-    match_polygons = re.search(r'\{("polygons":.*?),"polylines":', str_found)
-    points = "{" + match_polygons.groups()[0] + "}"
-
-    match_polylines = re.search(r'("polylines":.*?)\}', str_found)
-    polylines = "{" + match_polylines.groups()[0] + "}"
-    
-    data_polygons: list[list[list[tuple[float, float]]]] = json.loads(points)["polygons"]
-    data_polylines: list[list[tuple[float, float]]] = json.loads(polylines)["polylines"]
-    
-    parsed_data_polygons = []
-    for a in data_polygons:
-        parsed_data_polygons.append(force_better_scale(a))
-
-    parsed_data_polylines = force_better_scale(data_polylines)
-    
-    return (parsed_data_polygons,parsed_data_polylines)
-
-def extract_images_objects(str_found):
-    pattern_id_name = r'"id":"([^"]+)","name":"([^"]+)",([^{]*"dimensions")'
-    
-    matches = re.findall(pattern_id_name, str_found)
-    for assetId, name,_ in matches:
-        dict_ids[assetId] = name
-
-    pattern_all_images = r'"name":"([^"]*)"[^}]*'+ \
-                         r'"assetId":"([^"]*)"[^}]*'+ \
-                         r'"transform":\[([^\]]+)\]'
-    
-    all_match_transforms = re.findall(pattern_all_images,str_found)
-    for nickname,assetId,transform in all_match_transforms:
-        if dict_ids[assetId]:
-            true_name = dict_ids[assetId]
-            a, b, c, d, tx, ty = transform.split(",")
-            a = float(a)
-            b = float(b)
-            tx = float(tx)
-            ty = float(ty)
-            
-            position = Vector3([tx * SCALE, 0, - ty * SCALE])
-
-            angle_radians = math.atan2(b, a)
-            rotation = Quaternion.from_y_rotation(angle_radians)
-            scale_found = math.sqrt(a*a + b*b)
-            
-            dict_ids[assetId] = [true_name,position,rotation,scale_found,nickname]
-    
\ No newline at end of file
+    """
+    Returns:
+        polygons: list of polygons, each a list of (N, 2) x/z lines
+        polylines: list of (N, 2) x/z lines
+        assets: AssetInstances of the placed images
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        document = json.load(f)
+
+    geometries, asset_names, images = walk_document(document)
+    assets = extract_images_objects(asset_names, images)
+
+    if not geometries:
+        return ([], [], assets)
+
+    # The first geometry holds the dungeon outline
+    geometry = geometries[0]
+    parsed_data_polygons = [force_better_scale(polygon) for polygon in geometry["polygons"]]
+    parsed_data_polylines = force_better_scale(geometry["polylines"])
+
+    return (parsed_data_polygons, parsed_data_polylines, assets)
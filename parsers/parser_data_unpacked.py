@@ -1,51 +1,113 @@
 import os
-import re
-from typing import Dict
 import json
-from collections import defaultdict
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, TextIO
 
-UUID_PATTERN = re.compile(
-    r'<attribute id="MapKey".*?value="([0-9a-fA-F-]{36})"[.\s\S]*?' +
-    r'<attribute id="Name".*?value="(.*?)"[.\s\S]*?' +
-    r'<attribute id="Type".*?value="(.*?)"'
-)
+# Files are parsed in parallel, one file per task
+WORKERS = os.cpu_count() or 1
 
 
-grouped: dict[str, list[dict[str, str]]] = defaultdict(list)
+def iter_game_objects(path: str) -> Iterator[tuple[str, str, str]]:
+    """
+    Yields (type, name, uuid) for every GameObjects node of a .lsx file
 
-def insert_attributes_into_dict(xml: str) -> None:
+    The attributes are read from the node itself, so a MapKey can never be
+    paired with the Name or Type of another node. Processed nodes are removed
+    from the tree, memory stays flat no matter the size of the file.
+    """
+    stack: list[ET.Element] = []
 
-    for match in UUID_PATTERN.finditer(xml):
-        uuid = match.group(1)
-        name = match.group(2)
-        type_object = match.group(3)
+    for event, element in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            stack.append(element)
+            continue
+
+        stack.pop()
+        if element.tag != "node" or element.get("id") != "GameObjects":
+            continue
+
+        attributes = {
+            attribute.get("id"): attribute.get("value")
+            for attribute in element.iterfind("attribute")
+        }
+        map_key = attributes.get("MapKey")
+        name = attributes.get("Name")
+        type_object = attributes.get("Type")
+
+        if stack:
+            stack[-1].remove(element)
+        element.clear()
+
+        if map_key and name is not None and type_object:
+            yield type_object, name, map_key
+
+
+def extract_file(path: str) -> list[tuple[str, str, str]]:
+    return list(iter_game_objects(path))
 
-        grouped[type_object].append({
-            "name": name,
-            "uuid": uuid,
-        })
+
+class GroupedJsonWriter:
+    """
+    Writes one JSON list per type as the entries arrive, formatted the same
+    way as json.dump(entries, indent=4)
+    """
+
+    def __init__(self, folder: str) -> None:
+        self.folder: str = folder
+        self.files: dict[str, TextIO] = {}
+        self.counts: dict[str, int] = {}
+
+    def add(self, type_object: str, entry: dict[str, str]) -> None:
+        file = self.files.get(type_object)
+        if file is None:
+            path = os.path.join(self.folder, f"{type_object}.json")
+            file = open(path, "w", encoding="utf-8")
+            file.write("[\n")
+            self.files[type_object] = file
+            self.counts[type_object] = 0
+        else:
+            file.write(",\n")
+
+        text = json.dumps(entry, indent=4, ensure_ascii=False)
+        file.write("\n".join("    " + line for line in text.split("\n")))
+        self.counts[type_object] += 1
+
+    def close(self) -> None:
+        for file in self.files.values():
+            file.write("\n]")
+            file.close()
+        self.files.clear()
 
 
 def main() -> None:
     base_dir = "data_unpacked"
+    output_dir = os.path.join(base_dir, "output")
+    os.makedirs(output_dir, exist_ok=True)
 
-    for filename in os.listdir(base_dir):
-        if not filename.lower().endswith(".lsx"):
-            continue
-
-        path = os.path.join(base_dir, filename)
+    paths = [
+        os.path.join(base_dir, filename)
+        for filename in sorted(os.listdir(base_dir))
+        if filename.lower().endswith(".lsx")
+    ]
 
-        with open(path, "r", encoding="utf-8") as file:
-            xml = file.read()
-        
-        insert_attributes_into_dict(xml)
-    
-    for type_object, entries in grouped.items():
-        output_path = os.path.join(base_dir, f"output/{type_object}.json")
+    writer = GroupedJsonWriter(output_dir)
+    try:
+        with ProcessPoolExecutor(max_workers=max(1, min(WORKERS, len(paths)))) as pool:
+            # Results come back in file order, every file is written as soon as it is parsed
+            for path, game_objects in zip(paths, pool.map(extract_file, paths)):
+                for type_object, name, uuid in game_objects:
+                    writer.add(type_object, {
+                        "name": name,
+                        "uuid": uuid,
+                    })
+                print(f"Parsed {os.path.basename(path)}: {len(game_objects)} objects")
+    finally:
+        writer.close()
 
-        with open(output_path, "w", encoding="utf-8") as file:
-            json.dump(entries, file, indent=4, ensure_ascii=False)
+    for type_object, count in writer.counts.items():
+        print(f"{type_object}: {count} entries")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,148 @@
+"""
+Arc-length resampling of polylines with NumPy.
+
+All polylines are processed at once: the cumulative arc length runs over
+every segment and pieces are spread along it, also across gentle vertices.
+Sharp corners split a polyline into runs. Every run is covered by pieces of
+length `spacing`, centred on their sample: the first one starts on the start
+of the run, the last one ends on its end, and the length left over is shared
+by the overlaps between the pieces in between, so nothing sticks out past a
+corner. Closed polylines start on their first sharp corner, so the closing
+vertex is a corner like any other.
+"""
+
+from typing import NamedTuple, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+# Segments shorter than this are dropped before sampling
+MIN_SEGMENT_LENGTH = 1e-6
+
+
+class TransformBatch(NamedTuple):
+    positions: npt.NDArray[np.float64]  # (N, 3) x, y, z, centre of the piece
+    angles: npt.NDArray[np.float64]     # (N,) heading in degrees, atan2(dz, dx) like build_walls
+    polyline: npt.NDArray[np.int64]     # (N,) index of the source polyline
+    corner: npt.NDArray[np.bool_]       # (N,) first piece of a run, after a polyline start or a sharp corner
+    starts: npt.NDArray[np.float64]     # (N, 3) where the piece starts, on the corner for the first piece of a run
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+def _empty_batch() -> TransformBatch:
+    return TransformBatch(
+        np.empty((0, 3)), np.empty(0), np.empty(0, dtype=np.int64), np.empty(0, dtype=bool), np.empty((0, 3))
+    )
+
+
+def _start_on_corner(points: npt.NDArray[np.float64], corner_angle: float) -> npt.NDArray[np.float64]:
+    """Closed polyline turned to start on its first sharp corner, unchanged when it has none"""
+    ring = points[:-1]
+    vectors = np.roll(ring, -1, axis=0) - ring
+    lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+    keep = lengths > MIN_SEGMENT_LENGTH
+    if keep.sum() < 2:
+        return points
+
+    ring = ring[keep]
+    directions = vectors[keep] / lengths[keep][:, np.newaxis]
+    # Turn on every vertex, the closing one (vertex 0) included
+    cosine = np.clip((np.roll(directions, 1, axis=0) * directions).sum(axis=1), -1.0, 1.0)
+    corners = np.flatnonzero(np.degrees(np.arccos(cosine)) > corner_angle)
+    if len(corners) == 0:
+        return points
+
+    ring = np.roll(ring, -corners[0], axis=0)
+    return np.vstack((ring, ring[:1]))
+
+
+def resample_polylines(
+    polylines: Sequence[Sequence[Sequence[float]]],
+    spacing: float,
+    corner_angle: float = 30.0,
+    y: float = 0.0,
+) -> TransformBatch:
+    """
+    Samples every polyline every `spacing` along its length
+
+    Args:
+        polylines: List of polylines, each a list of (x, z) points. A polyline
+            whose last point is its first one is closed
+        spacing: Distance between two samples (e.g. the width of a wall piece)
+        corner_angle: Turns sharper than this (degrees) restart the spacing on the vertex
+        y: Height of the samples
+
+    Returns:
+        The centre of every piece. A run gets ceil(length / spacing) pieces,
+        the first one starting on the start of the run and the last one
+        ending on its end. A run shorter than `spacing` gets a single piece
+        centred on it.
+    """
+    starts = []
+    ends = []
+    owners = []
+    for index, line in enumerate(polylines):
+        points = np.asarray(line, dtype=np.float64).reshape(-1, 2)
+        if len(points) < 2:
+            continue
+        if len(points) > 2 and np.allclose(points[0], points[-1]):
+            points = _start_on_corner(points, corner_angle)
+        starts.append(points[:-1])
+        ends.append(points[1:])
+        owners.append(np.full(len(points) - 1, index, dtype=np.int64))
+
+    if not starts:
+        return _empty_batch()
+
+    seg_start = np.concatenate(starts)
+    seg_vector = np.concatenate(ends) - seg_start
+    seg_owner = np.concatenate(owners)
+    seg_length = np.hypot(seg_vector[:, 0], seg_vector[:, 1])
+
+    keep = seg_length > MIN_SEGMENT_LENGTH
+    seg_start, seg_vector, seg_owner, seg_length = seg_start[keep], seg_vector[keep], seg_owner[keep], seg_length[keep]
+    if len(seg_start) == 0:
+        return _empty_batch()
+
+    seg_direction = seg_vector / seg_length[:, np.newaxis]
+    seg_heading = np.degrees(np.arctan2(seg_vector[:, 1], seg_vector[:, 0]))
+
+    # A run starts on the first segment of a polyline or after a sharp turn
+    turn = np.zeros(len(seg_start))
+    same_line = seg_owner[1:] == seg_owner[:-1]
+    cosine = np.clip((seg_direction[1:] * seg_direction[:-1]).sum(axis=1), -1.0, 1.0)
+    turn[1:] = np.degrees(np.arccos(cosine))
+    run_start = np.ones(len(seg_start), dtype=bool)
+    run_start[1:] = ~same_line | (turn[1:] > corner_angle)
+
+    run_first_segment = np.flatnonzero(run_start)
+    run_last_segment = np.append(run_first_segment[1:], len(seg_start)) - 1
+
+    # Global arc length, every segment starts where the previous one ended
+    seg_offset = np.concatenate(([0.0], np.cumsum(seg_length)[:-1]))
+    run_offset = seg_offset[run_first_segment]
+    run_length = seg_offset[run_last_segment] + seg_length[run_last_segment] - run_offset
+
+    # Pieces needed to cover the run, spread so the first and last ones end on the ends of the run
+    count = np.maximum(np.ceil(run_length / spacing - 1e-9), 1).astype(np.int64)
+    stride = np.where(count > 1, (run_length - spacing) / np.maximum(count - 1, 1), 0.0)
+    first_centre = np.where(count > 1, spacing / 2.0, run_length / 2.0)
+
+    sample_run = np.repeat(np.arange(len(count)), count)
+    first_sample = np.concatenate(([0], np.cumsum(count)[:-1]))
+    step = np.arange(len(sample_run)) - first_sample[sample_run]
+    centre = first_centre[sample_run] + step * stride[sample_run]
+    start = np.maximum(centre - spacing / 2.0, 0.0)
+
+    def locate(along_run):
+        arc = run_offset[sample_run] + along_run
+        segment = np.searchsorted(seg_offset, arc, side="right") - 1
+        segment = np.clip(segment, run_first_segment[sample_run], run_last_segment[sample_run])
+        xz = seg_start[segment] + seg_direction[segment] * (arc - seg_offset[segment])[:, np.newaxis]
+        return np.column_stack((xz[:, 0], np.full(len(xz), y), xz[:, 1])), segment
+
+    positions, segment = locate(centre)
+    starts, _ = locate(start)
+    return TransformBatch(positions, seg_heading[segment], seg_owner[segment], step == 0, starts)
@@ -0,0 +1,104 @@
+"""
+Simplification of the dungeon outlines before the walls are built.
+
+Dungeon Scrawl exports many nearly collinear vertices. Douglas-Peucker
+removes the ones closer than a tolerance to the simplified line, with the
+distances of a whole range computed in one NumPy call. Vertices turning
+sharper than a corner angle between two long enough segments are always
+kept so rooms keep their corners, jitter does not count.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+import polyline_sampler
+
+# Both segments of a guarded corner must be longer than this many times the tolerance
+CORNER_SEGMENT_FACTOR = 4.0
+
+
+def turn_angles(points: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Turn (degrees) at every interior vertex, 0 where a segment has no length"""
+    segments = np.diff(points, axis=0)
+    lengths = np.hypot(segments[:, 0], segments[:, 1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        directions = segments / lengths[:, np.newaxis]
+        cosine = (directions[1:] * directions[:-1]).sum(axis=1)
+    cosine = np.nan_to_num(np.clip(cosine, -1.0, 1.0), nan=1.0)
+    return np.degrees(np.arccos(cosine))
+
+
+def _segment_distances(points: npt.NDArray[np.float64], start: int, end: int) -> npt.NDArray[np.float64]:
+    """Distance of points[start+1:end] to the segment points[start] -> points[end]"""
+    a, b = points[start], points[end]
+    inner = points[start + 1:end]
+    ab = b - a
+    length_sq = ab @ ab
+    if length_sq == 0.0:
+        return np.hypot(*(inner - a).T)
+
+    t = np.clip((inner - a) @ ab / length_sq, 0.0, 1.0)
+    closest = a + t[:, np.newaxis] * ab
+    return np.hypot(*(inner - closest).T)
+
+
+def simplify_line(points, tolerance: float, corner_angle: float = 30.0) -> npt.NDArray[np.float64]:
+    """
+    Douglas-Peucker on one line
+
+    Args:
+        points: (N, 2) x/z points, a closed line repeats its first point at the end
+        tolerance: Largest distance (meters) a removed vertex may be from the result
+        corner_angle: Vertices turning sharper than this (degrees) are always kept,
+            unless one of their segments is shorter than CORNER_SEGMENT_FACTOR * tolerance
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) <= 2:
+        return points
+
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    segments = np.diff(points, axis=0)
+    lengths = np.hypot(segments[:, 0], segments[:, 1])
+    keep[1:-1] = (turn_angles(points) > corner_angle) & (np.minimum(lengths[1:], lengths[:-1]) > CORNER_SEGMENT_FACTOR * tolerance)
+
+    # Every range between two kept vertices is simplified on its own
+    anchors = np.flatnonzero(keep)
+    stack = list(zip(anchors[:-1].tolist(), anchors[1:].tolist()))
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        distances = _segment_distances(points, start, end)
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            index = start + 1 + farthest
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+
+    return points[keep]
+
+
+def simplify_polygons(polygons, tolerance: float, corner_angle: float = 30.0) -> list:
+    """Same nesting as get_points_dungeon: list of polygons, each a list of lines"""
+    return [[simplify_line(line, tolerance, corner_angle) for line in polygon] for polygon in polygons]
+
+
+def count_objects(polygons, spacing: float, corner_angle: float = 30.0) -> int:
+    """Objects build_walls places for these polygons: the wall pieces and a helper per corner"""
+    total = 0
+    for polygon in polygons:
+        batch = polyline_sampler.resample_polylines(polygon, spacing, corner_angle=corner_angle)
+        total += len(batch) + int(batch.corner.sum())
+    return total
+
+
+def simplification_report(before, after, spacing: float, corner_angle: float = 30.0) -> dict[str, int]:
+    """Vertex and object counts of the polygons before and after simplify_polygons"""
+    return {
+        "vertices_before": sum(len(line) for polygon in before for line in polygon),
+        "vertices_after": sum(len(line) for polygon in after for line in polygon),
+        "objects_before": count_objects(before, spacing, corner_angle),
+        "objects_after": count_objects(after, spacing, corner_angle),
+    }
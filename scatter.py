@@ -0,0 +1,391 @@
+"""
+Poisson-disk scatter of props (nature, decoration...) over an area.
+
+Bridson's algorithm with one radius per asset, taken from its bounds: a
+new sample is tried in a ring around an active one and accepted when no
+earlier sample is closer than the sum of both radii. The background grid
+holds at most one sample per cell, so checking candidates is a NumPy
+gather over the neighbouring cells.
+
+The area is a Region: a boolean raster built from dungeon polygons or the
+extent of a terrain grid, with the heights used for Y.
+"""
+
+import math
+from typing import Callable, NamedTuple, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+from pyrr import Vector3
+
+import corridor_generator
+
+# Candidates tried around an active sample before it is retired
+CANDIDATES = 30
+# Candidates tested per parent in one NumPy call, the next ones only for parents still looking
+CANDIDATE_CHUNK = 6
+
+
+class ScatterBatch(NamedTuple):
+    positions: npt.NDArray[np.float64]  # (N, 3) x, y, z
+    angles: npt.NDArray[np.float64]     # (N,) yaw in degrees
+    scales: npt.NDArray[np.float64]     # (N,)
+    asset: npt.NDArray[np.int64]        # (N,) index in the assets given to scatter
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+def radius_from_model(model_data, scale: float = 1.0, margin: float = 0.0) -> float:
+    """Radius of the circle around the X/Z footprint of a model"""
+    return 0.5 * math.hypot(model_data.offset_x, model_data.offset_z) * scale + margin
+
+
+def _even_odd_rows(rings, xs, zs) -> npt.NDArray[np.bool_]:
+    """Even-odd rule for every (z, x) cell center, one scanline per row"""
+    starts = np.concatenate([ring[:-1] for ring in rings])
+    ends = np.concatenate([ring[1:] for ring in rings])
+    z0, z1 = starts[:, 1], ends[:, 1]
+    inside = np.zeros((len(zs), len(xs)), dtype=bool)
+
+    for row, z in enumerate(zs):
+        crossing = (z0 <= z) != (z1 <= z)
+        if not crossing.any():
+            continue
+        a, b = starts[crossing], ends[crossing]
+        x_cross = np.sort(a[:, 0] + (z - a[:, 1]) * (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1]))
+        inside[row] = np.searchsorted(x_cross, xs) % 2 == 1
+    return inside
+
+
+class Region:
+    def __init__(
+        self,
+        origin: tuple[float, float],
+        resolution: float,
+        mask: npt.NDArray[np.bool_],
+        heights: Optional[npt.NDArray[np.float32]] = None,
+    ) -> None:
+        """
+        Args:
+            origin: World x/z of the center of mask[0, 0]
+            resolution: Size of a mask cell in meters
+            mask: (rows along z, columns along x) cells where props may go
+            heights: Height of every cell, same shape as mask, 0 when None
+        """
+        self.origin: npt.NDArray[np.float64] = np.asarray(origin, dtype=np.float64)
+        self.resolution: float = resolution
+        self.mask: npt.NDArray[np.bool_] = mask
+        self.heights: Optional[npt.NDArray[np.float32]] = heights
+
+    @classmethod
+    def from_polygons(cls, polygons, resolution: float = 0.25) -> "Region":
+        """Inside of the polygons of get_points_dungeon (lists of x/z rings, holes included)"""
+        rings = [np.asarray(ring, dtype=np.float64).reshape(-1, 2) for polygon in polygons for ring in polygon]
+        rings = [ring if np.allclose(ring[0], ring[-1]) else np.vstack((ring, ring[:1])) for ring in rings if len(ring) >= 3]
+        if not rings:
+            return cls((0.0, 0.0), resolution, np.zeros((0, 0), dtype=bool))
+
+        points = np.concatenate(rings)
+        low = points.min(axis=0)
+        high = points.max(axis=0)
+        xs = np.arange(low[0] + resolution * 0.5, high[0], resolution)
+        zs = np.arange(low[1] + resolution * 0.5, high[1], resolution)
+        return cls((xs[0] if len(xs) else low[0], zs[0] if len(zs) else low[1]), resolution, _even_odd_rows(rings, xs, zs))
+
+    @classmethod
+    def from_terrain(
+        cls,
+        grid: npt.NDArray[np.float32],
+        origin: tuple[float, float] = (0.0, 0.0),
+        vertex_spacing: float = 1.0,
+    ) -> "Region":
+        """Whole extent of a terrain height grid (a tile or TerrainStitcher.stitch()), one cell per vertex"""
+        grid = np.asarray(grid, dtype=np.float32)
+        return cls(origin, vertex_spacing, np.ones(grid.shape, dtype=bool), grid)
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """(min_x, min_z, max_x, max_z) covered by the mask"""
+        half = self.resolution * 0.5
+        rows, cols = self.mask.shape
+        return (
+            self.origin[0] - half,
+            self.origin[1] - half,
+            self.origin[0] + (cols - 1) * self.resolution + half,
+            self.origin[1] + (rows - 1) * self.resolution + half,
+        )
+
+    def _cells(self, points: npt.NDArray[np.float64]) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+        cell = np.floor((points - self.origin) / self.resolution + 0.5).astype(np.int64)
+        rows, cols = self.mask.shape
+        valid = (cell[:, 0] >= 0) & (cell[:, 0] < cols) & (cell[:, 1] >= 0) & (cell[:, 1] < rows)
+        return np.clip(cell[:, 1], 0, max(rows - 1, 0)), np.clip(cell[:, 0], 0, max(cols - 1, 0)), valid
+
+    def contains(self, points: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+        """points: (N, 2) x/z"""
+        if self.mask.size == 0:
+            return np.zeros(len(points), dtype=bool)
+        row, col, valid = self._cells(points)
+        return valid & self.mask[row, col]
+
+    def height(self, points: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Bilinear height at (N, 2) x/z points"""
+        if self.heights is None:
+            return np.zeros(len(points))
+
+        rows, cols = self.heights.shape
+        local = (points - self.origin) / self.resolution
+        x = np.clip(local[:, 0], 0, cols - 1)
+        z = np.clip(local[:, 1], 0, rows - 1)
+        x0 = np.minimum(np.floor(x).astype(np.int64), max(cols - 2, 0))
+        z0 = np.minimum(np.floor(z).astype(np.int64), max(rows - 2, 0))
+        x1 = np.minimum(x0 + 1, cols - 1)
+        z1 = np.minimum(z0 + 1, rows - 1)
+        fx, fz = x - x0, z - z0
+
+        h = self.heights
+        top = h[z0, x0] * (1 - fx) + h[z0, x1] * fx
+        bottom = h[z1, x0] * (1 - fx) + h[z1, x1] * fx
+        return top * (1 - fz) + bottom * fz
+
+
+def poisson_disk(
+    region: Region,
+    radii: Sequence[float],
+    weights: Optional[Sequence[float]] = None,
+    density: Optional[Callable[[npt.NDArray[np.float64]], npt.NDArray[np.float64]]] = None,
+    rng: Optional[np.random.Generator] = None,
+    max_samples: Optional[int] = None,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+    """
+    Bridson sampling with a radius per asset
+
+    Active samples far enough apart cannot interfere, so instead of one
+    active sample per iteration, one is taken in every tile of a checkerboard
+    class and all their candidates are tested in the same NumPy calls.
+
+    Args:
+        radii: Radius of every asset, two samples are at least r_a + r_b apart
+        weights: Relative frequency of every asset, equal when None
+        density: Callable giving a keep probability in [0, 1] for (N, 2) x/z
+            points, applied after sampling so spacing is kept in sparse areas
+        max_samples: Stops once that many samples are placed
+
+    Returns:
+        (N, 2) x/z positions and the asset index of every sample
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    radii = np.asarray(radii, dtype=np.float64)
+    probabilities = np.full(len(radii), 1.0 / len(radii)) if weights is None else np.asarray(weights, dtype=np.float64) / np.sum(weights)
+    cumulative = np.cumsum(probabilities)
+
+    min_x, min_z, max_x, max_z = region.bounds
+    if region.mask.size == 0 or not region.mask.any():
+        return np.empty((0, 2)), np.empty(0, dtype=np.int64)
+    origin = np.array([min_x, min_z])
+    r_max = radii.max()
+
+    # Two samples are at least 2 * min radius apart, so a cell of that diagonal holds one at most
+    cell = radii.min() * math.sqrt(2)
+    pad = int(math.ceil(2 * r_max / cell))
+    columns = int(math.ceil((max_x - min_x) / cell)) + 1
+    rows = int(math.ceil((max_z - min_z) / cell)) + 1
+    grid_columns = columns + 2 * pad
+    flat_grid = np.full((rows + 2 * pad) * grid_columns, -1, dtype=np.int64)
+    # Neighbour cells that can hold a sample closer than 2 r_max, as offsets in the flat grid
+    dz, dx = np.mgrid[-pad:pad + 1, -pad:pad + 1]
+    gap = np.hypot(np.maximum(np.abs(dz) - 1, 0), np.maximum(np.abs(dx) - 1, 0)) * cell
+    neighbour_offsets = (dz * grid_columns + dx)[gap < 2 * r_max]
+
+    # Candidates land at most 4 r_max from their parent and reach 2 r_max further,
+    # parents in two tiles of the same class are at least one tile apart
+    tile = 10 * r_max
+    tile_rows = int(math.ceil((max_z - min_z) / tile)) + 1
+
+    capacity = 1024
+    positions = np.zeros((capacity, 2))
+    sample_radii = np.zeros(capacity)
+    assets = np.empty(capacity, dtype=np.int64)
+    alive = np.zeros(capacity, dtype=bool)
+    count = 0
+    active = np.empty(0, dtype=np.int64)
+
+    def pick_assets(n):
+        return np.minimum(np.searchsorted(cumulative, rng.random(n), side="right"), len(radii) - 1)
+
+    def fits(candidates, candidate_assets):
+        """(N, 2) candidates, each tested against the samples of its neighbour cells"""
+        ok = (
+            (candidates[:, 0] >= min_x) & (candidates[:, 0] <= max_x)
+            & (candidates[:, 1] >= min_z) & (candidates[:, 1] <= max_z)
+        )
+        ok &= region.contains(candidates)
+        tested = np.flatnonzero(ok)
+        if len(tested) == 0:
+            return ok
+
+        points = candidates[tested]
+        index = np.floor((points - origin) / cell).astype(np.int64) + pad
+        neighbours = flat_grid[(index[:, 1] * grid_columns + index[:, 0])[:, np.newaxis] + neighbour_offsets]
+        used = neighbours >= 0
+        neighbours = np.where(used, neighbours, 0)
+
+        delta_x = positions[neighbours, 0] - points[:, 0:1]
+        delta_z = positions[neighbours, 1] - points[:, 1:2]
+        limit = radii[candidate_assets[tested]][:, np.newaxis] + sample_radii[neighbours]
+        ok[tested] = np.all(~used | (delta_x * delta_x + delta_z * delta_z >= limit * limit), axis=1)
+        return ok
+
+    def add(points, point_assets):
+        """Adds samples that are far enough from each other to never share a cell"""
+        nonlocal count, positions, sample_radii, assets, alive, capacity, active
+        if count + len(points) > capacity:
+            capacity = max(capacity * 2, count + len(points))
+            positions = np.resize(positions, (capacity, 2))
+            sample_radii = np.resize(sample_radii, capacity)
+            assets = np.resize(assets, capacity)
+            alive = np.resize(alive, capacity)
+        new = np.arange(count, count + len(points))
+        positions[new] = points
+        sample_radii[new] = radii[point_assets]
+        assets[new] = point_assets
+        alive[new] = True
+        index = np.floor((points - origin) / cell).astype(np.int64) + pad
+        flat_grid[index[:, 1] * grid_columns + index[:, 0]] = new
+        active = np.concatenate((active, new))
+        count += len(points)
+
+    # One seed per tile so every tile grows at the same time instead of a single front
+    tile_columns = int(math.ceil((max_x - min_x) / tile)) + 1
+    tile_x, tile_z = np.meshgrid(np.arange(tile_columns), np.arange(tile_rows), indexing="ij")
+    tile_x, tile_z = tile_x.ravel(), tile_z.ravel()
+    attempts = 8
+    seeds = origin + (np.column_stack((tile_x, tile_z))[:, np.newaxis, :] + rng.random((len(tile_x), attempts, 2))) * tile
+    seed_ok = region.contains(seeds.reshape(-1, 2)).reshape(len(tile_x), attempts)
+    has_seed = seed_ok.any(axis=1)
+    seeds = seeds[has_seed, np.argmax(seed_ok[has_seed], axis=1)]
+    seed_class = ((tile_x % 2) * 2 + tile_z % 2)[has_seed]
+    for tile_class in range(4):
+        class_seeds = seeds[seed_class == tile_class]
+        class_assets = pick_assets(len(class_seeds))
+        ok = fits(class_seeds, class_assets)
+        if max_samples is not None:
+            ok &= np.cumsum(ok) <= max_samples - count
+        if ok.any():
+            add(class_seeds[ok], class_assets[ok])
+
+    # Random seed points restart the sampling in areas the active samples cannot reach
+    # (narrow rooms missed above), tried in batches only once the active list is empty
+    seed_batch = 256
+    failed_seeds = 0
+    while max_samples is None or count < max_samples:
+        if len(active) == 0:
+            if failed_seeds >= 4 * seed_batch:
+                break
+            seeds = rng.uniform((min_x, min_z), (max_x, max_z), size=(seed_batch, 2))
+            seed_assets = pick_assets(seed_batch)
+            ok = fits(seeds, seed_assets)
+            if not ok.any():
+                failed_seeds += seed_batch
+                continue
+            failed_seeds = 0
+            first = int(np.argmax(ok))
+            add(seeds[first:first + 1], seed_assets[first:first + 1])
+            continue
+
+        for tile_class in rng.permutation(4):
+            if len(active) == 0 or (max_samples is not None and count >= max_samples):
+                break
+
+            tiles = np.floor((positions[active] - origin) / tile).astype(np.int64)
+            selected = (tiles[:, 0] % 2) * 2 + tiles[:, 1] % 2 == tile_class
+            if not selected.any():
+                continue
+
+            # One random active sample per tile
+            shuffled = rng.permutation(int(selected.sum()))
+            class_tiles = tiles[selected][shuffled]
+            _, first = np.unique(class_tiles[:, 0] * tile_rows + class_tiles[:, 1], return_index=True)
+            parents = active[selected][shuffled][first]
+            if max_samples is not None:
+                parents = parents[:max_samples - count]
+
+            parent_assets = pick_assets(len(parents))
+            distance = radii[parent_assets] + sample_radii[parents]
+            angle = rng.uniform(0.0, 2 * math.pi, (len(parents), CANDIDATES))
+            length = rng.uniform(1.0, 2.0, (len(parents), CANDIDATES)) * distance[:, np.newaxis]
+            candidates = positions[parents][:, np.newaxis, :] + np.stack((np.cos(angle), np.sin(angle)), axis=2) * length[:, :, np.newaxis]
+
+            # Tested a few at a time, most parents find a spot in the first candidates
+            chosen = np.full(len(parents), -1)
+            remaining = np.arange(len(parents))
+            for start in range(0, CANDIDATES, CANDIDATE_CHUNK):
+                tried = candidates[remaining, start:start + CANDIDATE_CHUNK]
+                ok = fits(tried.reshape(-1, 2), np.repeat(parent_assets[remaining], tried.shape[1])).reshape(len(remaining), -1)
+                hit = ok.any(axis=1)
+                chosen[remaining[hit]] = start + np.argmax(ok[hit], axis=1)
+                remaining = remaining[~hit]
+                if len(remaining) == 0:
+                    break
+
+            found = chosen >= 0
+            alive[parents[~found]] = False
+            active = active[alive[active]]
+            if found.any():
+                add(candidates[found, chosen[found]], parent_assets[found])
+
+    positions, assets = positions[:count], assets[:count]
+    if density is not None and count:
+        keep = rng.random(count) < np.clip(density(positions), 0.0, 1.0)
+        positions, assets = positions[keep], assets[keep]
+    return positions, assets
+
+
+def scatter(
+    region: Region,
+    assets: Sequence,
+    weights: Optional[Sequence[float]] = None,
+    density: Optional[Callable[[npt.NDArray[np.float64]], npt.NDArray[np.float64]]] = None,
+    scale_range: tuple[float, float] = (1.0, 1.0),
+    margin: float = 0.0,
+    seed: Optional[int] = None,
+    max_samples: Optional[int] = None,
+) -> ScatterBatch:
+    """
+    Non-overlapping placements of the assets over the region
+
+    Args:
+        assets: ModelData of the props (e.g. catalog.category("nature"))
+        scale_range: Every placement gets a random scale in this range, the
+            radii are taken at the largest scale
+        margin: Extra space (meters) around every prop
+        seed: Seed of the run, the same seed gives the same batch
+    """
+    rng = np.random.default_rng(seed)
+    radii = [radius_from_model(model_data, scale_range[1], margin) for model_data in assets]
+    xz, asset = poisson_disk(region, radii, weights, density, rng, max_samples)
+
+    positions = np.column_stack((xz[:, 0], region.height(xz), xz[:, 1]))
+    return ScatterBatch(
+        positions=positions,
+        angles=rng.uniform(0.0, 360.0, len(xz)),
+        scales=rng.uniform(scale_range[0], scale_range[1], len(xz)),
+        asset=asset,
+    )
+
+
+def scatter_placements(batch: ScatterBatch, assets: Sequence, name: str = "SCATTER") -> list[corridor_generator.Placement]:
+    """Placements of a batch, ready for GenerationContext.emit_all"""
+    return [
+        corridor_generator.Placement(
+            name,
+            assets[asset].uuid,
+            Vector3(position),
+            corridor_generator.quat_y(angle),
+            scale,
+        )
+        for position, angle, scale, asset in zip(
+            batch.positions.tolist(), batch.angles.tolist(), batch.scales.tolist(), batch.asset.tolist()
+        )
+    ]
@@ -0,0 +1,120 @@
+"""
+Level output split in fixed-size world sectors.
+
+Placements are bucketed by their X/Z position and every sector is written
+as a single .lsx holding all of its GameObjects, next to an index of the
+sector bounds and object counts. With the default size and origin the
+sectors line up with the 64 m terrain tiles, so a sector can be loaded,
+converted or regenerated on its own.
+"""
+
+import json
+import math
+import os
+from typing import Optional
+
+import create_lsx
+
+# Size of a sector in meters, one terrain tile (65 vertices, 1 m apart)
+SECTOR_SIZE = 64.0
+SECTOR_INDEX_FILENAME = "AUTO_sectors.json"
+
+
+def sector_of(x: float, z: float, size: float = SECTOR_SIZE, origin: tuple[float, float] = (0.0, 0.0)) -> tuple[int, int]:
+    return math.floor((x - origin[0]) / size), math.floor((z - origin[1]) / size)
+
+
+def sector_filename(sector: tuple[int, int]) -> str:
+    # AUTO_ prefix so clear_auto_xml removes them with the other generated files
+    return f"AUTO_SECTOR_{sector[0]}_{sector[1]}.lsx"
+
+
+class SectorWriter:
+    """Output sink of a GenerationContext, objects are kept in memory until write()"""
+
+    def __init__(
+        self,
+        folder: str,
+        size: float = SECTOR_SIZE,
+        origin: tuple[float, float] = (0.0, 0.0),
+        level_name: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            folder: Folder where the sector files and the index are written
+            size: Sector size in meters
+            origin: World x/z of the corner of sector (0, 0)
+            level_name: Level name written in every object, the template one when None
+        """
+        self.folder: str = folder
+        self.size: float = size
+        self.origin: tuple[float, float] = origin
+        self.level_name: Optional[str] = level_name
+        # sector -> GameObjects nodes, already formatted
+        self.sectors: dict[tuple[int, int], list[str]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(nodes) for nodes in self.sectors.values())
+
+    def add(self, placement, map_key: str, name: str, level_name: Optional[str] = None) -> tuple[int, int]:
+        """
+        Buckets an object that already got its unique name and MapKey, returns its sector
+
+        Args:
+            level_name: Level name of this object, the one of the writer when None
+        """
+        position = placement.position
+        sector = sector_of(position[0], position[2], self.size, self.origin)
+        node = create_lsx.game_object_node(
+            map_key,
+            name,
+            placement.uuid,
+            position,
+            placement.rotation,
+            placement.scale,
+            level_name or self.level_name,
+        )
+        self.sectors.setdefault(sector, []).append(node)
+        return sector
+
+    def bounds(self, sector: tuple[int, int]) -> list[float]:
+        """[min_x, min_z, max_x, max_z] of a sector"""
+        min_x = self.origin[0] + sector[0] * self.size
+        min_z = self.origin[1] + sector[1] * self.size
+        return [min_x, min_z, min_x + self.size, min_z + self.size]
+
+    def write(self, only: Optional[set[tuple[int, int]]] = None) -> dict:
+        """
+        Writes one .lsx per sector and the index
+
+        Args:
+            only: Sectors to write, every sector when None. The index still lists all of them
+
+        Returns:
+            The index: sector size, origin and {file, sector, bounds, objects} per sector
+        """
+        os.makedirs(self.folder, exist_ok=True)
+        entries = []
+        for sector in sorted(self.sectors):
+            nodes = self.sectors[sector]
+            filename = sector_filename(sector)
+            if only is None or sector in only:
+                create_lsx.write_objects_file(os.path.join(self.folder, filename), nodes)
+            entries.append({
+                "file": filename,
+                "sector": list(sector),
+                "bounds": self.bounds(sector),
+                "objects": len(nodes),
+            })
+
+        index = {"size": self.size, "origin": list(self.origin), "sectors": entries}
+        with open(os.path.join(self.folder, SECTOR_INDEX_FILENAME), "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+
+        print(f"Wrote {len(self)} objects in {len(entries)} sectors")
+        return index
+
+
+def load_index(folder: str) -> dict:
+    with open(os.path.join(folder, SECTOR_INDEX_FILENAME), "r", encoding="utf-8") as f:
+        return json.load(f)
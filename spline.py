@@ -0,0 +1,221 @@
+"""
+Cubic curves sampled at a uniform arc length with NumPy.
+
+Centripetal Catmull-Rom and piecewise cubic Bezier curves are both stored
+as one power-basis cubic per segment. The arc-length lookup table (a fixed
+number of chords per segment, cumulated over the whole curve) is built the
+first time a curve is sampled and kept on the curve. Every later sampling
+is a searchsorted/interp over that table and one polynomial evaluation for
+all samples at once, so a curved wall costs about as much as a straight one.
+"""
+
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+import polyline_sampler
+
+# Chords per segment in the arc-length lookup table
+LUT_RESOLUTION = 32
+
+# Knot intervals shorter than this are widened, so repeated points do not divide by zero
+MIN_KNOT_INTERVAL = 1e-9
+
+
+class CurveSamples(NamedTuple):
+    positions: npt.NDArray[np.float64]  # (N, D)
+    tangents: npt.NDArray[np.float64]   # (N, D) unit length
+    distances: npt.NDArray[np.float64]  # (N,) arc length from the start of the curve
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+class Curve:
+    """Chain of cubic segments, segment i covers the parameter range [i, i + 1]"""
+
+    def __init__(self, coefficients: npt.NDArray[np.float64], resolution: int = LUT_RESOLUTION) -> None:
+        """
+        Args:
+            coefficients: (S, 4, D) a, b, c, d of a*t^3 + b*t^2 + c*t + d per segment, t in [0, 1]
+            resolution: Chords per segment in the arc-length lookup table
+        """
+        self.coefficients: npt.NDArray[np.float64] = coefficients
+        self.resolution: int = resolution
+        self._parameters: Optional[npt.NDArray[np.float64]] = None
+        self._lengths: Optional[npt.NDArray[np.float64]] = None
+
+    @property
+    def segments(self) -> int:
+        return len(self.coefficients)
+
+    def _split(self, u: npt.NDArray[np.float64]) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+        segment = np.clip(np.floor(u).astype(np.int64), 0, self.segments - 1)
+        return segment, u - segment
+
+    def evaluate(self, u) -> npt.NDArray[np.float64]:
+        """Positions at curve parameters u (0 to segments)"""
+        segment, t = self._split(np.asarray(u, dtype=np.float64))
+        a, b, c, d = np.moveaxis(self.coefficients[segment], 1, 0)
+        t = t[:, np.newaxis]
+        return ((a * t + b) * t + c) * t + d
+
+    def derivative(self, u) -> npt.NDArray[np.float64]:
+        """First derivatives at curve parameters u"""
+        segment, t = self._split(np.asarray(u, dtype=np.float64))
+        a, b, c, _ = np.moveaxis(self.coefficients[segment], 1, 0)
+        t = t[:, np.newaxis]
+        return (3.0 * a * t + 2.0 * b) * t + c
+
+    def _lookup_table(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        if self._lengths is None:
+            parameters = np.linspace(0.0, self.segments, self.segments * self.resolution + 1)
+            points = self.evaluate(parameters)
+            chords = np.linalg.norm(np.diff(points, axis=0), axis=1)
+            self._parameters = parameters
+            self._lengths = np.concatenate(([0.0], np.cumsum(chords)))
+        return self._parameters, self._lengths
+
+    @property
+    def length(self) -> float:
+        return float(self._lookup_table()[1][-1])
+
+    def parameters_at(self, distances) -> npt.NDArray[np.float64]:
+        """Curve parameters at arc lengths from the start, clamped to the curve"""
+        parameters, lengths = self._lookup_table()
+        return np.interp(np.asarray(distances, dtype=np.float64), lengths, parameters)
+
+    def at(self, distances) -> CurveSamples:
+        """Positions and unit tangents at arc lengths from the start"""
+        distances = np.asarray(distances, dtype=np.float64).reshape(-1)
+        u = self.parameters_at(distances)
+        tangents = self.derivative(u)
+        norms = np.linalg.norm(tangents, axis=1)[:, np.newaxis]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            tangents = np.nan_to_num(tangents / norms)
+        return CurveSamples(self.evaluate(u), tangents, distances)
+
+    def sample(self, spacing: float, offset: float = 0.0, include_end: bool = False) -> CurveSamples:
+        """
+        Samples every `spacing` along the curve
+
+        Args:
+            spacing: Arc length between two samples
+            offset: Arc length of the first sample
+            include_end: Also sample the end of the curve when the spacing does not land on it
+        """
+        length = self.length
+        distances = np.arange(offset, length + 1e-9, spacing)
+        if include_end and (not len(distances) or length - distances[-1] > 1e-9):
+            distances = np.append(distances, length)
+        return self.at(distances)
+
+
+class CatmullRom(Curve):
+    """Catmull-Rom spline through every point, centripetal by default (alpha 0.5)"""
+
+    def __init__(self, points, alpha: float = 0.5, closed: bool = False, resolution: int = LUT_RESOLUTION) -> None:
+        """
+        Args:
+            points: (N, D) points the curve goes through, N >= 2
+            alpha: Knot exponent, 0 uniform, 0.5 centripetal, 1 chordal
+            closed: Curve goes back to the first point
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if len(points) < 2:
+            raise ValueError("A Catmull-Rom spline needs at least 2 points")
+
+        if closed:
+            padded = np.concatenate((points[-1:], points, points[:2]))
+        else:
+            # Phantom end points mirrored from the first and last segments
+            padded = np.concatenate((2 * points[:1] - points[1:2], points, 2 * points[-1:] - points[-2:-1]))
+
+        p0, p1, p2, p3 = padded[:-3], padded[1:-2], padded[2:-1], padded[3:]
+        d01 = self._interval(p0, p1, alpha)
+        d12 = self._interval(p1, p2, alpha)
+        d23 = self._interval(p2, p3, alpha)
+
+        # Barry-Goldman tangents of the non-uniform spline, scaled to t in [0, 1]
+        m1 = d12 * ((p1 - p0) / d01 - (p2 - p0) / (d01 + d12) + (p2 - p1) / d12)
+        m2 = d12 * ((p2 - p1) / d12 - (p3 - p1) / (d12 + d23) + (p3 - p2) / d23)
+        super().__init__(hermite_coefficients(p1, p2, m1, m2), resolution)
+        self.points: npt.NDArray[np.float64] = points
+        self.closed: bool = closed
+
+    @staticmethod
+    def _interval(a: npt.NDArray[np.float64], b: npt.NDArray[np.float64], alpha: float) -> npt.NDArray[np.float64]:
+        distance = np.linalg.norm(b - a, axis=1) ** alpha
+        return np.maximum(distance, MIN_KNOT_INTERVAL)[:, np.newaxis]
+
+
+class Bezier(Curve):
+    """Piecewise cubic Bezier, control points p0 c0 c1 p1 c2 c3 p2 ..."""
+
+    def __init__(self, control_points, resolution: int = LUT_RESOLUTION) -> None:
+        """
+        Args:
+            control_points: (3 * S + 1, D), consecutive segments share their end point
+        """
+        control_points = np.asarray(control_points, dtype=np.float64)
+        if len(control_points) < 4 or (len(control_points) - 1) % 3:
+            raise ValueError(f"A cubic Bezier needs 3 * S + 1 control points, got {len(control_points)}")
+
+        p0 = control_points[0:-1:3]
+        p1 = control_points[1::3]
+        p2 = control_points[2::3]
+        p3 = control_points[3::3]
+        coefficients = np.stack((
+            -p0 + 3 * p1 - 3 * p2 + p3,
+            3 * p0 - 6 * p1 + 3 * p2,
+            3 * (p1 - p0),
+            p0,
+        ), axis=1)
+        super().__init__(coefficients, resolution)
+        self.control_points: npt.NDArray[np.float64] = control_points
+
+
+def hermite_coefficients(p1, p2, m1, m2) -> npt.NDArray[np.float64]:
+    """(S, 4, D) power-basis coefficients of Hermite segments p1 -> p2 with tangents m1, m2"""
+    return np.stack((
+        2 * p1 - 2 * p2 + m1 + m2,
+        -3 * p1 + 3 * p2 - 2 * m1 - m2,
+        m1,
+        p1,
+    ), axis=1)
+
+
+def sample_curves(curves: Sequence[Curve], spacing: float, y: float = 0.0) -> polyline_sampler.TransformBatch:
+    """
+    Samples x/z curves every `spacing`, same pieces as polyline_sampler.resample_polylines
+
+    A sample is the centre of a piece `spacing` long. The first piece of a
+    curve starts on its start and the last one ends on its end, the pieces in
+    between share the overlap. The first piece of every curve is flagged as a
+    corner.
+    """
+    if not curves:
+        return polyline_sampler.resample_polylines([], spacing)
+
+    centres, starts = [], []
+    for curve in curves:
+        length = curve.length
+        count = max(int(np.ceil(length / spacing - 1e-9)), 1)
+        if count > 1:
+            centre = spacing / 2.0 + np.arange(count) * (length - spacing) / (count - 1)
+        else:
+            centre = np.array([length / 2.0])
+        centres.append(curve.at(centre))
+        starts.append(curve.at(np.maximum(centre - spacing / 2.0, 0.0)).positions)
+
+    xz = np.concatenate([samples.positions for samples in centres])
+    tangents = np.concatenate([samples.tangents for samples in centres])
+    start_xz = np.concatenate(starts)
+    owner = np.concatenate([np.full(len(samples), index) for index, samples in enumerate(centres)])
+    corner = np.concatenate([np.arange(len(samples)) == 0 for samples in centres])
+
+    positions = np.column_stack((xz[:, 0], np.full(len(xz), y), xz[:, 1]))
+    start_positions = np.column_stack((start_xz[:, 0], np.full(len(start_xz), y), start_xz[:, 1]))
+    angles = np.degrees(np.arctan2(tangents[:, 1], tangents[:, 0]))
+    return polyline_sampler.TransformBatch(positions, angles, owner, corner, start_positions)
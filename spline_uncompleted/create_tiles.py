@@ -1,7 +1,33 @@
+"""
+Tiles of TileConstruction splines, generated from their construction points.
+
+Same layout as terrain/: the modules of this folder import each other
+(create_tiles, spline_tech, tile_construction_lsx) and the modules of the
+repo root (spline, plot_points) by bare module name, so both this folder and
+the repo root go on sys.path.
+"""
+
 from pyrr import Vector3, Quaternion, vector3, quaternion
 import uuid
 import math
-import plot_points
+from typing import NamedTuple, Optional
+import numpy as np
+import numpy.typing as npt
+
+# Tile type GUIDs from your XML
+CORNER_TILE_GUID = "88c8ec1e-dd7b-469c-aefa-af3277e6f6c0"
+STRETCH_TILE_GUID = "21fb351f-b774-461d-a2d2-bd974f4e693f"
+CORNER_INNER_GUID = "6a21259c-ec13-4f00-8afa-f762007c64d2"
+
+# Kind of every generated tile
+TILE_CORNER = 0
+TILE_SEGMENT = 1
+
+# A helper point belongs to a construction point when it is this far from it
+HELPER_MIN_DISTANCE = 0.1
+HELPER_MAX_DISTANCE = 2.0
+
+TILE_WIDTH = 4.0
 
 def parse_vector3(s):
     """Parse space-separated vector string to pyrr Vector3"""
@@ -33,151 +59,285 @@ def quaternion_to_string(q):
     """Convert quaternion to space-separated string"""
     return f"{q[0]} {q[1]} {q[2]} {q[3]}"
 
-def generate_tiles_from_points(construction_points, path):
+class KDTree:
     """
-    Generate tiles based on construction points and path.
-    
+    Static k-d tree over (N, 3) points, stored in flat arrays.
+    Leaves keep up to leaf_size points, scanned with NumPy.
+    """
+
+    def __init__(self, points: npt.NDArray[np.float64], leaf_size: int = 16) -> None:
+        self.points: npt.NDArray[np.float64] = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        self.leaf_size: int = leaf_size
+        # Points reordered so every node covers order[start:end]
+        self.order: npt.NDArray[np.int64] = np.arange(len(self.points))
+        self.start: list[int] = []
+        self.end: list[int] = []
+        self.axis: list[int] = []      # -1 for leaves
+        self.split: list[float] = []
+        self.left: list[int] = []
+        self.right: list[int] = []
+        if len(self.points):
+            self._build(0, len(self.points))
+
+    def _build(self, start: int, end: int) -> int:
+        node = len(self.start)
+        self.start.append(start)
+        self.end.append(end)
+        self.axis.append(-1)
+        self.split.append(0.0)
+        self.left.append(-1)
+        self.right.append(-1)
+        if end - start <= self.leaf_size:
+            return node
+
+        indexes = self.order[start:end]
+        spread = self.points[indexes].max(axis=0) - self.points[indexes].min(axis=0)
+        axis = int(np.argmax(spread))
+        middle = (end - start) // 2
+        partition = np.argpartition(self.points[indexes, axis], middle)
+        self.order[start:end] = indexes[partition]
+
+        self.axis[node] = axis
+        self.split[node] = float(self.points[self.order[start + middle], axis])
+        self.left[node] = self._build(start, start + middle)
+        self.right[node] = self._build(start + middle, end)
+        return node
+
+    def query_radius(self, point, radius: float) -> npt.NDArray[np.int64]:
+        """Indexes of the points closer than radius, nearest first"""
+        if not self.start:
+            return np.empty(0, dtype=np.int64)
+        point = np.asarray(point, dtype=np.float64)
+
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            axis = self.axis[node]
+            if axis < 0:
+                indexes = self.order[self.start[node]:self.end[node]]
+                distance = np.linalg.norm(self.points[indexes] - point, axis=1)
+                found.append(np.stack((indexes, distance), axis=1)[distance < radius])
+                continue
+
+            offset = point[axis] - self.split[node]
+            if offset - radius < 0:
+                stack.append(self.left[node])
+            if offset + radius >= 0:
+                stack.append(self.right[node])
+
+        hits = np.concatenate(found) if found else np.empty((0, 2))
+        hits = hits[np.argsort(hits[:, 1], kind="stable")]
+        return hits[:, 0].astype(np.int64)
+
+
+class ConstructionPoints:
+    """Construction points parsed once: ids, (N, 3) positions and flags"""
+
+    def __init__(self, ids: list[str], positions, stretch, helper) -> None:
+        self.ids: list[str] = ids
+        self.index: dict[str, int] = {cp_id: row for row, cp_id in enumerate(ids)}
+        self.positions: npt.NDArray[np.float64] = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        self.stretch: npt.NDArray[np.bool_] = np.asarray(stretch, dtype=bool)
+        self.helper: npt.NDArray[np.bool_] = np.asarray(helper, dtype=bool)
+        self.helper_rows: npt.NDArray[np.int64] = np.flatnonzero(self.helper)
+        self._helper_tree: Optional[KDTree] = None
+
+    @classmethod
+    def from_dict(cls, construction_points: dict) -> "ConstructionPoints":
+        """From {id: {position, stretch, helper}} as returned by spline_tech.parse_construction_file"""
+        ids = [cp_id for cp_id, data in construction_points.items() if data.get("position")]
+        positions = np.array(
+            [construction_points[cp_id]["position"].split() for cp_id in ids], dtype=np.float64
+        ).reshape(-1, 3)
+        return cls(
+            ids,
+            positions,
+            [construction_points[cp_id]["stretch"] for cp_id in ids],
+            [construction_points[cp_id]["helper"] for cp_id in ids],
+        )
+
+    def rows(self, path: list[str]) -> npt.NDArray[np.int64]:
+        return np.array([self.index[cp_id] for cp_id in path], dtype=np.int64)
+
+    @property
+    def helper_tree(self) -> KDTree:
+        if self._helper_tree is None:
+            self._helper_tree = KDTree(self.positions[self.helper_rows])
+        return self._helper_tree
+
+    def find_helpers(self, rows: npt.NDArray[np.int64]) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+        """
+        Closest helper point between HELPER_MIN_DISTANCE and HELPER_MAX_DISTANCE of every row
+
+        Returns:
+            (N, 3) helper positions and whether one was found
+        """
+        helpers = np.zeros((len(rows), 3))
+        found = np.zeros(len(rows), dtype=bool)
+        tree = self.helper_tree
+        for i, row in enumerate(rows.tolist()):
+            point = self.positions[row]
+            for hit in tree.query_radius(point, HELPER_MAX_DISTANCE):
+                helper_position = tree.points[hit]
+                if np.linalg.norm(helper_position - point) > HELPER_MIN_DISTANCE:
+                    helpers[i] = helper_position
+                    found[i] = True
+                    break
+        return helpers, found
+
+
+class TileArrays(NamedTuple):
+    positions: npt.NDArray[np.float64]  # (N, 3)
+    rotations: npt.NDArray[np.float64]  # (N, 4) x, y, z, w
+    stretchable: npt.NDArray[np.bool_]  # (N,)
+    kind: npt.NDArray[np.int64]         # (N,) TILE_CORNER or TILE_SEGMENT
+    path: npt.NDArray[np.int64]         # (N,) index of the path the tile belongs to
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+def direction_quaternions(directions: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """calculate_direction_quaternion for (N, 3) directions at once, (N, 4) x, y, z, w"""
+    angle = np.arctan2(directions[:, 0], directions[:, 2])
+    zeros = np.zeros(len(directions))
+    return np.column_stack((zeros, np.sin(angle / 2.0), zeros, np.cos(angle / 2.0)))
+
+
+def generate_tiles(points: ConstructionPoints, paths: list[list[str]], tile_width: float = TILE_WIDTH) -> TileArrays:
+    """
+    Tiles of every path in one pass: a corner tile on each stretch point at the
+    start of a segment (and at the end of the path), and evenly spaced
+    stretchable tiles along every segment
+
     Args:
-        construction_points: dict of {id: {position, stretch, helper}}
-        path: list of 3 construction point IDs (start, corner, end)
-    
-    Returns:
-        list of tile dictionaries with uuid, translate, rotate, stretchable, tile_guid
+        points: Construction points of the file
+        paths: Lists of construction point ids in order (non-helper points only)
+        tile_width: Length covered by a stretchable tile
     """
-    tiles = []
-    
-    # Tile type GUIDs from your XML
-    CORNER_TILE_GUID = "88c8ec1e-dd7b-469c-aefa-af3277e6f6c0"
-    STRETCH_TILE_GUID = "21fb351f-b774-461d-a2d2-bd974f4e693f"
-    CORNER_INNER_GUID = "6a21259c-ec13-4f00-8afa-f762007c64d2"
-    
-    # Helper function to find helper point near a construction point
-    def find_helper(point_id):
-        point_pos = parse_vector3(construction_points[point_id]['position'])
-        for helper_id, data in construction_points.items():
-            if data['helper']:
-                helper_pos = parse_vector3(data['position'])
-                dist = vector3.length(helper_pos - point_pos)
-                if 0.1 < dist < 2.0:
-                    return helper_pos
-        return None
-    
-    # Get the 3 main points
-    start_id = path[0]
-    corner_id = path[1]
-    end_id = path[2]
-    
-    start_pos = parse_vector3(construction_points[start_id]['position'])
-    corner_pos = parse_vector3(construction_points[corner_id]['position'])
-    end_pos = parse_vector3(construction_points[end_id]['position'])
-    
-    # === SEGMENT 1: start -> corner ===
-    segment1_vec = corner_pos - start_pos
-    segment1_len = vector3.length(segment1_vec)
-    segment1_dir = vector3.normalize(segment1_vec)
-    
-    # Corner tile at start (faces perpendicular using helper)
-    helper1 = find_helper(start_id)
-    if helper1 is not None:
-        helper_dir = helper1 - start_pos
-        corner_rot = calculate_direction_quaternion(helper_dir)
-    else:
-        perp_dir = Vector3([segment1_dir[2], 0.0, -segment1_dir[0]])
-        corner_rot = calculate_direction_quaternion(perp_dir)
-    
-    tiles.append({
-        'uuid': str(uuid.uuid4()),
-        'tile_guid': CORNER_TILE_GUID,
-        'translate': vector3_to_string(start_pos),
-        'rotate': quaternion_to_string(corner_rot),
-        'stretchable': False,
-        'scale_z': 1.0,
-        'type': 'corner_start'
-    })
-    
-    # Stretchable tiles along segment 1
-    segment1_rot = calculate_direction_quaternion(segment1_dir)
-    
-    # First stretchable at start position
-    tiles.append({
-        'uuid': str(uuid.uuid4()),
-        'tile_guid': STRETCH_TILE_GUID,
-        'translate': vector3_to_string(start_pos),
-        'rotate': quaternion_to_string(segment1_rot),
-        'stretchable': True,
-        'scale_z': 0.9894829,  # From XML
-        'type': 'segment1_stretch'
-    })
-    
-    # Additional stretchable tiles at ~4 unit intervals
-    current_dist = 4.0
-    while current_dist < segment1_len:
-        tile_pos = start_pos + segment1_dir * current_dist
-        tiles.append({
-            'uuid': str(uuid.uuid4()),
-            'tile_guid': STRETCH_TILE_GUID,
-            'translate': vector3_to_string(tile_pos),
-            'rotate': quaternion_to_string(segment1_rot),
-            'stretchable': True,
-            'scale_z': 0.9894829,
-            'type': 'segment1_stretch'
-        })
-        current_dist += 4.0
-    
-    # === CORNER POINT ===
-    # Inner corner tile at corner position
-    tiles.append({
-        'uuid': str(uuid.uuid4()),
-        'tile_guid': CORNER_INNER_GUID,
-        'translate': vector3_to_string(corner_pos),
-        'rotate': quaternion_to_string(segment1_rot),
-        'stretchable': False,
-        'scale_z': 1.0,
-        'type': 'corner_inner'
-    })
-    
-    # === SEGMENT 2: corner -> end ===
-    segment2_vec = end_pos - corner_pos
-    segment2_len = vector3.length(segment2_vec)
-    segment2_dir = vector3.normalize(segment2_vec)
-    segment2_rot = calculate_direction_quaternion(segment2_dir)
-    
-    # Stretchable tiles along segment 2
-    # Start offset from corner by ~1 unit
-    current_dist = 1.0
-    while current_dist < segment2_len:
-        tile_pos = corner_pos + segment2_dir * current_dist
-        tiles.append({
-            'uuid': str(uuid.uuid4()),
-            'tile_guid': STRETCH_TILE_GUID,
-            'translate': vector3_to_string(tile_pos),
-            'rotate': quaternion_to_string(segment2_rot),
-            'stretchable': True,
-            'scale_z': 1.0220633,  # From XML
-            'type': 'segment2_stretch'
-        })
-        current_dist += 4.0
-    
-    # === END POINT ===
-    # Corner tile at end
-    helper2 = find_helper(end_id)
-    if helper2 is not None:
-        # End corner faces along segment direction
-        end_corner_rot = calculate_direction_quaternion(segment2_dir)
-    else:
-        end_corner_rot = calculate_direction_quaternion(segment2_dir)
-    
-    tiles.append({
-        'uuid': str(uuid.uuid4()),
-        'tile_guid': CORNER_TILE_GUID,
-        'translate': vector3_to_string(end_pos),
-        'rotate': quaternion_to_string(end_corner_rot),
-        'stretchable': False,
-        'scale_z': 1.0,
-        'type': 'corner_end'
-    })
-    
-    return tiles
+    paths = [path for path in paths if len(path) >= 2]
+    if not paths:
+        return TileArrays(np.empty((0, 3)), np.empty((0, 4)), np.empty(0, dtype=bool), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    path_rows = [points.rows(path) for path in paths]
+    start_rows = np.concatenate([rows[:-1] for rows in path_rows])
+    end_rows = np.concatenate([rows[1:] for rows in path_rows])
+    segment_path = np.concatenate([np.full(len(rows) - 1, index) for index, rows in enumerate(path_rows)])
+    segment_index = np.concatenate([np.arange(len(rows) - 1) for rows in path_rows])
+
+    start = points.positions[start_rows]
+    vector = points.positions[end_rows] - start
+    length = np.linalg.norm(vector, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        direction = np.nan_to_num(vector / length[:, np.newaxis])
+
+    # Stretchable tiles, evenly spread over each segment
+    count = np.maximum(1, (length / tile_width).astype(np.int64))
+    segment_of_tile = np.repeat(np.arange(len(start)), count)
+    first_tile = np.concatenate(([0], np.cumsum(count)[:-1]))
+    j = np.arange(len(segment_of_tile)) - first_tile[segment_of_tile]
+    t = (j + 0.5) / count[segment_of_tile]
+    stretch_positions = start[segment_of_tile] + vector[segment_of_tile] * t[:, np.newaxis]
+    stretch_rotations = direction_quaternions(direction)[segment_of_tile]
+
+    # Corner tiles at the start of segments and at the end of every path
+    last_segment = np.flatnonzero(np.append(segment_path[1:] != segment_path[:-1], True))
+    corner_rows = np.concatenate((start_rows, end_rows[last_segment]))
+    corner_segment = np.concatenate((np.arange(len(start)), last_segment))
+    is_end = np.concatenate((np.zeros(len(start), dtype=bool), np.ones(len(last_segment), dtype=bool)))
+    keep = points.stretch[corner_rows]
+    corner_rows, corner_segment, is_end = corner_rows[keep], corner_segment[keep], is_end[keep]
+
+    corner_positions = points.positions[corner_rows]
+    helpers, has_helper = points.find_helpers(corner_rows)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        helper_direction = helpers - corner_positions
+        helper_direction = np.nan_to_num(helper_direction / np.linalg.norm(helper_direction, axis=1)[:, np.newaxis])
+    segment_direction = direction[corner_segment]
+    # Without helper the start corner is rotated 90 degrees from the segment, the end one faces back
+    fallback = np.where(
+        is_end[:, np.newaxis],
+        -segment_direction,
+        np.column_stack((-segment_direction[:, 2], np.zeros(len(corner_rows)), segment_direction[:, 0])),
+    )
+    corner_rotations = direction_quaternions(np.where(has_helper[:, np.newaxis], helper_direction, fallback))
+
+    # Same order as walking the paths: start corner, segment tiles, ..., end corner
+    order_path = np.concatenate((segment_path[corner_segment], segment_path[segment_of_tile]))
+    order_segment = np.concatenate((segment_index[corner_segment] + is_end, segment_index[segment_of_tile]))
+    order_sub = np.concatenate((np.full(len(corner_rows), -1), j))
+    order = np.lexsort((order_sub, order_segment, order_path))
+
+    n_corners = len(corner_rows)
+    return TileArrays(
+        positions=np.concatenate((corner_positions, stretch_positions))[order],
+        rotations=np.concatenate((corner_rotations, stretch_rotations))[order],
+        stretchable=np.concatenate((np.zeros(n_corners, dtype=bool), np.ones(len(j), dtype=bool)))[order],
+        kind=np.concatenate((np.full(n_corners, TILE_CORNER), np.full(len(j), TILE_SEGMENT)))[order],
+        path=order_path[order],
+    )
+
+
+def generate_curve_tiles(curves, tile_width: float = TILE_WIDTH) -> TileArrays:
+    """
+    Tiles along curved paths: a corner tile at both ends of every curve and
+    stretchable tiles evenly spaced by arc length, facing along the curve.
+
+    The corners are oriented like the ones of generate_tiles without helper
+    points. For a two-point path without helpers, the tiles are the ones
+    generate_tiles places. Paths of more points differ from generate_tiles.
+    Their tiles are spread over the whole curve instead of segment by
+    segment, and there are no corner tiles on the inner points.
+
+    Args:
+        curves: spline.Curve per path, through (x, y, z) points
+        tile_width: Length covered by a stretchable tile
+    """
+    positions, rotations, stretchable, kind, owner = [], [], [], [], []
+    for index, curve in enumerate(curves):
+        length = curve.length
+        count = max(1, int(length / tile_width))
+        distances = np.concatenate(([0.0], (np.arange(count) + 0.5) * (length / count), [length]))
+        samples = curve.at(distances)
+        directions = samples.tangents.copy()
+        # Same corner orientation as generate_tiles without helper points
+        start, end = directions[0].copy(), directions[-1].copy()
+        directions[0] = (-start[2], 0.0, start[0])
+        directions[-1] = -end
+
+        positions.append(samples.positions)
+        rotations.append(direction_quaternions(directions))
+        stretchable.append(np.concatenate(([False], np.ones(count, dtype=bool), [False])))
+        kind.append(np.concatenate(([TILE_CORNER], np.full(count, TILE_SEGMENT), [TILE_CORNER])))
+        owner.append(np.full(count + 2, index))
+
+    if not positions:
+        return TileArrays(np.empty((0, 3)), np.empty((0, 4)), np.empty(0, dtype=bool), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+    return TileArrays(
+        np.concatenate(positions),
+        np.concatenate(rotations),
+        np.concatenate(stretchable),
+        np.concatenate(kind),
+        np.concatenate(owner),
+    )
+
+
+def path_curves(points: ConstructionPoints, paths: list[list[str]], alpha: float = 0.5) -> list:
+    """Centripetal Catmull-Rom through the construction points of every path with a segment"""
+    import spline
+
+    return [spline.CatmullRom(points.positions[points.rows(path)], alpha) for path in paths if len(path) >= 2]
+
+
+def generate_tiles_from_file(filename: str, tile_width: float = TILE_WIDTH) -> tuple[ConstructionPoints, TileArrays]:
+    """Tiles of every ConstructionLine of a TileConstruction .lsx"""
+    import spline_tech
+
+    construction_points, paths, _ = spline_tech.parse_construction_file(filename)
+    points = ConstructionPoints.from_dict(construction_points)
+    return points, generate_tiles(points, paths, tile_width)
+
 
 def generate_tiles_from_points(construction_points, path):
     """
@@ -190,110 +350,31 @@ def generate_tiles_from_points(construction_points, path):
     Returns:
         list of tile dictionaries with uuid, translate, rotate, stretchable
     """
-    tiles = []
-    
-    # Helper function to find helper point near a construction point
-    def find_helper(point_id):
-        point_pos = parse_vector3(construction_points[point_id]['position'])
-        for helper_id, data in construction_points.items():
-            if data['helper']:
-                helper_pos = parse_vector3(data['position'])
-                dist = vector3.length(helper_pos - point_pos)
-                if 0.1 < dist < 2.0:  # Helper is close but not at same position
-                    return helper_pos
-        return None
-    
-    # Process each segment
-    for i in range(len(path) - 1):
-        start_id = path[i]
-        end_id = path[i + 1]
-        
-        start_pos = parse_vector3(construction_points[start_id]['position'])
-        end_pos = parse_vector3(construction_points[end_id]['position'])
-        
-        # Calculate segment direction and length
-        segment_vector = end_pos - start_pos
-        segment_length = vector3.length(segment_vector)
-        segment_dir = vector3.normalize(segment_vector)
-        
-        # 1. Create corner tile at start point (if it's a stretch point)
-        if construction_points[start_id]['stretch']:
-            helper_pos = find_helper(start_id)
-            
-            # Determine rotation
-            if helper_pos is not None:
-                # Use helper to determine perpendicular direction
-                helper_dir = helper_pos - start_pos
-                helper_dir = vector3.normalize(helper_dir)
-                # Corner faces perpendicular to segment
-                corner_rotation = calculate_direction_quaternion(helper_dir)
-            else:
-                # Rotate 90 degrees from segment direction
-                perp_dir = Vector3([-segment_dir[2], 0.0, segment_dir[0]])
-                corner_rotation = calculate_direction_quaternion(perp_dir)
-            
-            tiles.append({
-                'uuid': str(uuid.uuid4()),
-                'translate': vector3_to_string(start_pos),
-                'rotate': quaternion_to_string(corner_rotation),
-                'stretchable': False,
-                'type': 'corner'
-            })
-        
-        # 2. Create stretchable tiles along segment
-        tile_width = 4.0  # Standard tile width
-        num_tiles = max(1, int(segment_length / tile_width))
-        
-        # Calculate rotation for segment tiles (facing along segment)
-        segment_rotation = calculate_direction_quaternion(segment_dir)
-        
-        # Place tiles evenly along segment
-        for j in range(num_tiles):
-            # Position tiles at regular intervals
-            t = (j + 0.5) / num_tiles if num_tiles > 1 else 0.5
-            tile_pos = start_pos + segment_vector * t
-            
-            tiles.append({
-                'uuid': str(uuid.uuid4()),
-                'translate': vector3_to_string(tile_pos),
-                'rotate': quaternion_to_string(segment_rotation),
-                'stretchable': True,
-                'type': 'segment'
-            })
-    
-    # 3. Create corner tile at end point
-    end_id = path[-1]
-    end_pos = parse_vector3(construction_points[end_id]['position'])
-    
-    if construction_points[end_id]['stretch']:
-        helper_pos = find_helper(end_id)
-        
-        # Get direction from previous segment
-        prev_start_pos = parse_vector3(construction_points[path[-2]]['position'])
-        prev_segment_dir = end_pos - prev_start_pos
-        prev_segment_dir = vector3.normalize(prev_segment_dir)
-        
-        if helper_pos is not None:
-            helper_dir = helper_pos - end_pos
-            helper_dir = vector3.normalize(helper_dir)
-            corner_rotation = calculate_direction_quaternion(helper_dir)
-        else:
-            # Face opposite to incoming segment
-            corner_rotation = calculate_direction_quaternion(-prev_segment_dir)
-        
-        tiles.append({
+    tiles = generate_tiles(ConstructionPoints.from_dict(construction_points), [path])
+
+    return [
+        {
             'uuid': str(uuid.uuid4()),
-            'translate': vector3_to_string(end_pos),
-            'rotate': quaternion_to_string(corner_rotation),
-            'stretchable': False,
-            'type': 'corner'
-        })
-    
-    return tiles
+            'translate': vector3_to_string(position),
+            'rotate': quaternion_to_string(rotation),
+            'stretchable': stretchable,
+            'type': 'segment' if stretchable else 'corner'
+        }
+        for position, rotation, stretchable in zip(
+            tiles.positions.tolist(), tiles.rotations.tolist(), tiles.stretchable.tolist()
+        )
+    ]
 
 
 # Example usage with your data
 if __name__ == "__main__":
+    import os
+    import sys
+
+    # Run as a script only this folder is on sys.path
+    sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import plot_points
+
     construction_points = {
         'ce908085-b558-9148-f463-a5b6d98b8670': {
             'position': '-8.854665 0 66.88342',
@@ -1,104 +1,128 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import xml.etree.ElementTree as ET
-import plot_points
 
-def get_attr(node: ET.Element, attr_id: str) -> Optional[str]:
-    """Helper: get attribute value by id"""
-    for a in node.findall("attribute"):
-        if a.attrib.get("id") == attr_id:
-            return a.attrib.get("value")
-    return None
-
-
-def parse_construction_points(root: ET.Element) -> Dict[str, Dict[str, Optional[str]]]:
-	points: Dict[str, Dict[str, Optional[str]]] = {}
-	spline = root.find(".//node[@id='ConstructionSpline']")
-
-	for node in spline.iter("node"):
-		if node.attrib.get("id") != "ConstructionPoint":
-			continue
-
-		cp_id = get_attr(node, "ConstructionPointId")
-		if not cp_id:
-			continue
-
-		stretch = get_attr(node, "ConstructionPointStretch") == "True"
-		helper = get_attr(node, "ConstructionHelperPoint") == "True"
-
-		transform = node.find(".//node[@id='ConstructionPointTransform']")
-		pos = None
-		if transform is not None:
-			pos = get_attr(transform, "Position")
-
-		points[cp_id] = {
-			"position": pos,
-			"stretch": stretch,
-			"helper": helper,
-		}
+TILE_CONSTRUCTION_FILE = r"E:\Games\Baldurs Gate 3\Data\Mods\procedural_ffda7ce9-3f05-0f4a-ee04-84f560c3c068\Levels\procedural2\TileConstructions\03d51ba4-e614-4b56-81f4-a90df060d57e.lsx"
+
+
+def node_attributes(node: ET.Element) -> Dict[str, Optional[str]]:
+    """Every attribute of a node read once, {id: value}"""
+    return {
+        attribute.get("id"): attribute.get("value")
+        for attribute in node.iterfind("attribute")
+    }
+
+
+def iter_construction(path: str) -> Iterator[Tuple[str, Union[str, List[str], Dict]]]:
+    """
+    Streams a TileConstruction .lsx
+
+    Yields:
+        ("point", (id, {position, stretch, helper})) for every ConstructionPoint of a ConstructionSpline
+        ("line", [point ids]) for every ConstructionLine, in order
+        ("tile", {uuid, translate, rotate, stretchable}) for every tile
+
+    Every node is removed from the tree once read, memory stays flat no
+    matter the size of the file.
+    """
+    elements: List[ET.Element] = []
+    node_ids: List[Optional[str]] = []
+
+    point_position: Optional[str] = None
+    line: List[str] = []
+
+    for event, element in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            elements.append(element)
+            if element.tag == "node":
+                node_id = element.get("id")
+                node_ids.append(node_id)
+                if node_id == "ConstructionPoint":
+                    point_position = None
+                elif node_id == "ConstructionLine":
+                    line = []
+            continue
 
-	return points
+        elements.pop()
+        if element.tag != "node":
+            continue
 
-def parse_construction_lines(root: ET.Element) -> List[List[str]]:
+        node_id = node_ids.pop()
+        in_line = "ConstructionLine" in node_ids
+
+        if node_id == "ConstructionPointTransform":
+            point_position = node_attributes(element).get("Position")
+
+        elif len(node_ids) >= 2 and node_ids[-1] == "ConstructionPoints" and node_ids[-2] == "ConstructionLine":
+            cp_id = node_attributes(element).get("ConstructionPointId")
+            if cp_id:
+                line.append(cp_id)
+
+        elif node_id == "ConstructionPoint" and not in_line and "ConstructionSpline" in node_ids:
+            attributes = node_attributes(element)
+            cp_id = attributes.get("ConstructionPointId")
+            if cp_id:
+                yield "point", (cp_id, {
+                    "position": point_position,
+                    "stretch": attributes.get("ConstructionPointStretch") == "True",
+                    "helper": attributes.get("ConstructionHelperPoint") == "True",
+                })
+
+        elif node_id == "ConstructionLine":
+            if line:
+                yield "line", line
+
+        elif node_id == "tile":
+            attributes = node_attributes(element)
+            yield "tile", {
+                "uuid": attributes.get("UUID"),
+                "translate": attributes.get("Translate"),
+                "rotate": attributes.get("QRotate"),
+                "stretchable": attributes.get("Stretchable") == "True",
+            }
+
+        if elements:
+            elements[-1].remove(element)
+        element.clear()
+
+
+def parse_construction_file(path: str) -> Tuple[Dict[str, Dict], List[List[str]], List[Dict]]:
+    """(points, paths, tiles) of a TileConstruction .lsx, read in one streaming pass"""
+    points: Dict[str, Dict] = {}
     paths: List[List[str]] = []
+    tiles: List[Dict] = []
 
-    line = root.find(".//node[@id='ConstructionLine']")
+    for kind, value in iter_construction(path):
+        if kind == "point":
+            cp_id, data = value
+            points[cp_id] = data
+        elif kind == "line":
+            paths.append(value)
+        else:
+            tiles.append(value)
 
-    # Get ordered ConstructionPoints
-    cps = line.find("./children/node[@id='ConstructionPoints']")
+    return points, paths, tiles
 
-    ordered = []
-    print(cps.find("children").findall("node"))
-    for cp in cps.find("children").findall("node"):
-        cp_id = get_attr(cp,"ConstructionPointId")
-        if cp_id:
-            ordered.append(cp_id)
-
-    if ordered:
-        paths.append(ordered)
-
-    return paths
-
-def parse_tiles(root: ET.Element) -> List[Dict[str, Optional[str]]]:
-    tiles = []
-
-    for node in root.iter("node"):
-        if node.attrib.get("id") != "tile":
-            continue
-
-        tile = {
-            "uuid": get_attr(node, "UUID"),
-            "translate": get_attr(node, "Translate"),
-            "rotate": get_attr(node, "QRotate"),
-            "stretchable": get_attr(node, "Stretchable") == "True",
-        }
-        tiles.append(tile)
-
-    return tiles
 
 def load_xml_data():
-	tree = ET.parse(r"E:\Games\Baldurs Gate 3\Data\Mods\procedural_ffda7ce9-3f05-0f4a-ee04-84f560c3c068\Levels\procedural2\TileConstructions\03d51ba4-e614-4b56-81f4-a90df060d57e.lsx")
-	root = tree.getroot()
+    import plot_points
+
+    points, paths, tiles = parse_construction_file(TILE_CONSTRUCTION_FILE)
 
-	points = parse_construction_points(root)
-	paths = parse_construction_lines(root)
-	tiles = parse_tiles(root)
+    print("\n=== LOGICAL PATHS ===")
+    for p in paths:
+        print(" -> ".join(p))
 
-	print("\n=== LOGICAL PATHS ===")
-	for p in paths:
-		print(" -> ".join(p))
+    print("\n=== CONSTRUCTION POINTS ===")
+    for k, v in points.items():
+        print(k, v)
 
-	print("\n=== CONSTRUCTION POINTS ===")
-	for k, v in points.items():
-		print(k, v)
+    print("\n=== TILE SEGMENTS ===")
+    for t in tiles:
+        print(t)
 
-	print("\n=== TILE SEGMENTS ===")
-	for t in tiles:
-		print(t)
-          
-	polylines = plot_points.build_polylines(points, paths)
-	plot_points.draw_polylines(polylines)
+    polylines = plot_points.build_polylines(points, paths)
+    plot_points.draw_polylines(polylines)
 
 
 if __name__ == "__main__":
-      load_xml_data()
-      
\ No newline at end of file
+    load_xml_data()
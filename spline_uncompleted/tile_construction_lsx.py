@@ -0,0 +1,167 @@
+"""
+TileConstruction .lsx output of generated spline tiles.
+
+Same approach as the GameObjects output of create_lsx: the document is split
+in compiled node templates, every node is formatted straight from the
+TileArrays rows and the whole file is written in one buffered call. The
+layout is the one spline_tech.iter_construction reads back: the construction
+points of the spline, then one ConstructionLine per path with its point ids
+and its tiles.
+
+The UUID of a tile node is the GUID of its tile type, shared by every tile of
+that type: CORNER_TILE_GUID for corners and STRETCH_TILE_GUID for the
+stretchable segments, picked from TileArrays.kind so the two can be told
+apart when the file is read back.
+"""
+
+import uuid
+from typing import Optional, Sequence
+from xml.sax.saxutils import quoteattr
+
+import numpy as np
+
+from create_tiles import (
+    CORNER_TILE_GUID, STRETCH_TILE_GUID, TILE_CORNER, TILE_SEGMENT, ConstructionPoints, TileArrays,
+)
+
+HEADER = """<?xml version="1.0" encoding="utf-8"?>
+<save>
+	<version major="4" minor="8" revision="0" build="10" lslib_meta="v1,bswap_guids,lsf_keys_adjacency" />
+	<region id="TileConstruction">
+		<node id="TileConstruction">
+			<children>
+				<node id="ConstructionSpline">
+					<attribute id="MapKey" type="FixedString" value={map_key} />
+					<children>
+						<node id="ConstructionPoints">
+							<children>
+"""
+
+POINT_TEMPLATE = """								<node id="ConstructionPoint">
+									<attribute id="ConstructionHelperPoint" type="bool" value="{helper}" />
+									<attribute id="ConstructionPointId" type="guid" value={id} />
+									<attribute id="ConstructionPointStretch" type="bool" value="{stretch}" />
+									<children>
+										<node id="ConstructionPointTransform">
+											<attribute id="Position" type="fvec3" value="{x} {y} {z}" />
+										</node>
+									</children>
+								</node>
+"""
+
+POINTS_END = """							</children>
+						</node>
+"""
+
+LINE_START = """						<node id="ConstructionLine">
+							<children>
+								<node id="ConstructionPoints">
+									<children>
+"""
+
+LINE_POINT_TEMPLATE = """										<node id="ConstructionPoint">
+											<attribute id="ConstructionPointId" type="guid" value={id} />
+										</node>
+"""
+
+LINE_TILES = """									</children>
+								</node>
+								<node id="Tiles">
+									<children>
+"""
+
+# Positional fields: uuid, stretchable, x, y, z, rotation x, y, z, w
+TILE_TEMPLATE = """										<node id="tile">
+											<attribute id="QRotate" type="fvec4" value="{5} {6} {7} {8}" />
+											<attribute id="Stretchable" type="bool" value="{1}" />
+											<attribute id="Translate" type="fvec3" value="{2} {3} {4}" />
+											<attribute id="UUID" type="guid" value="{0}" />
+										</node>
+"""
+
+LINE_END = """									</children>
+								</node>
+							</children>
+						</node>
+"""
+
+FOOTER = """					</children>
+				</node>
+			</children>
+		</node>
+	</region>
+</save>
+"""
+
+# Tile type GUID of every tile kind
+TILE_TYPE_GUIDS = {TILE_CORNER: CORNER_TILE_GUID, TILE_SEGMENT: STRETCH_TILE_GUID}
+
+
+def tile_type_guids(tiles: TileArrays) -> list[str]:
+    """Tile type GUID of every row of tiles, from its kind"""
+    return [TILE_TYPE_GUIDS[kind] for kind in tiles.kind.tolist()]
+
+
+def point_nodes(points: ConstructionPoints) -> list[str]:
+    return [
+        POINT_TEMPLATE.format(helper=helper, id=quoteattr(cp_id), stretch=stretch, x=x, y=y, z=z)
+        for cp_id, (x, y, z), stretch, helper in zip(
+            points.ids, points.positions.tolist(), points.stretch.tolist(), points.helper.tolist()
+        )
+    ]
+
+
+def tile_nodes(tiles: TileArrays, tile_guids: Sequence[str]) -> list[str]:
+    """One tile node per row of tiles, in the same order"""
+    return [
+        TILE_TEMPLATE.format(guid, stretchable, *position, *rotation)
+        for guid, stretchable, position, rotation in zip(
+            tile_guids, tiles.stretchable.tolist(), tiles.positions.tolist(), tiles.rotations.tolist()
+        )
+    ]
+
+
+def write_tile_construction(
+    path: str,
+    points: ConstructionPoints,
+    paths: list[list[str]],
+    tiles: TileArrays,
+    tile_guids: Optional[Sequence[str]] = None,
+    map_key: Optional[str] = None,
+) -> str:
+    """
+    Writes a complete TileConstruction .lsx
+
+    Args:
+        path: Destination file
+        points: Construction points of the spline
+        paths: Lists of construction point ids, as given to create_tiles.generate_tiles
+        tiles: Tiles of these paths
+        tile_guids: Tile type GUID of every tile, from tiles.kind when None
+        map_key: MapKey of the ConstructionSpline, a new one when None
+    """
+    if tile_guids is None:
+        tile_guids = tile_type_guids(tiles)
+    if len(tile_guids) != len(tiles):
+        raise ValueError(f"{len(tile_guids)} tile GUIDs for {len(tiles)} tiles")
+
+    # generate_tiles numbers only the paths with a segment
+    lines = [line for line in paths if len(line) >= 2]
+    nodes = tile_nodes(tiles, tile_guids)
+    # Tiles come sorted by path, so every line owns a contiguous range
+    bounds = np.searchsorted(tiles.path, np.arange(len(lines) + 1)).tolist()
+
+    parts = [HEADER.format(map_key=quoteattr(map_key or str(uuid.uuid4())))]
+    parts += point_nodes(points)
+    parts.append(POINTS_END)
+    for index, line in enumerate(lines):
+        parts.append(LINE_START)
+        parts += [LINE_POINT_TEMPLATE.format(id=quoteattr(cp_id)) for cp_id in line]
+        parts.append(LINE_TILES)
+        parts += nodes[bounds[index]:bounds[index + 1]]
+        parts.append(LINE_END)
+    parts.append(FOOTER)
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
+    return path
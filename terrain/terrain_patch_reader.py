@@ -7,8 +7,6 @@ import struct
 import numpy as np
 from typing import Dict, Optional
 import numpy.typing as npt
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
 
 
 class TerrainPatchReader:
@@ -153,7 +151,11 @@ class TerrainPatchReader:
         if self.grid is None:
             print("No grid data to visualize")
             return
-        
+
+        # Only needed to plot, reading a patch does not pay for matplotlib
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.mplot3d import Axes3D
+
         fig = plt.figure(figsize=(14, 10))
         ax = fig.add_subplot(111, projection='3d')
         
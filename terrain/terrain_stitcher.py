@@ -2,7 +2,6 @@ import os
 import re
 import struct
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Tuple, Optional, List, Any
 
 class TerrainStitcher:
@@ -82,6 +81,8 @@ class TerrainStitcher:
         if self.master_grid is None:
             return
 
+        import matplotlib.pyplot as plt
+
         display_data = self.master_grid[::downsample, ::downsample]
         rows, cols = display_data.shape
 
@@ -110,6 +111,35 @@ class TerrainStitcher:
         ax.view_init(elev=35, azim=-45)
         plt.show()
 
+def split_grid(grid: np.ndarray, directory: str, prefix: str, tile_rows: int = 65, tile_cols: int = 65) -> List[str]:
+    """
+    Inverse of TerrainStitcher.stitch: writes <prefix>_<x>_<y>.patch tiles of a stitched grid
+
+    Args:
+        grid: Stitched heights, its size a multiple of the tile size
+        directory: Folder where the tiles are written
+        prefix: Start of every tile name, e.g. the terrain UUID
+        tile_rows: Rows of a tile
+        tile_cols: Columns of a tile
+    """
+    from terrain_patch_writer import TerrainPatchWriter
+
+    rows, cols = grid.shape
+    if rows % tile_rows or cols % tile_cols:
+        raise ValueError(f"Grid {rows}x{cols} is not a whole number of {tile_rows}x{tile_cols} tiles")
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for y in range(rows // tile_rows):
+        for x in range(cols // tile_cols):
+            writer = TerrainPatchWriter(tile_cols, tile_rows)
+            writer.grid = grid[y * tile_rows:(y + 1) * tile_rows, x * tile_cols:(x + 1) * tile_cols].astype(np.float32)
+            path = os.path.join(directory, f"{prefix}_{x}_{y}.patch")
+            writer.write(path)
+            paths.append(path)
+    return paths
+
+
 if __name__ == "__main__":
     DATA_PATH = r"E:\Games\Baldurs Gate 3\Data\Editor\Mods\procedural_ffda7ce9-3f05-0f4a-ee04-84f560c3c068\Levels\procedural2\Terrains"
     stitcher = TerrainStitcher(DATA_PATH)
@@ -0,0 +1,65 @@
+"""Fixtures shared by the test modules"""
+
+import pytest
+
+DAE = """<?xml version="1.0" encoding="utf-8"?>
+<COLLADA xmlns="http://www.collada.org/2005/11/COLLADASchema" version="1.4.1">
+  <asset><up_axis>Y_UP</up_axis></asset>
+  <library_geometries>
+    <geometry id="first" name="first">
+      <mesh>
+        <source id="first-positions">
+          <float_array id="first-positions-array" count="9">0 0 0  2 0 0  0 3 1</float_array>
+          <technique_common>
+            <accessor source="#first-positions-array" count="3" stride="3">
+              <param name="X" type="float"/><param name="Y" type="float"/><param name="Z" type="float"/>
+            </accessor>
+          </technique_common>
+        </source>
+        <source id="first-normals">
+          <float_array id="first-normals-array" count="9">100 100 100  0 0 1  0 0 1</float_array>
+          <technique_common>
+            <accessor source="#first-normals-array" count="3" stride="3">
+              <param name="X" type="float"/><param name="Y" type="float"/><param name="Z" type="float"/>
+            </accessor>
+          </technique_common>
+        </source>
+        <vertices id="first-vertices">
+          <input semantic="POSITION" source="#first-positions"/>
+        </vertices>
+        <triangles count="1">
+          <input semantic="VERTEX" source="#first-vertices" offset="0"/>
+          <input semantic="NORMAL" source="#first-normals" offset="1"/>
+          <p>0 0 1 1 2 2</p>
+        </triangles>
+      </mesh>
+    </geometry>
+    <geometry id="second" name="second">
+      <mesh>
+        <source id="second-positions">
+          <float_array id="second-positions-array" count="9">-1 -2 0  0 0 4  1 1 1</float_array>
+          <technique_common>
+            <accessor source="#second-positions-array" count="3" stride="3">
+              <param name="X" type="float"/><param name="Y" type="float"/><param name="Z" type="float"/>
+            </accessor>
+          </technique_common>
+        </source>
+        <vertices id="second-vertices">
+          <input semantic="POSITION" source="#second-positions"/>
+        </vertices>
+        <triangles count="1">
+          <input semantic="VERTEX" source="#second-vertices" offset="0"/>
+          <p>0 1 2</p>
+        </triangles>
+      </mesh>
+    </geometry>
+  </library_geometries>
+</COLLADA>
+"""
+
+
+@pytest.fixture
+def dae_path(tmp_path):
+    path = tmp_path / "model.dae"
+    path.write_text(DAE, encoding="utf-8")
+    return str(path)
@@ -0,0 +1,64 @@
+import os
+
+from asset_inventory import AssetInventory
+
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, "w").close()
+
+
+def bump_mtime(folder):
+    # Two changes within the timer resolution of the filesystem would look the same
+    stat = os.stat(folder)
+    os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def make_tree(tmp_path):
+    root = str(tmp_path / "Assets")
+    touch(os.path.join(root, "Buildings", "Walls", "BLD_Wall_A.GR2"))
+    touch(os.path.join(root, "Props", "PROP_Barrel_A.GR2"))
+    return root, str(tmp_path / "inventory.json")
+
+
+def test_find_maps_exports_to_models(tmp_path):
+    root, _ = make_tree(tmp_path)
+    inventory = AssetInventory.scan(root)
+    assert inventory.find("bld_wall_a.dae") == "Buildings/Walls/BLD_Wall_A.GR2"
+    assert inventory.find("PROP_Barrel_A.GR2") == "Props/PROP_Barrel_A.GR2"
+    assert inventory.missing(["BLD_Wall_A.dae", "BLD_Wall_B.dae"]) == ["BLD_Wall_B.dae"]
+
+
+def test_saved_index_is_reused_while_the_tree_is_unchanged(tmp_path):
+    root, path = make_tree(tmp_path)
+    AssetInventory.load_or_scan(path, root)
+    saved_mtime = os.stat(path).st_mtime_ns
+
+    assert AssetInventory.load(path).is_fresh(root)
+    AssetInventory.load_or_scan(path, root)
+    assert os.stat(path).st_mtime_ns == saved_mtime
+
+
+def test_added_and_removed_files_trigger_a_new_scan(tmp_path):
+    root, path = make_tree(tmp_path)
+    AssetInventory.load_or_scan(path, root)
+
+    walls = os.path.join(root, "Buildings", "Walls")
+    touch(os.path.join(walls, "BLD_Wall_B.GR2"))
+    bump_mtime(walls)
+    assert AssetInventory.load_or_scan(path, root).find("BLD_Wall_B.dae") is not None
+
+    os.remove(os.path.join(root, "Props", "PROP_Barrel_A.GR2"))
+    bump_mtime(os.path.join(root, "Props"))
+    assert AssetInventory.load_or_scan(path, root).find("PROP_Barrel_A.dae") is None
+
+    touch(os.path.join(root, "Nature", "NAT_Tree_A.GR2"))
+    bump_mtime(root)
+    assert AssetInventory.load_or_scan(path, root).find("NAT_Tree_A.dae") == "Nature/NAT_Tree_A.GR2"
+
+
+def test_index_is_kept_without_the_tree(tmp_path):
+    root, path = make_tree(tmp_path)
+    AssetInventory.load_or_scan(path, root)
+    inventory = AssetInventory.load_or_scan(path, str(tmp_path / "missing"))
+    assert inventory.find("BLD_Wall_A.dae") is not None
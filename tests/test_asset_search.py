@@ -0,0 +1,91 @@
+import pytest
+
+from asset_search import NameIndex, infer_parent
+
+NAMES = [
+    "WALL_City_Lower_A",
+    "WALL_City_Lower_A_Broken",
+    "WALL_City_Lower_B",
+    "WALL_City_Lower_Corner_A",
+    "WALL_City_Upper_A",
+    "WALL_Village_Lower_A",
+    "BLD_City_Wall_Tower_A",
+    "BLD_Village_Wall_Support_B",
+    "PLA_Forest_Tree_A",
+]
+
+
+def old_parent(name, names):
+    """The lookup of the old bounds merge script: drop two tokens at a time, five times at most"""
+    iterate_str = name
+    for _ in range(5):
+        iterate_str = "_".join(iterate_str.split("_")[0:-2])
+        if iterate_str == "":
+            return None
+        if iterate_str in names:
+            return iterate_str
+    return None
+
+
+@pytest.fixture
+def index():
+    return NameIndex(NAMES)
+
+
+def test_prefix_is_sorted_and_case_insensitive(index):
+    expected = sorted(name for name in NAMES if name.startswith("WALL_City_Lower_"))
+    assert index.prefix("WALL_City_Lower_*") == expected
+    assert index.prefix("wall_city_lower_") == expected
+    assert index.prefix("WALL_City_Lower_*", limit=2) == expected[:2]
+    assert index.prefix("WALL_Crypt_*") == []
+
+
+def test_tokens_match_whole_tokens_in_any_order(index):
+    assert index.tokens("wall", "village") == ["BLD_Village_Wall_Support_B", "WALL_Village_Lower_A"]
+    assert index.tokens("Lower", "City") == index.tokens("city", "lower")
+    # Tokens are not substrings
+    assert index.tokens("low") == []
+    assert index.tokens() == []
+
+
+def test_fuzzy_tolerates_a_typo(index):
+    results = index.fuzzy("WALL_Ctiy_Lower_B", limit=3)
+    assert results[0][0] == "WALL_City_Lower_B"
+    assert all(0.6 <= score <= 1.0 for _, score in results)
+    assert [score for _, score in results] == sorted((score for _, score in results), reverse=True)
+    assert index.fuzzy("zzzzzzzz") == []
+
+
+def test_search_dispatches_on_the_query(index):
+    assert index.search("WALL_City_Upper*") == ["WALL_City_Upper_A"]
+    assert index.search("PLA_Forest_Tree_A") == ["PLA_Forest_Tree_A"]
+    assert index.search("PLA_Forset_Tree_A", limit=1) == ["PLA_Forest_Tree_A"]
+
+
+def test_infer_parent_is_the_longest_indexed_prefix(index):
+    assert index.infer_parent("WALL_City_Lower_A_Broken_Rubble") == "WALL_City_Lower_A_Broken"
+    assert index.infer_parent("WALL_City_Lower_A") is None
+    assert index.infer_parent("DEC_Unknown_Thing") is None
+    # Only whole tokens are removed
+    assert infer_parent("WALL_City_Lower_AB", {"WALL_City_Lower_A"}) is None
+    assert infer_parent("WALL_City_Lower_A_1_2_3", {"WALL_City_Lower_A"}, max_removed_tokens=2) is None
+
+
+@pytest.mark.parametrize("name, old, new", [
+    # Two tokens away: both find it
+    ("WALL_City_Lower_A_Dirty_Broken", "WALL_City_Lower_A", "WALL_City_Lower_A"),
+    ("BLD_Village_Wall_Support_B_Snow_Heavy", "BLD_Village_Wall_Support_B", "BLD_Village_Wall_Support_B"),
+    # The old lookup dropped two tokens at a time and skipped the closer parent
+    ("WALL_City_Lower_A_Broken_01", "WALL_City_Lower_A", "WALL_City_Lower_A_Broken"),
+    # An odd number of tokens away: only infer_parent finds it
+    ("PLA_Forest_Tree_A_Dead", None, "PLA_Forest_Tree_A"),
+    ("WALL_City_Lower_B_Moss_01_Wet", None, "WALL_City_Lower_B"),
+    ("PLA_Forest_Tree", None, None),
+])
+def test_infer_parent_against_the_old_lookup(name, old, new):
+    names = set(NAMES)
+    assert old_parent(name, names) == old
+    assert infer_parent(name, names) == new
+    # Whatever the old lookup found is a prefix of the parent found now
+    if old is not None:
+        assert new.startswith(old)
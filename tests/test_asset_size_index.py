@@ -0,0 +1,89 @@
+import random
+
+import numpy as np
+import pytest
+
+from asset_catalog import ModelData
+from asset_size_index import SizeIndex
+
+FAMILIES = ["WALL", "BLD", "PLA", "DEC"]
+
+
+def model(name, size, uuid="uuid"):
+    return ModelData(uuid, size, (0.0, size[1] / 2, 0.0), name=name)
+
+
+@pytest.fixture(scope="module")
+def models():
+    rng = random.Random(5)
+    return [
+        model(f"{rng.choice(FAMILIES)}_{i}", (rng.uniform(0.1, 20.0), rng.uniform(0.1, 10.0), rng.uniform(0.05, 5.0)))
+        for i in range(2000)
+    ]
+
+
+def sizes(model_data):
+    return np.array([model_data.offset_x, model_data.offset_y, model_data.offset_z])
+
+
+def test_query_matches_brute_force(models):
+    index = SizeIndex(models)
+
+    results = index.query(width=4.0, height=(1.0, 5.0), prefix="WALL_")
+
+    expected = {
+        m.name for m in models
+        if 3.6 <= m.offset_x <= 4.4 and 1.0 <= m.offset_y <= 5.0 and m.name.startswith("WALL_")
+    }
+    assert {m.name for m, _ in results} == expected
+    scores = [score for _, score in results]
+    assert scores == sorted(scores)
+
+
+def test_query_by_aspect_ratio(models):
+    index = SizeIndex(models)
+
+    wide = index.query(aspect=(3.0, None))
+    flat_footprint = index.query(aspect=2.0, tolerance=0.25, aspect_axes=(0, 2), depth=(None, 1.0))
+
+    assert {m.name for m, _ in wide} == {m.name for m in models if m.offset_x / m.offset_y >= 3.0}
+    assert {m.name for m, _ in flat_footprint} == {
+        m.name for m in models if 1.5 <= m.offset_x / m.offset_z <= 2.5 and m.offset_z <= 1.0
+    }
+    # Ranked by how close the ratio is to the middle of the range, in log space
+    middle = (np.log2(1.5) + np.log2(2.5)) / 2
+    ratios = [abs(np.log2(m.offset_x / m.offset_z) - middle) for m, _ in flat_footprint]
+    assert ratios == sorted(ratios)
+
+
+def test_prefix_mask_covers_exactly_the_prefix(models):
+    index = SizeIndex(models)
+
+    for prefix in ["WALL_", "WALL_1", "BLD_19", "ZZZ", ""]:
+        expected = np.array([m.name.startswith(prefix) for m in index.models])
+        np.testing.assert_array_equal(index.prefix_mask(prefix), expected)
+    assert index.query(prefix="ZZZ") == []
+
+
+def test_nearest_matches_brute_force(models):
+    index = SizeIndex(models)
+    target = (4.0, 2.5, 0.5)
+
+    results = index.nearest(target, k=7, prefix="PLA_")
+
+    candidates = [m for m in models if m.name.startswith("PLA_")]
+    distances = sorted(np.linalg.norm(np.log2(sizes(m)) - np.log2(target)) for m in candidates)
+    assert [distance for _, distance in results] == pytest.approx(distances[:7])
+    assert all(m.name.startswith("PLA_") for m, _ in results)
+
+
+def test_substitute_stays_in_the_family_and_skips_itself(models):
+    index = SizeIndex(models)
+    original = next(m for m in models if m.name.startswith("DEC_"))
+
+    results = index.substitute(original, k=3)
+
+    assert len(results) == 3
+    assert all(m.name.startswith("DEC_") and m.name != original.name for m, _ in results)
+    twin = model("DEC_twin", (original.offset_x, original.offset_y, original.offset_z))
+    assert SizeIndex(models + [twin]).substitute(original, k=1)[0][0].name == "DEC_twin"
@@ -0,0 +1,70 @@
+import json
+import os
+
+import catalog_db
+from asset_catalog import AssetCatalog
+
+
+def write_bounds(folder, entries, filename="props_objects.json"):
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, filename)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entries, f)
+    return path
+
+
+def model(name, uuid=None, size=(1.0, 2.0, 3.0)):
+    entry = {"name": name, "size": list(size), "center_offset": [0.0, 0.5, 0.0], "relative_path": f"{name}.GR2"}
+    if uuid is not None:
+        entry["uuid"] = uuid
+    return entry
+
+
+def test_catalog_is_rebuilt_when_a_source_changes(tmp_path):
+    bounds, output, db_path = str(tmp_path / "bounds"), str(tmp_path / "output"), str(tmp_path / "catalog.sqlite")
+    path = write_bounds(bounds, [model("A", "uuid-a")])
+
+    assert not catalog_db.is_fresh(db_path, bounds, output)
+    catalog_db.ensure_catalog(db_path, bounds, output)
+    assert catalog_db.is_fresh(db_path, bounds, output)
+
+    write_bounds(bounds, [model("A", "uuid-a"), model("B", "uuid-b")])
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 10**9))
+    assert not catalog_db.is_fresh(db_path, bounds, output)
+    catalog_db.ensure_catalog(db_path, bounds, output)
+    assert AssetCatalog.load_compiled(db_path, bounds, output).find_data("B").uuid == "uuid-b"
+
+    write_bounds(bounds, [model("C", "uuid-c")], "other_objects.json")
+    assert not catalog_db.is_fresh(db_path, bounds, output)
+
+
+def test_compile_leaves_no_temporary_file(tmp_path):
+    bounds, output, db_path = str(tmp_path / "bounds"), str(tmp_path / "output"), str(tmp_path / "catalog.sqlite")
+    write_bounds(bounds, [model("A", "uuid-a")])
+    catalog_db.compile_catalog(db_path, bounds, output)
+    catalog_db.compile_catalog(db_path, bounds, output)
+    assert sorted(os.listdir(tmp_path)) == ["bounds", "catalog.sqlite"]
+
+
+def test_compiled_lookups_match_the_json_catalog(tmp_path):
+    bounds, output, db_path = str(tmp_path / "bounds"), str(tmp_path / "output"), str(tmp_path / "catalog.sqlite")
+    # "A" first without an UUID: the entry with one wins
+    write_bounds(bounds, [model("A"), model("A", "uuid-a2", size=(4.0, 4.0, 4.0)), model("B", "uuid-b"), model("C")])
+
+    compiled = AssetCatalog.load_compiled(db_path, bounds, output)
+    parsed = AssetCatalog.load(bounds)
+    for name in ("A", "B", "C", "missing"):
+        expected = parsed.find_data(name)
+        found = compiled.find_data(name)
+        assert (found is None) == (expected is None)
+        if expected is not None:
+            assert (found.uuid, found.offset_x, found.relative_path, found.category) == (
+                expected.uuid, expected.offset_x, expected.relative_path, expected.category
+            )
+    assert compiled.find_by_uuid("uuid-b").name == "B"
+    assert "C" in compiled and "missing" not in compiled
+
+    # Reading every row keeps the same answers
+    assert len(compiled) == 4
+    assert compiled.find_data("A").uuid == "uuid-a2"
+    assert [m.name for m in compiled.category("props")] == ["A", "A", "B", "C"]
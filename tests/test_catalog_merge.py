@@ -0,0 +1,97 @@
+import json
+import os
+
+import catalog_merge
+
+
+def write_json(path, data, **dump_options):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, **dump_options)
+    # Moves the mtime forward, two writes within the timer resolution look unchanged
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def bounds_entry(name, uuid=None):
+    entry = {"name": name, "relative_path": f"{name}.GR2", "size": [1, 2, 3], "center_offset": [0, 1, 0]}
+    if uuid is not None:
+        entry["uuid"] = uuid
+    return entry
+
+
+def make_inputs(tmp_path):
+    bounds, output = tmp_path / "bounds", tmp_path / "output"
+    walls, props = str(bounds / "walls_objects.json"), str(bounds / "props_objects.json")
+    # Compact JSON, a different format than the one merge writes
+    write_json(walls, [bounds_entry("WALL_A"), bounds_entry("WALL_B", "uuid-b")])
+    write_json(props, [bounds_entry("PROP_A", "uuid-prop")])
+    write_json(str(output / "scenery.json"), [{"name": "WALL_A", "uuid": "uuid-a"}, {"name": "WALL_B", "uuid": "uuid-b"}])
+    write_json(str(output / "items.json"), [{"name": "PROP_A", "uuid": "uuid-prop"}])
+    return str(bounds), str(output), walls, props, str(tmp_path / "manifest.json")
+
+
+def test_merge_fills_uuids_and_adds_variants(tmp_path):
+    bounds, output, walls, props, manifest = make_inputs(tmp_path)
+    write_json(os.path.join(output, "scenery.json"), [
+        {"name": "WALL_A", "uuid": "uuid-a"},
+        {"name": "WALL_A_Moss_Broken", "uuid": "uuid-moss"},
+    ])
+
+    stats = catalog_merge.merge(bounds, output, manifest)
+    assert stats == {"uuids_matched": 1, "entries_added": 1, "files_written": 1}
+
+    entries = {entry["name"]: entry for entry in read_json(walls)}
+    assert entries["WALL_A"]["uuid"] == "uuid-a"
+    assert entries["WALL_A_Moss_Broken"]["parent"] == "WALL_A"
+    assert entries["WALL_A_Moss_Broken"]["size"] == [1, 2, 3]
+
+
+def test_unchanged_data_is_not_rewritten(tmp_path):
+    bounds, output, walls, props, manifest = make_inputs(tmp_path)
+    with open(props, encoding="utf-8") as f:
+        compact = f.read()
+
+    catalog_merge.merge(bounds, output, manifest)
+    # Nothing to merge in props: its own format is kept
+    with open(props, encoding="utf-8") as f:
+        assert f.read() == compact
+
+    assert catalog_merge.merge(bounds, output, manifest)["files_written"] == 0
+
+
+def test_only_changed_inputs_are_merged_again(tmp_path):
+    bounds, output, walls, props, manifest = make_inputs(tmp_path)
+    catalog_merge.merge(bounds, output, manifest)
+    walls_mtime = os.stat(walls).st_mtime_ns
+
+    # Bounds edited by hand and a template file updated: only those two are merged again
+    data = read_json(props)
+    data[0].pop("uuid")
+    data.append(bounds_entry("PROP_B"))
+    write_json(props, data)
+    write_json(os.path.join(output, "items.json"), [
+        {"name": "PROP_A", "uuid": "uuid-prop"},
+        {"name": "PROP_B", "uuid": "uuid-prop-b"},
+    ])
+
+    stats = catalog_merge.merge(bounds, output, manifest)
+    assert stats == {"uuids_matched": 2, "entries_added": 0, "files_written": 1}
+    assert os.stat(walls).st_mtime_ns == walls_mtime
+    assert [entry["uuid"] for entry in read_json(props)] == ["uuid-prop", "uuid-prop-b"]
+
+
+def test_templates_of_unchanged_files_are_skipped(tmp_path):
+    bounds, output, walls, props, manifest = make_inputs(tmp_path)
+    catalog_merge.merge(bounds, output, manifest)
+
+    # A new template file only brings its own templates
+    write_json(os.path.join(output, "more.json"), [{"name": "PROP_A_Red", "uuid": "uuid-red"}])
+    stats = catalog_merge.merge(bounds, output, manifest)
+    assert stats == {"uuids_matched": 0, "entries_added": 1, "files_written": 1}
+    assert read_json(props)[-1]["name"] == "PROP_A_Red"
@@ -0,0 +1,31 @@
+import json
+import subprocess
+
+import cli
+import convert
+from generation_context import GenerationContext
+from sector_output import SECTOR_INDEX_FILENAME
+
+
+def test_report_is_written_when_divine_fails(tmp_path, monkeypatch):
+    report = tmp_path / "run_report.json"
+    monkeypatch.setattr(convert, "generate", lambda *args, **kwargs: GenerationContext(str(tmp_path / "lsx"), seed=1))
+    monkeypatch.setattr(convert, "convert_folder", lambda *args: subprocess.CompletedProcess(args, 3))
+
+    status = cli.main(["generate", "dungeon.ds", "-o", str(tmp_path / "lsx"), "--convert", "--report", str(report)])
+
+    assert status == 3
+    assert "counters" in json.loads(report.read_text(encoding="utf-8"))
+
+
+def test_unknown_wall_still_closes_the_sectors(tmp_path, monkeypatch):
+    output = tmp_path / "lsx"
+    output.mkdir()
+    (output / "AUTO_SECTOR_0_0.lsx").write_text("stale", encoding="utf-8")
+    monkeypatch.setattr(convert, "generate_level", lambda *args, **kwargs: False)
+
+    assert convert.generate("dungeon.ds", str(output), "UNKNOWN_WALL", sector_size=64.0) is None
+
+    index = json.loads((output / SECTOR_INDEX_FILENAME).read_text(encoding="utf-8"))
+    assert index["sectors"] == []
+    assert not (output / "AUTO_SECTOR_0_0.lsx").exists()
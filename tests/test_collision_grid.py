@@ -0,0 +1,83 @@
+import math
+import random
+
+import pytest
+from pyrr import Quaternion, Vector3
+
+from asset_catalog import ModelData
+from collision_grid import CollisionGrid, Footprint, footprint_from_model, footprints_overlap
+from corridor_generator import ChainLink
+
+
+def test_rotated_boxes_are_separated_on_their_own_axes():
+    # Their axis aligned bounds overlap, the boxes themselves do not
+    a = Footprint(0.0, 0.0, 2.0, 0.25, math.radians(45))
+    b = Footprint(1.2, -1.2, 2.0, 0.25, math.radians(45))
+    assert not footprints_overlap(a, b)
+    assert footprints_overlap(a, b._replace(x=0.2, z=-0.2))
+
+
+def test_crossing_boxes_overlap():
+    a = Footprint(0.0, 0.0, 3.0, 0.2, 0.0)
+    b = Footprint(0.0, 0.0, 3.0, 0.2, math.pi / 2)
+    assert footprints_overlap(a, b)
+
+
+def test_walls_laid_end_to_end_only_touch():
+    a = Footprint(0.0, 0.0, 2.0, 0.25, 0.0)
+    b = Footprint(4.0, 0.0, 2.0, 0.25, 0.0)
+    assert not footprints_overlap(a, b, shrink=0.05)
+    assert footprints_overlap(a, b.moved(-0.2, 0.0), shrink=0.05)
+
+
+def test_footprint_follows_the_model_transform():
+    model = ModelData("uuid", [4.0, 3.0, 0.5], [1.0, 1.5, 0.0])
+    rotation = Quaternion.from_y_rotation(math.pi / 2)
+    footprint = footprint_from_model(model, Vector3([10.0, 0.0, 5.0]), rotation, 2.0)
+
+    # The center offset turns with the model (local +X to world -Z) and is scaled with it
+    assert (footprint.x, footprint.z) == pytest.approx((10.0, 3.0))
+    assert (footprint.half_x, footprint.half_z) == (4.0, 0.5)
+    assert abs(math.cos(footprint.angle)) == pytest.approx(0.0, abs=1e-9)
+
+
+def test_grid_matches_brute_force():
+    rng = random.Random(3)
+    grid = CollisionGrid(cell_size=2.0)
+    inserted = []
+    for _ in range(400):
+        footprint = Footprint(rng.uniform(0, 40), rng.uniform(0, 40), rng.uniform(0.1, 3), rng.uniform(0.1, 1), rng.uniform(0, math.pi))
+        expected = not any(footprints_overlap(footprint, other, grid.shrink) for other in inserted)
+        assert grid.try_insert(footprint) == expected
+        if expected:
+            inserted.append(footprint)
+    assert len(grid) == len(inserted)
+
+    probe = Footprint(20.0, 20.0, 5.0, 5.0, 0.3)
+    expected = [i for i, other in enumerate(inserted) if footprints_overlap(probe, other, grid.shrink)]
+    assert sorted(grid.query(probe)) == expected
+
+
+def test_resolve_nudges_to_a_free_spot():
+    grid = CollisionGrid()
+    grid.insert(Footprint(0.0, 0.0, 0.5, 0.5, 0.0))
+
+    resolved = grid.resolve(Footprint(0.2, 0.0, 0.5, 0.5, 0.0), max_nudge=1.0)
+    assert resolved is not None and resolved != Footprint(0.2, 0.0, 0.5, 0.5, 0.0)
+    assert len(grid) == 2
+    assert grid.resolve(Footprint(0.0, 0.0, 5.0, 5.0, 0.0), max_nudge=0.5) is None
+
+
+def test_ignored_footprints_do_not_collide():
+    grid = CollisionGrid()
+    first = grid.insert(Footprint(0.0, 0.0, 2.0, 0.25, 0.0))
+    grid.insert(Footprint(3.0, 0.0, 2.0, 0.25, 0.0))
+    piece = Footprint(1.5, 0.0, 2.0, 0.25, 0.0)
+
+    assert not grid.try_insert(piece, ignore={first})
+    assert grid.try_insert(piece, ignore={0, 1})
+
+
+@pytest.mark.parametrize("closed, expected", [(False, [{1}, {0, 2}, {1}]), (True, [{1, 2}, {0, 2}, {0, 1}])])
+def test_chain_neighbours(closed, expected):
+    assert [ChainLink("wall", index, 3, closed).neighbours() for index in range(3)] == expected
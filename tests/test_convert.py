@@ -0,0 +1,72 @@
+import json
+
+import numpy as np
+import pytest
+
+import convert
+from asset_catalog import AssetCatalog
+from collision_grid import CollisionGrid
+from generation_context import GenerationContext
+from parsers.extract_points_dungeon import SCALE
+from sector_output import SectorWriter
+
+WALL_UUID = "0f6a3c56-58c2-4c55-9a0e-1f1c3a7a2b11"
+
+
+def write_rooms(path, rooms):
+    """.ds file of rectangular rooms, each (x, z, width, depth) in meters"""
+    polygons = []
+    for x, z, width, depth in rooms:
+        corners = [(x, z), (x + width, z), (x + width, z + depth), (x, z + depth), (x, z)]
+        polygons.append([[[cx / SCALE, -cz / SCALE] for cx, cz in corners]])
+    document = {"state": {"document": {"nodes": {"geometry": {"polygons": polygons, "polylines": []}}}}}
+    path.write_text(json.dumps(document), encoding="utf-8")
+    return str(path)
+
+
+def wall_context(tmp_path, collision_mode="reject", center_offset=(0.0, 0.0, 0.0)):
+    catalog = AssetCatalog()
+    catalog.add({"name": "WALL", "size": [4.0, 4.5, 0.5], "center_offset": list(center_offset), "uuid": WALL_UUID})
+    return GenerationContext(
+        str(tmp_path), seed=1, catalog=catalog, collision=CollisionGrid(), collision_mode=collision_mode,
+        sink=SectorWriter(str(tmp_path), 64.0),
+    )
+
+
+def test_no_wall_piece_is_dropped(tmp_path):
+    dungeon = write_rooms(tmp_path / "rooms.ds", [(0.0, 0.0, 10.0, 6.0), (20.0, 0.0, 13.0, 9.0)])
+    context = wall_context(tmp_path)
+
+    assert convert.generate_level(context, dungeon, "WALL", workers=1)
+
+    walls, _, _ = context.load_dungeon(dungeon)
+    expected = sum(len(convert.wall_placements(WALL_UUID, 4.0, polygon, 0)) for polygon in walls)
+    assert context.rejected == 0
+    assert context.stats.counters["objects_emitted"] == expected
+
+
+def test_walls_still_reject_other_objects(tmp_path):
+    dungeon = write_rooms(tmp_path / "rooms.ds", [(0.0, 0.0, 10.0, 6.0)])
+    context = wall_context(tmp_path)
+    convert.generate_level(context, dungeon, "WALL", workers=1)
+
+    # A second wall laid over the first one is not part of its chain
+    walls, _, _ = context.load_dungeon(dungeon)
+    context.emit_all(convert.wall_placements(WALL_UUID, 4.0, walls[0], 0, chain="copy"))
+
+    assert context.rejected > 0
+
+
+@pytest.mark.parametrize("center_offset", [(0.0, 0.0, 0.0), (0.6, 2.0, -0.1)])
+def test_closed_rectangle_is_covered_from_corner_to_corner(tmp_path, center_offset):
+    dungeon = write_rooms(tmp_path / "rooms.ds", [(0.0, 0.0, 10.0, 7.0)])
+    context = wall_context(tmp_path, center_offset=center_offset)
+
+    convert.generate_level(context, dungeon, "WALL", workers=1)
+
+    assert context.rejected == 0
+    # Pieces are centred on the outline: nothing sticks out past a corner
+    bounds = np.array([footprint.bounds() for footprint in context.collision.footprints])
+    margin = 0.25 + 0.1
+    assert bounds[:, 0].min() >= -margin and bounds[:, 1].min() >= -margin
+    assert bounds[:, 2].max() <= 10.0 + margin and bounds[:, 3].max() <= 7.0 + margin
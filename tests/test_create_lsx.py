@@ -0,0 +1,48 @@
+import re
+
+import create_lsx
+from pyrr import Quaternion, Vector3
+
+
+def object_name(xml: str) -> str:
+    return re.search(create_lsx.get_pattern_attribute_xml("Name"), xml).group(2)
+
+
+def test_names_are_unique_without_an_allocator():
+    first = create_lsx.create_object_xml(create_lsx.XML_TEMPLATE, name="TEST_Direct_Caller")
+    second = create_lsx.create_object_xml(create_lsx.XML_TEMPLATE, name="TEST_Direct_Caller")
+    assert object_name(first) == "TEST_Direct_Caller"
+    assert object_name(second) == "TEST_Direct_Caller_000"
+
+
+def test_allocators_are_independent():
+    first, second = create_lsx.NameAllocator(), create_lsx.NameAllocator()
+    assert first.allocate("WALL_A") == "WALL_A"
+    assert second.allocate("WALL_A") == "WALL_A"
+    assert first.allocate("WALL_A") == "WALL_A_000"
+
+
+def test_suffix_of_the_base_name_is_replaced():
+    names = create_lsx.NameAllocator()
+    assert names.allocate("WALL_A_000") == "WALL_A_000"
+    assert names.allocate("WALL_A_000") == "WALL_A_001"
+    assert names.allocate("WALL_A") == "WALL_A"
+    assert names.allocate("WALL_A") == "WALL_A_002"
+
+
+def test_create_xml_writes_one_file_per_object(tmp_path):
+    names = create_lsx.NameAllocator()
+    path = create_lsx.create_xml(
+        str(tmp_path),
+        name="TEST_Object",
+        level_name="my_level",
+        uuid="17c5529a-a991-415d-9478-52c29dfbaf06",
+        position=Vector3([1.0, 2.0, 3.0]),
+        rotation=Quaternion([0.0, 0.0, 0.0, 1.0]),
+        scale=1.0,
+        names=names,
+    )
+    xml = open(path, encoding="utf-8").read()
+    assert object_name(xml) == "TEST_Object"
+    assert 'id="LevelName" type="FixedString" value="my_level"' in xml
+    assert 'value="1.0 2.0 3.0"' in xml
@@ -0,0 +1,70 @@
+import numpy as np
+
+from create_tiles import (
+    TILE_CORNER, TILE_SEGMENT, ConstructionPoints, KDTree, generate_curve_tiles, generate_tiles, path_curves,
+)
+
+
+def construction_points(positions, helper=None):
+    helper = helper if helper is not None else [False] * len(positions)
+    ids = [f"cp{i}" for i in range(len(positions))]
+    return ConstructionPoints(ids, positions, [not h for h in helper], helper)
+
+
+def test_curve_tiles_of_a_two_point_path_match_generate_tiles():
+    points = construction_points([(0.0, 0.0, 0.0), (10.0, 0.0, 6.0)])
+    paths = [["cp0", "cp1"]]
+
+    straight = generate_tiles(points, paths)
+    curved = generate_curve_tiles(path_curves(points, paths))
+
+    np.testing.assert_allclose(curved.positions, straight.positions, atol=1e-9)
+    np.testing.assert_allclose(curved.rotations, straight.rotations, atol=1e-9)
+    np.testing.assert_array_equal(curved.kind, straight.kind)
+    np.testing.assert_array_equal(curved.stretchable, straight.stretchable)
+
+
+def test_curve_tiles_have_corners_on_the_ends_only():
+    points = construction_points([(0.0, 0.0, 0.0), (8.0, 0.0, 0.0), (8.0, 0.0, 8.0)])
+    paths = [["cp0", "cp1", "cp2"]]
+
+    straight = generate_tiles(points, paths)
+    curved = generate_curve_tiles(path_curves(points, paths))
+
+    assert (straight.kind == TILE_CORNER).sum() == 3
+    assert curved.kind.tolist() == [TILE_CORNER] + [TILE_SEGMENT] * (len(curved) - 2) + [TILE_CORNER]
+    np.testing.assert_allclose(curved.positions[[0, -1]], [(0.0, 0.0, 0.0), (8.0, 0.0, 8.0)], atol=1e-9)
+
+
+def test_kd_tree_radius_query_matches_brute_force():
+    rng = np.random.default_rng(3)
+    positions = rng.uniform(-20.0, 20.0, size=(500, 3))
+    tree = KDTree(positions, leaf_size=8)
+
+    for point in rng.uniform(-22.0, 22.0, size=(50, 3)):
+        distance = np.linalg.norm(positions - point, axis=1)
+        expected = np.flatnonzero(distance < 6.0)
+
+        hits = tree.query_radius(point, 6.0)
+
+        assert sorted(hits.tolist()) == expected.tolist()
+        assert np.all(np.diff(distance[hits]) >= 0)
+
+
+def test_kd_tree_handles_duplicates_and_no_points():
+    tree = KDTree(np.zeros((40, 3)), leaf_size=4)
+
+    assert len(tree.query_radius((0.0, 0.0, 0.0), 0.5)) == 40
+    assert len(KDTree(np.empty((0, 3))).query_radius((0.0, 0.0, 0.0), 10.0)) == 0
+
+
+def test_helper_is_the_closest_one_past_the_minimum_distance():
+    points = construction_points(
+        [(0.0, 0.0, 0.0), (0.05, 0.0, 0.0), (0.0, 0.0, 1.5), (1.0, 0.0, 0.0), (5.0, 0.0, 5.0)],
+        helper=[False, True, True, True, False],
+    )
+
+    helpers, found = points.find_helpers(np.array([0, 4]))
+
+    assert found.tolist() == [True, False]
+    np.testing.assert_allclose(helpers[0], (1.0, 0.0, 0.0))
@@ -0,0 +1,35 @@
+import math
+
+import numpy as np
+import pytest
+
+from parsers import dae_scanner, extract_bounds
+
+
+def test_only_positions_are_scanned(dae_path):
+    meshes = dae_scanner.scan_positions(dae_path)
+    assert [mesh.shape for mesh in meshes] == [(3, 3), (3, 3)]
+
+    size, center = dae_scanner.aabb(dae_scanner.analyze_dae_fast(dae_path))
+    assert size == [3.0, 5.0, 4.0]
+    assert center == [0.5, 0.5, 2.0]
+
+
+def test_scanner_matches_pycollada(dae_path):
+    pytest.importorskip("collada")
+    expected = extract_bounds.analyze_dae_collada(dae_path)
+    assert np.allclose(extract_bounds.analyze_dae(dae_path), expected)
+
+
+def test_oriented_box_of_a_rotated_rectangle():
+    angle = math.radians(30)
+    corners = np.array([[x, z] for x in (-4.0, 4.0) for z in (-1.0, 1.0)])
+    rotation = np.array([[math.cos(angle), -math.sin(angle)], [math.sin(angle), math.cos(angle)]])
+    xz = corners @ rotation.T + [10.0, -5.0]
+    points = np.array([[x, y, z] for x, z in xz for y in (0.0, 2.0)])
+
+    assert len(dae_scanner.footprint_hull(points)) == 4
+    box = dae_scanner.oriented_box(points)
+    assert sorted([box["size"][0], box["size"][2]]) == pytest.approx([2.0, 8.0])
+    assert box["size"][1] == pytest.approx(2.0)
+    assert box["center"] == pytest.approx([10.0, 1.0, -5.0])
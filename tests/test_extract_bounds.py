@@ -0,0 +1,40 @@
+import json
+import os
+
+from parsers import extract_bounds
+
+
+def find_dae(dae_path):
+    stat = os.stat(dae_path)
+    return {"Output/model.dae": (dae_path, stat.st_mtime_ns, stat.st_size)}
+
+
+def test_cut_last_line_does_not_swallow_the_next_record(tmp_path, dae_path, monkeypatch):
+    monkeypatch.setattr(extract_bounds, "WORKERS", 1)
+    cache_path = str(tmp_path / "bounds_cache.jsonl")
+    with open(cache_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"relative_path": "Output/other.dae", "mtime_ns": 1, "file_size": 1, "size": [1, 1, 1]}) + "\n")
+        # Killed in the middle of a record
+        f.write('{"relative_path": "Output/cut.dae", "mtime')
+
+    dae_files = find_dae(dae_path)
+    cache = extract_bounds.load_cache(cache_path)
+    assert list(cache) == ["Output/other.dae"]
+    extract_bounds.update_cache(dae_files, cache, cache_path)
+
+    reloaded = extract_bounds.load_cache(cache_path)
+    assert reloaded["Output/model.dae"]["size"] == [3.0, 5.0, 4.0]
+    assert extract_bounds.is_cached(reloaded["Output/model.dae"], *dae_files["Output/model.dae"][1:])
+
+
+def test_end_with_newline(tmp_path):
+    path = str(tmp_path / "cache.jsonl")
+    extract_bounds.end_with_newline(path)
+    assert not os.path.exists(path)
+
+    for content, expected in ((b"", b""), (b"{}\n", b"{}\n"), (b"{}\n{", b"{}\n{\n")):
+        with open(path, "wb") as f:
+            f.write(content)
+        extract_bounds.end_with_newline(path)
+        with open(path, "rb") as f:
+            assert f.read() == expected
@@ -0,0 +1,103 @@
+import json
+
+import numpy as np
+import pytest
+
+from parsers.extract_points_dungeon import SCALE, get_points_dungeon, walk_document
+
+ROOM = [[0.0, 0.0], [100.0, 0.0], [100.0, 50.0], [0.0, 0.0]]
+PILLAR = [[40.0, 10.0], [60.0, 10.0], [50.0, 30.0], [40.0, 10.0]]
+CORRIDOR = [[100.0, 25.0], [180.0, 25.0]]
+
+DOCUMENT = {
+    "version": 2,
+    "state": {
+        "document": {
+            "nodes": {
+                "page": {
+                    "children": [
+                        {
+                            "type": "GEOMETRY",
+                            "geometry": {
+                                # A room with a hole, then a single outline
+                                "polygons": [[ROOM, PILLAR], [[[200.0, 0.0], [250.0, 0.0], [250.0, 40.0], [200.0, 0.0]]]],
+                                "polylines": [CORRIDOR],
+                            },
+                        },
+                        {"type": "GEOMETRY", "geometry": {"polygons": [[[[9.0, 9.0], [8.0, 8.0]]]], "polylines": []}},
+                    ],
+                },
+                "assets": {
+                    "library": [
+                        {"id": "asset-crate", "name": "CONT_Crate_A", "dimensions": {"width": 64, "height": 64}},
+                        {"id": "asset-barrel", "name": "CONT_Barrel_A", "dimensions": {"width": 32, "height": 32}},
+                    ],
+                },
+                "layers": [
+                    {
+                        "images": [
+                            {"name": "crate {1}", "assetId": "asset-crate", "transform": [1, 0, 0, 1, 90.0, 45.0]},
+                            {"assetId": "asset-barrel", "transform": [0.0, 2.0, -2.0, 0.0, -18.0, 36.0]},
+                        ],
+                        "nested": [{"deeper": {"name": "lost", "assetId": "asset-unknown", "transform": [1, 0, 0, 1, 0, 0]}}],
+                    },
+                ],
+            },
+        },
+    },
+}
+
+
+@pytest.fixture
+def dungeon_path(tmp_path):
+    path = tmp_path / "dungeon.ds"
+    path.write_text(json.dumps(DOCUMENT), encoding="utf-8")
+    return str(path)
+
+
+def scaled(points):
+    return np.asarray(points) * [SCALE, -SCALE]
+
+
+def test_polygons_and_polylines_are_scaled_arrays(dungeon_path):
+    polygons, polylines, _ = get_points_dungeon(dungeon_path)
+
+    # Only the first geometry of the document is read
+    assert len(polygons) == 2
+    assert [len(polygon) for polygon in polygons] == [2, 1]
+    np.testing.assert_allclose(polygons[0][0], scaled(ROOM))
+    np.testing.assert_allclose(polygons[0][1], scaled(PILLAR))
+    assert polygons[1][0].shape == (4, 2)
+    assert len(polylines) == 1
+    np.testing.assert_allclose(polylines[0], scaled(CORRIDOR))
+
+
+def test_placed_images_become_asset_instances(dungeon_path):
+    _, _, assets = get_points_dungeon(dungeon_path)
+
+    # The image of an unknown asset is dropped
+    assert len(assets) == 2
+    assert assets.asset_ids == ["asset-crate", "asset-barrel"]
+    assert assets.names == ["CONT_Crate_A", "CONT_Barrel_A"]
+    assert assets.nicknames == ["crate {1}", ""]
+    np.testing.assert_allclose(assets.positions, [[90.0 * SCALE, 0.0, -45.0 * SCALE], [-18.0 * SCALE, 0.0, -36.0 * SCALE]])
+    np.testing.assert_allclose(assets.angles, [0.0, np.pi / 2])
+    np.testing.assert_allclose(assets.scales, [1.0, 2.0])
+
+
+def test_walk_keeps_document_order():
+    geometries, asset_names, images = walk_document(DOCUMENT)
+
+    assert [len(geometry["polygons"]) for geometry in geometries] == [2, 1]
+    assert asset_names == {"asset-crate": "CONT_Crate_A", "asset-barrel": "CONT_Barrel_A"}
+    assert [image["assetId"] for image in images] == ["asset-crate", "asset-barrel", "asset-unknown"]
+
+
+def test_document_without_geometry(tmp_path):
+    path = tmp_path / "empty.ds"
+    path.write_text(json.dumps({"state": {"document": {"nodes": {}}}}), encoding="utf-8")
+
+    polygons, polylines, assets = get_points_dungeon(str(path))
+
+    assert polygons == [] and polylines == [] and len(assets) == 0
+    assert assets.positions.shape == (0, 3)
@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+
+import instrumentation
+from instrumentation import Stats, profiled_stages
+
+
+def test_nested_stages_are_reported_as_paths():
+    stats = Stats(profile="0")
+    with stats.stage("build"):
+        with stats.stage("walls"):
+            pass
+        with stats.stage("walls"):
+            pass
+    with stats.stage("walls"):
+        pass
+
+    assert set(stats.stages) == {"build", "build/walls", "walls"}
+    assert stats.stages["build/walls"]["calls"] == 2
+    assert stats.stages["walls"]["calls"] == 1
+    assert stats.stages["build"]["seconds"] >= stats.stages["build/walls"]["seconds"]
+
+
+def test_every_thread_has_its_own_stage_stack():
+    stats = Stats(profile="0")
+    with stats.stage("main"):
+        # The worker stage is opened in another thread, it does not nest under main
+        def work():
+            with stats.stage("worker"):
+                pass
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    assert set(stats.stages) == {"main", "worker"}
+
+
+def test_counters_add_up():
+    stats = Stats(profile="0")
+    assert stats.count("objects") == 1
+    assert stats.count("objects", 4) == 5
+    assert stats.count("rejected", 0) == 0
+    assert stats.report()["counters"] == {"objects": 5, "rejected": 0}
+
+
+def test_progress_is_rate_limited(monkeypatch, capsys):
+    now = [100.0]
+    monkeypatch.setattr(instrumentation.time, "perf_counter", lambda: now[0])
+    stats = Stats(progress_interval=1.0, profile="0")
+
+    now[0] += 1.0
+    assert stats.progress("objects", 1)
+    now[0] += 0.5
+    assert not stats.progress("objects", 2)
+    # Every label has its own interval, force ignores it
+    assert stats.progress("tiles", 2)
+    assert stats.progress("objects", 3, force=True)
+    now[0] += 1.0
+    assert stats.progress("objects", 4, total=10)
+
+    assert capsys.readouterr().out.splitlines() == [
+        "objects: 1 (1/s)",
+        "tiles: 2 (1/s)",
+        "objects: 3 (2/s)",
+        "objects: 4/10 (2/s)",
+    ]
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    ("", None),
+    ("0", None),
+    ("off", None),
+    ("1", set()),
+    ("all", set()),
+    ("build_walls", {"build_walls"}),
+    ("build_walls, parse_dungeon", {"build_walls", "parse_dungeon"}),
+])
+def test_profiled_stages(value, expected):
+    assert profiled_stages(value) == expected
+
+
+def test_profile_is_read_from_the_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv(instrumentation.PROFILE_ENV, "walls")
+    monkeypatch.setenv(instrumentation.PROFILE_DIR_ENV, str(tmp_path))
+    stats = Stats()
+    with stats.stage("build"):
+        with stats.stage("walls"):
+            pass
+
+    assert stats.profile == {"walls"}
+    assert stats.profiles == [str(tmp_path / "build__walls_0.prof")]
+    assert (tmp_path / "build__walls_0.prof").exists()
+
+
+def test_failed_profile_dump_does_not_stop_profiling(monkeypatch, tmp_path):
+    stats = Stats(profile="1", profile_dir=str(tmp_path))
+
+    def fail(frame):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(stats, "_dump_profile", fail)
+    with pytest.raises(OSError):
+        with stats.stage("first"):
+            pass
+    monkeypatch.undo()
+
+    with stats.stage("second"):
+        pass
+    assert stats.profiles == [str(tmp_path / "second_0.prof")]
@@ -0,0 +1,91 @@
+import json
+import re
+
+from parsers.parser_data_unpacked import GroupedJsonWriter, iter_game_objects
+
+LSX = """<?xml version="1.0" encoding="utf-8"?>
+<save>
+    <version major="4" minor="0" revision="9" build="330" />
+    <region id="Templates">
+        <node id="Templates">
+            <children>
+                <node id="GameObjects">
+                    <attribute id="MapKey" type="FixedString" value="11111111-1111-1111-1111-111111111111" />
+                    <attribute id="Name" type="LSString" value="WALL_City_Lower_A" />
+                    <attribute id="Type" type="FixedString" value="scenery" />
+                </node>
+                <node id="GameObjects">
+                    <attribute id="Type" type="FixedString" value="item" />
+                    <attribute id="Name" type="LSString" value="CONT_Chest_A" />
+                    <attribute id="Flag" type="int32" value="1" />
+                    <attribute id="MapKey" type="FixedString" value="22222222-2222-2222-2222-222222222222" />
+                </node>
+                <node id="GameObjects">
+                    <attribute id="MapKey" type="FixedString" value="33333333-3333-3333-3333-333333333333" />
+                    <attribute id="Name" type="LSString" value="Without_Type" />
+                    <children>
+                        <node id="LayerData">
+                            <attribute id="Name" type="LSString" value="Nested_Name" />
+                            <attribute id="Type" type="FixedString" value="nested" />
+                        </node>
+                    </children>
+                </node>
+                <node id="GameObjects">
+                    <attribute id="Name" type="LSString" value="WALL_City_Upper_A" />
+                    <attribute id="MapKey" type="FixedString" value="44444444-4444-4444-4444-444444444444" />
+                    <children>
+                        <node id="Transform">
+                            <attribute id="Name" type="LSString" value="Transform_Name" />
+                        </node>
+                    </children>
+                    <attribute id="Type" type="FixedString" value="scenery" />
+                </node>
+            </children>
+        </node>
+    </region>
+</save>
+"""
+
+EXPECTED = [
+    ("scenery", "WALL_City_Lower_A", "11111111-1111-1111-1111-111111111111"),
+    ("item", "CONT_Chest_A", "22222222-2222-2222-2222-222222222222"),
+    ("scenery", "WALL_City_Upper_A", "44444444-4444-4444-4444-444444444444"),
+]
+
+# What the parser used before: a regex over the whole text
+OLD_PATTERN = re.compile(
+    r'<attribute id="MapKey".*?value="([0-9a-fA-F-]{36})"[.\s\S]*?'
+    r'<attribute id="Name".*?value="(.*?)"[.\s\S]*?'
+    r'<attribute id="Type".*?value="(.*?)"'
+)
+
+
+def test_every_game_object_keeps_its_own_attributes(tmp_path):
+    path = tmp_path / "templates.lsx"
+    path.write_text(LSX, encoding="utf-8")
+
+    assert list(iter_game_objects(str(path))) == EXPECTED
+
+
+def test_old_regex_mixed_up_the_nodes():
+    old = [(m.group(3), m.group(2), m.group(1)) for m in OLD_PATTERN.finditer(LSX)]
+    assert old != EXPECTED
+    # The MapKey of the chest went with the Name of the next node and the Type of a nested one
+    assert ("nested", "Without_Type", "22222222-2222-2222-2222-222222222222") in old
+
+
+def test_grouped_json_matches_json_dump(tmp_path):
+    writer = GroupedJsonWriter(str(tmp_path))
+    for type_object, name, uuid in EXPECTED:
+        writer.add(type_object, {"name": name, "uuid": uuid})
+    writer.close()
+
+    grouped = {
+        "scenery": [{"name": name, "uuid": uuid} for type_object, name, uuid in EXPECTED if type_object == "scenery"],
+        "item": [{"name": "CONT_Chest_A", "uuid": "22222222-2222-2222-2222-222222222222"}],
+    }
+    assert writer.counts == {"scenery": 2, "item": 1}
+    for type_object, entries in grouped.items():
+        text = (tmp_path / f"{type_object}.json").read_text(encoding="utf-8")
+        assert json.loads(text) == entries
+        assert text == json.dumps(entries, indent=4, ensure_ascii=False)
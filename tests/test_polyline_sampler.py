@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+import polyline_sampler
+
+
+def xz(batch):
+    return batch.positions[:, [0, 2]]
+
+
+def piece_ends(batch, spacing):
+    """Both ends of every piece, `spacing` long and centred on its sample"""
+    radians = np.radians(batch.angles)
+    half = spacing / 2.0 * np.column_stack((np.cos(radians), np.sin(radians)))
+    return xz(batch) - half, xz(batch) + half
+
+
+def test_length_not_a_multiple_of_the_spacing():
+    batch = polyline_sampler.resample_polylines([[(0, 0), (10, 0)]], 4.0)
+    assert xz(batch)[:, 0].tolist() == [2.0, 5.0, 8.0]
+    # The first piece starts on the start of the line and the last one ends on its end
+    starts, ends = piece_ends(batch, 4.0)
+    assert starts[0] == pytest.approx([0.0, 0.0])
+    assert ends[-1] == pytest.approx([10.0, 0.0])
+    assert batch.corner.tolist() == [True, False, False]
+    assert batch.starts[0].tolist() == [0.0, 0.0, 0.0]
+
+
+def test_exact_multiple_has_no_overlap():
+    batch = polyline_sampler.resample_polylines([[(0, 0), (8, 0)]], 4.0)
+    assert xz(batch)[:, 0].tolist() == [2.0, 6.0]
+
+
+def test_short_run_gets_one_centred_piece():
+    batch = polyline_sampler.resample_polylines([[(0, 0), (3, 0)]], 4.0)
+    assert xz(batch).tolist() == [[1.5, 0.0]]
+    assert batch.starts[:, [0, 2]].tolist() == [[0.0, 0.0]]
+
+
+def test_sharp_corner_restarts_the_pieces():
+    batch = polyline_sampler.resample_polylines([[(0, 0), (10, 0), (10, 6)]], 4.0)
+    assert xz(batch).tolist() == [[2, 0], [5, 0], [8, 0], [10, 2], [10, 4]]
+    assert batch.corner.tolist() == [True, False, False, True, False]
+    assert batch.angles.tolist() == [0.0, 0.0, 0.0, 90.0, 90.0]
+    assert batch.starts[batch.corner][:, [0, 2]].tolist() == [[0, 0], [10, 0]]
+
+
+def test_gentle_vertex_keeps_the_spacing():
+    batch = polyline_sampler.resample_polylines([[(0, 0), (3, 0), (6, 0.1)]], 2.0, corner_angle=30.0)
+    assert batch.corner.sum() == 1
+    # Samples are measured along the outline, across the vertex at x = 3
+    length = 3.0 + np.hypot(3.0, 0.1)
+    stride = (length - 2.0) / (len(batch) - 1)
+    assert xz(batch)[0] == pytest.approx([1.0, 0.0])
+    assert xz(batch)[2][0] == pytest.approx(3.0 + (1.0 + 2 * stride - 3.0) / np.hypot(1.0, 0.1 / 3.0))
+
+
+def test_closed_square_pieces_stay_on_their_side():
+    # Starts in the middle of a side: the closing vertex is not a corner, (0, 0) is
+    square = [(5, 0), (10, 0), (10, 10), (0, 10), (0, 0), (5, 0)]
+    batch = polyline_sampler.resample_polylines([square], 4.0)
+
+    corners = {tuple(point) for point in batch.starts[batch.corner][:, [0, 2]].tolist()}
+    assert corners == {(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)}
+    assert len(batch) == 12
+    # Nothing sticks out of the square, every side is covered from corner to corner
+    starts, ends = piece_ends(batch, 4.0)
+    assert np.all(starts >= -1e-9) and np.all(starts <= 10.0 + 1e-9)
+    assert np.all(ends >= -1e-9) and np.all(ends <= 10.0 + 1e-9)
+    run = np.cumsum(batch.corner) - 1
+    for side in range(4):
+        assert {tuple(np.round(point, 9)) for point in (starts[run == side][0], ends[run == side][-1])} <= corners
+
+
+def test_polylines_are_kept_apart():
+    batch = polyline_sampler.resample_polylines([[(0, 0), (4, 0)], [(0, 5)], [(0, 10), (2, 10)]], 4.0, y=1.5)
+    assert batch.polyline.tolist() == [0, 2]
+    assert batch.corner.tolist() == [True, True]
+    assert batch.positions[:, 1].tolist() == [1.5, 1.5]
+    assert len(polyline_sampler.resample_polylines([], 4.0)) == 0
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+import polyline_simplify
+
+
+def distance_to_polyline(points, line):
+    """Distance of every point to the closest segment of line"""
+    distances = []
+    for point in points:
+        best = np.inf
+        for a, b in zip(line[:-1], line[1:]):
+            ab = b - a
+            t = np.clip((point - a) @ ab / (ab @ ab), 0.0, 1.0)
+            best = min(best, np.hypot(*(point - (a + t * ab))))
+        distances.append(best)
+    return np.array(distances)
+
+
+def test_collinear_vertices_are_removed():
+    line = np.column_stack((np.linspace(0, 20, 21), np.zeros(21)))
+    assert polyline_simplify.simplify_line(line, 0.1).tolist() == [[0, 0], [20, 0]]
+
+
+def test_removed_vertices_stay_within_the_tolerance():
+    rng = np.random.default_rng(4)
+    x = np.linspace(0, 50, 200)
+    line = np.column_stack((x, np.sin(x / 5) * 3 + rng.normal(0, 0.05, len(x))))
+
+    simplified = polyline_simplify.simplify_line(line, 0.2)
+    assert len(simplified) < len(line) // 4
+    assert simplified[0].tolist() == line[0].tolist() and simplified[-1].tolist() == line[-1].tolist()
+    assert distance_to_polyline(line, simplified).max() <= 0.2 + 1e-9
+
+
+def test_room_keeps_only_its_corners():
+    side = np.linspace(0, 12, 13)[:-1]
+    zeros, twelves = np.zeros_like(side), np.full_like(side, 12.0)
+    room = np.vstack((
+        np.column_stack((side, zeros)),
+        np.column_stack((twelves, side)),
+        np.column_stack((12 - side, twelves)),
+        np.column_stack((zeros, 12 - side)),
+        [(0.0, 0.0)],
+    ))
+    room[1:-1] += np.random.default_rng(1).normal(0, 0.02, (len(room) - 2, 2))
+
+    simplified = polyline_simplify.simplify_line(room, 0.25)
+    assert np.round(simplified).tolist() == [[0, 0], [12, 0], [12, 12], [0, 12], [0, 0]]
+
+
+def test_jitter_does_not_count_as_a_corner():
+    line = np.array([(0, 0), (5, 0), (5.05, 0.05), (5.1, 0), (10, 0)])
+    assert polyline_simplify.simplify_line(line, 0.1).tolist() == [[0, 0], [10, 0]]
+
+
+def test_turn_angles():
+    assert polyline_simplify.turn_angles(np.array([(0, 0), (1, 0), (1, 1), (1, 1), (2, 1)], dtype=float)) == pytest.approx([90, 0, 0])
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+import scatter
+from asset_catalog import ModelData
+
+
+def pair_gaps(positions, radii):
+    """Distance minus the sum of both radii for every pair of samples"""
+    delta = positions[:, np.newaxis, :] - positions[np.newaxis, :, :]
+    distance = np.hypot(delta[..., 0], delta[..., 1])
+    gap = distance - (radii[:, np.newaxis] + radii[np.newaxis, :])
+    return gap[np.triu_indices(len(positions), 1)]
+
+
+def square(x0, z0, x1, z1):
+    return [(x0, z0), (x1, z0), (x1, z1), (x0, z1), (x0, z0)]
+
+
+def test_minimum_distance_with_one_radius():
+    region = scatter.Region.from_polygons([[square(0, 0, 40, 40)]])
+    positions, assets = scatter.poisson_disk(region, [0.5], rng=np.random.default_rng(0))
+
+    assert len(positions) > 300
+    assert pair_gaps(positions, np.full(len(positions), 0.5)).min() >= -1e-9
+
+
+def test_minimum_distance_with_mixed_radii():
+    region = scatter.Region.from_polygons([[square(0, 0, 24, 16)]])
+    radii = np.array([0.3, 1.0, 2.5])
+    positions, assets = scatter.poisson_disk(region, radii, weights=[3, 2, 1], rng=np.random.default_rng(1))
+
+    assert set(assets.tolist()) == {0, 1, 2}
+    assert pair_gaps(positions, radii[assets]).min() >= -1e-9
+
+
+def test_samples_stay_inside_the_region():
+    # A room with a hole: even-odd rule
+    region = scatter.Region.from_polygons([[square(0, 0, 20, 20), square(5, 5, 15, 15)]], resolution=0.1)
+    positions, _ = scatter.poisson_disk(region, [0.4], rng=np.random.default_rng(2))
+
+    assert len(positions) > 0
+    x, z = positions[:, 0], positions[:, 1]
+    assert np.all((x >= 0) & (x <= 20) & (z >= 0) & (z <= 20))
+    # Cells are 0.1 m, a sample may sit that close to the edge of the hole
+    assert not np.any((x > 5.1) & (x < 14.9) & (z > 5.1) & (z < 14.9))
+
+
+def test_same_seed_gives_the_same_scatter():
+    region = scatter.Region.from_terrain(np.zeros((33, 33), dtype=np.float32) + 2.0)
+    assets = [ModelData("uuid-a", [1.0, 1.0, 1.0], [0, 0, 0]), ModelData("uuid-b", [2.0, 2.0, 2.0], [0, 0, 0])]
+
+    first = scatter.scatter(region, assets, seed=7, max_samples=50)
+    second = scatter.scatter(region, assets, seed=7, max_samples=50)
+    assert len(first) == 50
+    assert np.array_equal(first.positions, second.positions)
+    assert np.all(first.positions[:, 1] == pytest.approx(2.0))
+
+    placements = scatter.scatter_placements(first, assets)
+    assert {placement.uuid for placement in placements} <= {"uuid-a", "uuid-b"}
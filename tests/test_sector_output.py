@@ -0,0 +1,88 @@
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+from pyrr import Quaternion, Vector3
+
+import sector_output
+from asset_catalog import AssetCatalog
+from corridor_generator import Placement
+from generation_context import GenerationContext
+from sector_output import SectorWriter
+
+
+def placement(x, z, name="WALL_A"):
+    return Placement(name, "17c5529a-a991-415d-9478-52c29dfbaf06", Vector3([x, 0.0, z]), Quaternion(), 1.0)
+
+
+def game_objects(folder):
+    """Attributes of every GameObjects node of the .lsx files of folder"""
+    objects = []
+    for filename in sorted(os.listdir(folder)):
+        if not filename.endswith(".lsx"):
+            continue
+        for node in ET.parse(os.path.join(folder, filename)).iter("node"):
+            if node.get("id") == "GameObjects":
+                attributes = {a.get("id"): a.get("value") for a in node.findall("attribute")}
+                attributes["Layer"] = node.find(".//node[@id='Object']/attribute").get("value")
+                attributes["file"] = filename
+                objects.append(attributes)
+    return objects
+
+
+@pytest.mark.parametrize("sector_size", [None, 64.0])
+def test_level_name_of_the_context_is_written(tmp_path, sector_size):
+    sink = SectorWriter(str(tmp_path), sector_size) if sector_size else None
+    context = GenerationContext(str(tmp_path), seed=1, catalog=AssetCatalog(), level_name="my_level", sink=sink)
+    context.emit_all([placement(1.0, 2.0), placement(100.0, 2.0)])
+    context.close()
+
+    objects = game_objects(str(tmp_path))
+    assert len(objects) == 2
+    # LevelName and the layer MapKey both carry the level name
+    assert {o["LevelName"] for o in objects} == {"my_level"}
+    assert {o["Layer"] for o in objects} == {"my_level"}
+    assert len({o["MapKey"] for o in objects}) == 2
+    assert sorted(o["Name"] for o in objects) == ["WALL_A", "WALL_A_000"]
+
+
+def test_writer_level_name_is_the_fallback(tmp_path):
+    writer = SectorWriter(str(tmp_path), level_name="writer_level")
+    writer.add(placement(1.0, 1.0), "key-1", "A")
+    writer.add(placement(2.0, 2.0), "key-2", "B", "object_level")
+    writer.write()
+    assert {o["Name"]: o["LevelName"] for o in game_objects(str(tmp_path))} == {"A": "writer_level", "B": "object_level"}
+
+
+def test_objects_are_partitioned_by_sector(tmp_path):
+    writer = SectorWriter(str(tmp_path), size=64.0, origin=(-32.0, 0.0))
+    points = {"a": (-32.0, 0.0), "b": (31.9, 63.9), "c": (32.0, 0.0), "d": (-32.1, -0.1), "e": (100.0, 200.0)}
+    for name, (x, z) in points.items():
+        writer.add(placement(x, z), f"key-{name}", name)
+    index = writer.write()
+
+    sectors = {tuple(entry["sector"]): entry for entry in index["sectors"]}
+    assert set(sectors) == {(0, 0), (1, 0), (-1, -1), (2, 3)}
+    assert sectors[(0, 0)]["objects"] == 2
+    assert sectors[(1, 0)]["bounds"] == [32.0, 0.0, 96.0, 64.0]
+    assert sector_output.load_index(str(tmp_path)) == index
+
+    by_file = {}
+    for o in game_objects(str(tmp_path)):
+        by_file.setdefault(o["file"], set()).add(o["Name"])
+    assert by_file == {
+        "AUTO_SECTOR_0_0.lsx": {"a", "b"},
+        "AUTO_SECTOR_1_0.lsx": {"c"},
+        "AUTO_SECTOR_-1_-1.lsx": {"d"},
+        "AUTO_SECTOR_2_3.lsx": {"e"},
+    }
+
+
+def test_only_some_sectors_are_rewritten(tmp_path):
+    writer = SectorWriter(str(tmp_path))
+    writer.add(placement(1.0, 1.0), "key-a", "a")
+    writer.add(placement(70.0, 1.0), "key-b", "b")
+    index = writer.write(only={(1, 0)})
+
+    assert sorted(os.listdir(tmp_path)) == ["AUTO_SECTOR_1_0.lsx", sector_output.SECTOR_INDEX_FILENAME]
+    assert [entry["objects"] for entry in index["sectors"]] == [1, 1]
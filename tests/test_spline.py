@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+import corridor_generator
+import spline
+from asset_catalog import AssetCatalog
+from collision_grid import CollisionGrid
+from generation_context import GenerationContext
+from polyline_sampler import resample_polylines
+
+WALL_UUID = "0f6a3c56-58c2-4c55-9a0e-1f1c3a7a2b11"
+
+
+def test_straight_curve_gives_the_pieces_of_the_polyline():
+    points = [(0.0, 0.0), (10.0, 0.0)]
+
+    curved = spline.sample_curves([spline.CatmullRom(points)], 3.0)
+    straight = resample_polylines([points], 3.0)
+
+    np.testing.assert_allclose(curved.positions, straight.positions, atol=1e-9)
+    np.testing.assert_allclose(curved.starts, straight.starts, atol=1e-9)
+    np.testing.assert_allclose(curved.angles, straight.angles, atol=1e-9)
+    assert curved.corner.tolist() == straight.corner.tolist()
+
+
+@pytest.mark.parametrize("closed", [False, True])
+def test_pieces_run_from_the_start_to_the_end_of_the_curve(closed):
+    curve = spline.CatmullRom([(0.0, 0.0), (6.0, 2.0), (9.0, 8.0), (2.0, 7.0)], closed=closed)
+    spacing = 2.5
+
+    batch = spline.sample_curves([curve], spacing)
+
+    count = int(np.ceil(curve.length / spacing))
+    centres = spacing / 2.0 + np.arange(count) * (curve.length - spacing) / (count - 1)
+    assert len(batch) == count
+    np.testing.assert_allclose(batch.positions[:, [0, 2]], curve.at(centres).positions, atol=1e-9)
+    np.testing.assert_allclose(batch.starts[0, [0, 2]], (0.0, 0.0), atol=1e-9)
+
+
+def test_closed_curve_under_reject_collision_keeps_every_piece(tmp_path):
+    catalog = AssetCatalog()
+    catalog.add({"name": "WALL", "size": [2.5, 4.5, 0.5], "center_offset": [0.0, 0.0, 0.0], "uuid": WALL_UUID})
+    context = GenerationContext(str(tmp_path), seed=1, catalog=catalog, collision=CollisionGrid())
+    curve = spline.CatmullRom([(0.0, 0.0), (12.0, 1.0), (14.0, 10.0), (3.0, 12.0)], closed=True)
+
+    batch = spline.sample_curves([curve], 2.5)
+    links = [corridor_generator.ChainLink("curve", index, len(batch), True) for index in range(len(batch))]
+    context.emit_all(corridor_generator.batch_placements(WALL_UUID, batch.positions, batch.angles, links=links))
+
+    assert context.rejected == 0
+    assert len(context.collision) == len(batch)
+
+
+def test_arc_length_is_uniform():
+    curve = spline.CatmullRom([(0.0, 0.0), (4.0, 6.0), (10.0, 6.0), (14.0, 0.0)])
+
+    samples = curve.sample(0.5)
+
+    chords = np.linalg.norm(np.diff(samples.positions, axis=0), axis=1)
+    # Chords are a little shorter than the arc they span on the bends
+    np.testing.assert_allclose(chords, 0.5, rtol=5e-3)
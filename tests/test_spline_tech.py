@@ -0,0 +1,125 @@
+from spline_tech import iter_construction, parse_construction_file
+
+CONSTRUCTION = """<?xml version="1.0" encoding="utf-8"?>
+<save>
+    <version major="4" minor="8" revision="0" build="10" />
+    <region id="TileConstruction">
+        <node id="TileConstruction">
+            <children>
+                <node id="ConstructionSpline">
+                    <attribute id="MapKey" type="FixedString" value="spline" />
+                    <children>
+                        <node id="ConstructionPoints">
+                            <children>
+                                <node id="ConstructionPoint">
+                                    <attribute id="ConstructionPointStretch" type="bool" value="True" />
+                                    <attribute id="ConstructionPointId" type="guid" value="a" />
+                                    <attribute id="ConstructionHelperPoint" type="bool" value="False" />
+                                    <children>
+                                        <node id="ConstructionPointTransform">
+                                            <attribute id="Position" type="fvec3" value="0 0 0" />
+                                        </node>
+                                    </children>
+                                </node>
+                                <node id="ConstructionPoint">
+                                    <attribute id="ConstructionPointId" type="guid" value="b" />
+                                    <attribute id="ConstructionPointStretch" type="bool" value="False" />
+                                    <attribute id="ConstructionHelperPoint" type="bool" value="True" />
+                                    <children>
+                                        <node id="ConstructionPointTransform">
+                                            <attribute id="Position" type="fvec3" value="0 0 1" />
+                                        </node>
+                                    </children>
+                                </node>
+                                <node id="ConstructionPoint">
+                                    <attribute id="ConstructionPointId" type="guid" value="c" />
+                                    <attribute id="ConstructionPointStretch" type="bool" value="True" />
+                                    <children>
+                                        <node id="ConstructionPointTransform">
+                                            <attribute id="Position" type="fvec3" value="8 0 0" />
+                                        </node>
+                                    </children>
+                                </node>
+                            </children>
+                        </node>
+                        <node id="ConstructionLine">
+                            <children>
+                                <node id="ConstructionPoints">
+                                    <children>
+                                        <node id="ConstructionPoint">
+                                            <attribute id="ConstructionPointId" type="guid" value="a" />
+                                        </node>
+                                        <node id="ConstructionPoint">
+                                            <attribute id="ConstructionPointId" type="guid" value="c" />
+                                        </node>
+                                    </children>
+                                </node>
+                                <node id="Tiles">
+                                    <children>
+                                        <node id="tile">
+                                            <attribute id="QRotate" type="fvec4" value="0 0.7071 0 0.7071" />
+                                            <attribute id="Stretchable" type="bool" value="False" />
+                                            <attribute id="Translate" type="fvec3" value="0 0 0" />
+                                            <attribute id="UUID" type="guid" value="tile-1" />
+                                        </node>
+                                        <node id="tile">
+                                            <attribute id="UUID" type="guid" value="tile-2" />
+                                            <attribute id="Translate" type="fvec3" value="4 0 0" />
+                                            <attribute id="Stretchable" type="bool" value="True" />
+                                            <attribute id="QRotate" type="fvec4" value="0 0.7071 0 0.7071" />
+                                        </node>
+                                    </children>
+                                </node>
+                            </children>
+                        </node>
+                        <node id="ConstructionLine">
+                            <children>
+                                <node id="ConstructionPoints">
+                                    <children>
+                                        <node id="ConstructionPoint">
+                                            <attribute id="ConstructionPointId" type="guid" value="line-only" />
+                                        </node>
+                                        <node id="ConstructionPoint">
+                                            <attribute id="ConstructionPointId" type="guid" value="a" />
+                                        </node>
+                                    </children>
+                                </node>
+                            </children>
+                        </node>
+                    </children>
+                </node>
+            </children>
+        </node>
+    </region>
+</save>
+"""
+
+
+def write_construction(tmp_path):
+    path = tmp_path / "construction.lsx"
+    path.write_text(CONSTRUCTION, encoding="utf-8")
+    return str(path)
+
+
+def test_spline_points_lines_and_tiles(tmp_path):
+    points, paths, tiles = parse_construction_file(write_construction(tmp_path))
+
+    assert points == {
+        "a": {"position": "0 0 0", "stretch": True, "helper": False},
+        "b": {"position": "0 0 1", "stretch": False, "helper": True},
+        "c": {"position": "8 0 0", "stretch": True, "helper": False},
+    }
+    assert paths == [["a", "c"], ["line-only", "a"]]
+    assert tiles == [
+        {"uuid": "tile-1", "translate": "0 0 0", "rotate": "0 0.7071 0 0.7071", "stretchable": False},
+        {"uuid": "tile-2", "translate": "4 0 0", "rotate": "0 0.7071 0 0.7071", "stretchable": True},
+    ]
+
+
+def test_line_points_are_not_reported_as_spline_points(tmp_path):
+    events = list(iter_construction(write_construction(tmp_path)))
+
+    point_ids = [value[0] for kind, value in events if kind == "point"]
+    assert point_ids == ["a", "b", "c"]
+    # Tiles are yielded as they are read, their line once it is closed
+    assert [kind for kind, _ in events] == ["point"] * 3 + ["tile", "tile", "line", "line"]
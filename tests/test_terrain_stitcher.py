@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from terrain_stitcher import TerrainStitcher, split_grid
+
+
+def test_split_then_stitch_gives_the_grid_back(tmp_path):
+    rng = np.random.default_rng(0)
+    grid = rng.uniform(-50.0, 200.0, size=(2 * 9, 3 * 9)).astype(np.float32)
+
+    paths = split_grid(grid, str(tmp_path), "terrain", tile_rows=9, tile_cols=9)
+
+    assert len(paths) == 6
+    assert (tmp_path / "terrain_2_1.patch").exists()
+    np.testing.assert_array_equal(TerrainStitcher(str(tmp_path)).stitch(), grid)
+
+
+def test_tiles_do_not_have_to_be_square(tmp_path):
+    grid = np.arange(2 * 4 * 3 * 6, dtype=np.float32).reshape(2 * 4, 3 * 6)
+
+    split_grid(grid, str(tmp_path), "terrain", tile_rows=4, tile_cols=6)
+
+    np.testing.assert_array_equal(TerrainStitcher(str(tmp_path)).stitch(), grid)
+
+
+def test_grid_must_be_whole_tiles(tmp_path):
+    with pytest.raises(ValueError):
+        split_grid(np.zeros((10, 9), dtype=np.float32), str(tmp_path), "terrain", tile_rows=9, tile_cols=9)
@@ -0,0 +1,50 @@
+import numpy as np
+
+from create_tiles import (
+    CORNER_TILE_GUID, STRETCH_TILE_GUID, TILE_CORNER, ConstructionPoints, generate_tiles,
+)
+from spline_tech import parse_construction_file
+from tile_construction_lsx import write_tile_construction
+
+
+def construction():
+    points = ConstructionPoints(
+        ["a", "b", "c", "h"],
+        [(0.0, 0.0, 0.0), (10.0, 0.0, 0.0), (10.0, 0.0, 6.0), (0.0, 0.0, 1.0)],
+        [True, True, True, False],
+        [False, False, False, True],
+    )
+    # The single point path has no segment and gets no line
+    paths = [["a", "b", "c"], ["c"], ["c", "a"]]
+    return points, paths, generate_tiles(points, paths)
+
+
+def test_round_trip_through_iter_construction(tmp_path):
+    points, paths, tiles = construction()
+    path = write_tile_construction(str(tmp_path / "tiles.lsx"), points, paths, tiles, map_key="spline")
+
+    read_points, read_paths, read_tiles = parse_construction_file(path)
+
+    assert list(read_points) == points.ids
+    np.testing.assert_allclose(
+        [[float(v) for v in data["position"].split()] for data in read_points.values()], points.positions
+    )
+    assert [data["stretch"] for data in read_points.values()] == points.stretch.tolist()
+    assert [data["helper"] for data in read_points.values()] == points.helper.tolist()
+    assert read_paths == [["a", "b", "c"], ["c", "a"]]
+
+    assert len(read_tiles) == len(tiles)
+    np.testing.assert_allclose([[float(v) for v in t["translate"].split()] for t in read_tiles], tiles.positions)
+    np.testing.assert_allclose([[float(v) for v in t["rotate"].split()] for t in read_tiles], tiles.rotations)
+    assert [t["stretchable"] for t in read_tiles] == tiles.stretchable.tolist()
+
+
+def test_corner_and_stretch_tiles_keep_their_type(tmp_path):
+    points, paths, tiles = construction()
+    path = write_tile_construction(str(tmp_path / "tiles.lsx"), points, paths, tiles)
+
+    _, _, read_tiles = parse_construction_file(path)
+
+    expected = [CORNER_TILE_GUID if kind == TILE_CORNER else STRETCH_TILE_GUID for kind in tiles.kind.tolist()]
+    assert [t["uuid"] for t in read_tiles] == expected
+    assert {CORNER_TILE_GUID, STRETCH_TILE_GUID} <= set(expected)